@@ -0,0 +1,152 @@
+"""Tutor Conversation Sessions
+
+Streaming tutor answers over a bounded, token-budgeted context window
+"""
+
+import asyncio
+import math
+import re
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from ai.tutor import TutorRuntime
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (about four characters per token)"""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def extractive_summary(summary: str, turn: Dict[str, str], max_words: int = 30) -> str:
+    """
+    Fold one turn into a running summary by keeping its first sentence
+
+    Args:
+        summary: Summary so far
+        turn: Role/content dict being evicted from the window
+        max_words: Word limit for the kept sentence
+    """
+    sentence = re.split(r"(?<=[.!?])\s+", turn["content"].strip(), maxsplit=1)[0]
+    words = sentence.split()
+    if len(words) > max_words:
+        sentence = " ".join(words[:max_words]) + "..."
+
+    line = f"{turn['role']}: {sentence}"
+    return f"{summary}\n{line}" if summary else line
+
+
+class ConversationWindow:
+    """Recent turns kept within a token budget, older turns rolled into a summary
+
+    Token counts are tracked incrementally, so adding a turn costs O(1)
+    amortized and the prompt never grows beyond max_tokens + summary_tokens.
+    """
+
+    def __init__(self, max_tokens: int = 1500, summary_tokens: int = 300, min_turns: int = 2,
+                 summarizer: Callable[[str, Dict[str, str]], str] = extractive_summary):
+        self.max_tokens = max_tokens
+        self.summary_tokens = summary_tokens
+        self.min_turns = min_turns
+        self.summarizer = summarizer
+        self.turns = deque()
+        self.summary = ""
+        self.tokens = 0
+        self.total_turns = 0
+
+    def add(self, role: str, content: str):
+        """Append a turn and evict the oldest turns past the budget"""
+        turn = {"role": role, "content": content, "tokens": estimate_tokens(content)}
+        self.turns.append(turn)
+        self.tokens += turn["tokens"]
+        self.total_turns += 1
+
+        while self.tokens > self.max_tokens and len(self.turns) > self.min_turns:
+            evicted = self.turns.popleft()
+            self.tokens -= evicted["tokens"]
+            self.summary = self._trim_summary(self.summarizer(self.summary, evicted))
+
+    def _trim_summary(self, summary: str) -> str:
+        """Drop the oldest summary lines until it fits its budget"""
+        lines = summary.split("\n")
+        while len(lines) > 1 and estimate_tokens("\n".join(lines)) > self.summary_tokens:
+            lines.pop(0)
+        return "\n".join(lines)
+
+    def messages(self) -> List[Dict[str, str]]:
+        """Chat messages for the model: summary (if any) followed by recent turns"""
+        messages = []
+        if self.summary:
+            messages.append({"role": "system", "content": f"Summary of earlier conversation:\n{self.summary}"})
+        messages.extend({"role": turn["role"], "content": turn["content"]} for turn in self.turns)
+        return messages
+
+
+class TutorSession:
+    """One learner's conversation with the tutor, streamed asynchronously"""
+
+    def __init__(self, runtime: TutorRuntime, window: Optional[ConversationWindow] = None):
+        self.runtime = runtime
+        self.window = window or ConversationWindow()
+        self.last_agent = None
+
+    async def astream(self, question: str, agent: Optional[str] = None, snapshot_id: str = ""):
+        """
+        Stream the answer to a question
+
+        Standalone answers (no earlier turns or summary in the window) are cached
+        per agent, question, and snapshot, so a repeated opening question is
+        replayed from the cache without calling the model. Follow-ups depend on
+        the conversation and always go to the model.
+
+        Args:
+            question: User question
+            agent: Optional agent key overriding the router
+            snapshot_id: Version of the data the answer depends on
+
+        Yields:
+            Response text chunks
+        """
+        agent_key = agent or self.runtime.router.route(question)
+        self.last_agent = agent_key
+        facts, facts_snapshot = self.runtime.grounding(agent_key, question)
+        key = self.runtime.cache_key(agent_key, question, snapshot_id or facts_snapshot)
+
+        self.window.add("user", question)
+        standalone = len(self.window.turns) == 1 and not self.window.summary
+        cached = self.runtime.cache.get(key) if standalone else None
+
+        if cached is not None:
+            chunks = [cached]
+            yield cached
+        else:
+            chunks = []
+            system_prompt = self.runtime.agents[agent_key].system_prompt
+            messages = self.window.messages()
+            if facts:
+                messages.insert(len(messages) - 1, {"role": "system", "content": "\n".join(facts)})
+            async for chunk in self.runtime.backend.astream(system_prompt, messages):
+                chunks.append(chunk)
+                yield chunk
+            if standalone:
+                self.runtime.cache.put(key, "".join(chunks))
+
+        self.window.add("assistant", "".join(chunks))
+
+
+def iterate_sync(async_iterable):
+    """
+    Drive an async iterator from synchronous code (e.g. st.write_stream)
+
+    Runs on a private event loop so it works inside Streamlit's script thread.
+    """
+    loop = asyncio.new_event_loop()
+    iterator = async_iterable.__aiter__()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
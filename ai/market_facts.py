@@ -0,0 +1,225 @@
+"""Market Facts Index
+
+Precomputed per-ticker fact sheets for grounding tutor answers
+"""
+
+import re
+import threading
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from backtesting.engine import BacktestEngine
+from models.monte_carlo import monte_carlo_simulation
+
+TRADING_DAYS = 252
+
+# Column names that mean an OHLCV frame was passed where closes were expected
+OHLCV_COLUMNS = frozenset(["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+
+# Common words that are also tickers; lowercase mentions of these are not matched
+TICKER_STOPWORDS = frozenset("""
+    ALL AND ANY ARE BIG BEST BUY CAN CASH FOR FUN GOOD HAS HOME HOPE HOW KEY LIFE LOW
+    NEW NICE NOT NOW ONE OPEN OUT PAY PLAY REAL RUN SAFE SAVE SEE SO TEAM THE TRUE TWO
+    WELL WHAT WHO WHY WISH YOU
+""".split())
+
+
+def compute_fact_sheet(ticker: str, prices: pd.Series, risk_free_rate: float = 0.02,
+                       mc_days: int = 21, mc_simulations: int = 200) -> Dict:
+    """
+    Summary statistics for one ticker's price history
+
+    Args:
+        ticker: Stock ticker
+        prices: Daily closing prices
+        risk_free_rate: Annual risk-free rate for the Sharpe ratio
+        mc_days: Monte Carlo horizon in trading days
+        mc_simulations: Number of Monte Carlo paths
+
+    Returns:
+        Dictionary of fact sheet fields
+    """
+    prices = prices.dropna()
+    returns = prices.pct_change().dropna()
+    last_price = float(prices.iloc[-1])
+
+    def trailing_return(days):
+        if len(prices) <= days:
+            return float("nan")
+        return (last_price / float(prices.iloc[-days - 1]) - 1) * 100
+
+    volatility = float(returns.std() * np.sqrt(TRADING_DAYS))
+    annual_return = float(returns.mean() * TRADING_DAYS)
+    sharpe = (annual_return - risk_free_rate) / volatility if volatility > 0 else float("nan")
+    max_drawdown = float((prices / prices.cummax() - 1).min()) * 100
+
+    facts = {
+        "ticker": ticker,
+        "as_of": prices.index[-1].strftime("%Y-%m-%d"),
+        "last_price": last_price,
+        "return_1m": trailing_return(21),
+        "return_3m": trailing_return(63),
+        "return_1y": trailing_return(TRADING_DAYS),
+        "volatility": volatility * 100,
+        "sharpe_ratio": sharpe,
+        "max_drawdown": max_drawdown,
+        "ma_strategy_return": float("nan"),
+        "mc_p5_return": float("nan"),
+        "mc_horizon_days": mc_days,
+    }
+
+    if len(prices) > 50:
+        engine = BacktestEngine.from_data(ticker, pd.DataFrame({"Adj Close": prices}))
+        facts["ma_strategy_return"] = float(engine.run_backtest()["total_return"])
+
+    if mc_simulations and len(returns) > 1:
+        paths = monte_carlo_simulation(prices, days=mc_days, simulations=mc_simulations)
+        facts["mc_p5_return"] = float(np.percentile(paths[:, -1] / last_price - 1, 5) * 100)
+
+    return facts
+
+
+class MarketFactsIndex:
+    """In-memory fact sheets keyed by ticker
+
+    refresh() recomputes sheets only for tickers whose price history has
+    advanced past the indexed date, so a daily refresh touches just the new
+    data. Prompt filling is then a dictionary lookup.
+    """
+
+    SUMMARY_TEMPLATE = (
+        "Market facts for {ticker} (as of {as_of}): last price ${last_price:.2f}; "
+        "returns 1M {return_1m:.1f}%, 3M {return_3m:.1f}%, 1Y {return_1y:.1f}%; "
+        "annualized volatility {volatility:.1f}%; Sharpe {sharpe_ratio:.2f}; "
+        "max drawdown {max_drawdown:.1f}%; MA crossover backtest {ma_strategy_return:.1f}%; "
+        "Monte Carlo 5th percentile {mc_horizon_days}-day return {mc_p5_return:.1f}%."
+    )
+
+    def __init__(self, risk_free_rate: float = 0.02, mc_days: int = 21, mc_simulations: int = 200):
+        self.risk_free_rate = risk_free_rate
+        self.mc_days = mc_days
+        self.mc_simulations = mc_simulations
+        self.sheets = {}
+        self.summaries = {}
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def refresh(self, prices: pd.DataFrame) -> List[str]:
+        """
+        Recompute fact sheets for tickers with new data
+
+        Args:
+            prices: Daily closing prices, dates x tickers
+
+        Returns:
+            Tickers whose sheets were updated
+
+        Raises:
+            ValueError: If prices is an OHLCV frame rather than closes per ticker
+        """
+        if isinstance(prices.columns, pd.MultiIndex) or OHLCV_COLUMNS & set(prices.columns):
+            raise ValueError("Expected daily closes as dates x tickers, got OHLCV columns "
+                             f"{list(prices.columns)[:6]}")
+
+        updated = []
+        for ticker in prices.columns:
+            series = prices[ticker].dropna()
+            if series.empty:
+                continue
+
+            current = self.sheets.get(ticker)
+            if current is not None and current["as_of"] >= series.index[-1].strftime("%Y-%m-%d"):
+                continue
+
+            sheet = compute_fact_sheet(ticker, series, self.risk_free_rate, self.mc_days, self.mc_simulations)
+            with self._lock:
+                self.sheets[ticker] = sheet
+                self.summaries[ticker] = self.SUMMARY_TEMPLATE.format(**sheet)
+            updated.append(ticker)
+
+        if updated:
+            self.version += 1
+
+        return updated
+
+    def refresh_from_store(self, data_ingestion, filename: str) -> List[str]:
+        """Refresh from closing prices cached by DataIngestion"""
+        prices = data_ingestion.load_cached_data(filename)
+        if prices is None:
+            return []
+        return self.refresh(prices)
+
+    def refresh_from_ingestion(self, data_ingestion, tickers: Sequence[str], filename: str,
+                               lookback_days: int = 400) -> List[str]:
+        """
+        Download daily closes, cache them for refresh_from_store, and refresh
+
+        Falls back to the cached panel when the download returns nothing.
+
+        Args:
+            data_ingestion: DataIngestion instance
+            tickers: Ticker universe to index
+            filename: Cache file for the dates x tickers closing price panel
+            lookback_days: Calendar days of history to download
+
+        Returns:
+            Tickers whose sheets were updated
+        """
+        end = date.today()
+        data = data_ingestion.load_data(list(tickers), (end - timedelta(days=lookback_days)).isoformat(),
+                                        end.isoformat())
+        if data.empty:
+            return self.refresh_from_store(data_ingestion, filename)
+
+        closes = data["Close"]
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+        data_ingestion.cache_data(closes, filename)
+        return self.refresh(closes)
+
+    @property
+    def snapshot_id(self) -> str:
+        """Identifier of the current data, used in response cache keys"""
+        return f"facts-v{self.version}"
+
+    def get(self, ticker: str) -> Optional[Dict]:
+        """Fact sheet for a ticker"""
+        return self.sheets.get(ticker.upper())
+
+    def summary(self, ticker: str) -> Optional[str]:
+        """Precomputed one-paragraph summary for a ticker"""
+        return self.summaries.get(ticker.upper())
+
+    def fill(self, template, ticker: str) -> str:
+        """
+        Fill a '{ticker}' prompt template with the ticker's facts
+
+        Args:
+            template: PromptTemplate or template string
+            ticker: Stock ticker
+
+        Returns:
+            Rendered prompt followed by the ticker's fact summary
+        """
+        text = template.render(ticker=ticker) if hasattr(template, "render") else template.replace("{ticker}", ticker)
+        summary = self.summary(ticker)
+        return f"{text}\n\n{summary}" if summary else text
+
+    def tickers_in(self, text: str) -> List[str]:
+        """
+        Indexed tickers mentioned in free text, in order of first mention
+
+        Uppercase tokens and '$'-prefixed tokens of any case always count; other
+        tokens count only with at least 3 letters and outside TICKER_STOPWORDS,
+        so ordinary words such as 'a', 'it', or 'on' never match tickers.
+        """
+        found = []
+        for dollar, token in re.findall(r"(\$?)\b([A-Za-z]{1,5})\b", text):
+            ticker = token.upper()
+            if not (dollar or token == ticker or (len(token) >= 3 and ticker not in TICKER_STOPWORDS)):
+                continue
+            if ticker in self.sheets and ticker not in found:
+                found.append(ticker)
+        return found
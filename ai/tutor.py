@@ -0,0 +1,383 @@
+"""AI Tutor Agent Runtime
+
+Routes questions to the tutor agents and caches their responses
+"""
+
+import asyncio
+import functools
+import math
+import os
+import re
+import string
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import yaml
+
+PROMPTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tutor_prompts.yaml")
+DEFAULT_AGENT = "beginner_educator"
+
+# Agents whose answers should cite market data
+DATA_AGENTS = ("market_analyst", "risk_manager")
+
+_STOPWORDS = frozenset({
+    "a", "about", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for",
+    "from", "how", "i", "in", "is", "it", "me", "my", "of", "on", "or", "should",
+    "that", "the", "this", "to", "what", "when", "which", "why", "with", "you", "your",
+})
+
+
+def _stem(token: str) -> str:
+    """Strip a plural 's' so 'indicators' and 'indicator' match"""
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _tokens(text: str) -> List[str]:
+    """Lowercase, singularized word tokens without stopwords or template fields"""
+    text = re.sub(r"\{[^}]*\}", " ", str(text).lower())
+    return [_stem(token) for token in re.findall(r"[a-z0-9]+", text) if token not in _STOPWORDS]
+
+
+def normalize_prompt(text: str) -> str:
+    """Canonical form of a question for cache keys"""
+    return " ".join(re.findall(r"[a-z0-9%$]+(?:\.[0-9]+)*", text.lower()))
+
+
+class PromptTemplate:
+    """Template with '{field}' placeholders, parsed once
+
+    Fields missing from the render context are left as literal placeholders.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self.segments = [
+            (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+        ]
+        self.fields = tuple(field for _, field in self.segments if field)
+
+    def render(self, **context) -> str:
+        """Fill the template from keyword arguments"""
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(context[field]) if field in context else "{" + field + "}")
+        return "".join(parts)
+
+
+class Agent:
+    """Compiled tutor agent definition"""
+
+    def __init__(self, key: str, spec: dict):
+        self.key = key
+        self.name = spec.get("name", key)
+        self.role = spec.get("role", "")
+        self.style_rules = spec.get("style_rules", [])
+        self.safety_rules = spec.get("safety_rules", [])
+        self.instruction_prompts = [PromptTemplate(p) for p in spec.get("instruction_prompts", [])]
+        self.keywords = [str(keyword) for keyword in spec.get("keywords", [])]
+
+        rules = "\n".join(f"- {rule}" for rule in self.style_rules + self.safety_rules)
+        self.system_prompt = spec.get("system_prompt", "").strip()
+        if rules:
+            self.system_prompt += f"\n\nFollow these rules:\n{rules}"
+
+
+@functools.lru_cache(maxsize=None)
+def load_agents(path: str = PROMPTS_PATH) -> Dict:
+    """
+    Parse and compile the agent prompts once per process
+
+    Returns:
+        Dictionary with 'agents' (key -> Agent), 'context_templates'
+        (name -> PromptTemplate), and 'examples'
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+
+    return {
+        "agents": {key: Agent(key, agent) for key, agent in spec.get("agents", {}).items()},
+        "context_templates": {
+            name: PromptTemplate(template)
+            for name, template in spec.get("context_templates", {}).items()
+        },
+        "examples": spec.get("example_interactions", []),
+    }
+
+
+class AgentRouter:
+    """Keyword classifier choosing the agent for a question
+
+    Each agent's name, role, prompts, rules, keywords, and example questions form a
+    bag of words; words are weighted by inverse agent frequency so terms
+    shared by every agent carry no signal.
+    """
+
+    def __init__(self, agents: Dict[str, Agent], examples: Optional[List[dict]] = None,
+                 default: str = DEFAULT_AGENT):
+        self.default = default if default in agents else next(iter(agents))
+        documents = {}
+
+        for key, agent in agents.items():
+            text = [agent.name, agent.role, agent.system_prompt]
+            text += [template.template for template in agent.instruction_prompts]
+            text += agent.keywords
+            documents[key] = set(_tokens(" ".join(text)))
+
+        for example in examples or []:
+            if example.get("agent") in documents:
+                documents[example["agent"]].update(_tokens(example.get("user", "")))
+
+        document_frequency = {}
+        for tokens in documents.values():
+            for token in tokens:
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+
+        self.weights = {}
+        for key, tokens in documents.items():
+            for token in tokens:
+                idf = math.log(len(documents) / document_frequency[token])
+                if idf > 0:
+                    self.weights.setdefault(token, {})[key] = idf
+
+    def scores(self, question: str) -> Dict[str, float]:
+        """Score of each agent for a question"""
+        scores = {}
+        for token in _tokens(question):
+            for key, weight in self.weights.get(token, {}).items():
+                scores[key] = scores.get(key, 0.0) + weight
+        return scores
+
+    def route(self, question: str) -> str:
+        """Best agent for a question, or the default when nothing matches"""
+        scores = self.scores(question)
+        if not scores:
+            return self.default
+        return max(scores, key=scores.get)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry time-to-live"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class LLMBackend(ABC):
+    """Interface for language model backends"""
+
+    @abstractmethod
+    def complete(self, system_prompt: str, prompt: str) -> str:
+        """Generate a response to a prompt under a system prompt"""
+
+    async def astream(self, system_prompt: str, messages: List[Dict[str, str]]):
+        """
+        Stream a chat response chunk by chunk
+
+        The default runs complete() in a worker thread on the flattened
+        conversation and yields the whole response as one chunk.
+
+        Args:
+            system_prompt: Agent system prompt
+            messages: Conversation as role/content dicts, ending with the user turn
+        """
+        prompt = "\n".join(f"{m['role']}: {m['content']}" for m in messages[:-1])
+        prompt = f"{prompt}\n{messages[-1]['content']}" if prompt else messages[-1]["content"]
+        yield await asyncio.get_running_loop().run_in_executor(None, self.complete, system_prompt, prompt)
+
+
+class LocalStubBackend(LLMBackend):
+    """Deterministic offline backend for tests and demos"""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+        self.last_messages = None
+
+    def complete(self, system_prompt: str, prompt: str) -> str:
+        self.calls += 1
+        role = system_prompt.split(".")[0].replace("You are ", "").strip()
+        return (
+            f"As {role}, here is an educational overview of: {prompt}\n\n"
+            "This is a placeholder response from the local tutor backend. "
+            "Not financial advice."
+        )
+
+    async def astream(self, system_prompt: str, messages: List[Dict[str, str]]):
+        """Stream the stub response word by word"""
+        self.last_messages = list(messages)
+        words = self.complete(system_prompt, messages[-1]["content"]).split(" ")
+        for i, word in enumerate(words):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield word if i == 0 else " " + word
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI chat completion backend"""
+
+    def __init__(self, model: str = "gpt-3.5-turbo", api_key: Optional[str] = None, temperature: float = 0.3):
+        self.model = model
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.temperature = temperature
+
+    def complete(self, system_prompt: str, prompt: str) -> str:
+        import openai
+
+        openai.api_key = self.api_key
+        response = openai.ChatCompletion.create(
+            model=self.model,
+            temperature=self.temperature,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+        )
+        return response["choices"][0]["message"]["content"]
+
+    async def astream(self, system_prompt: str, messages: List[Dict[str, str]]):
+        """Stream tokens from the chat completion API"""
+        import openai
+
+        openai.api_key = self.api_key
+        response = await openai.ChatCompletion.acreate(
+            model=self.model,
+            temperature=self.temperature,
+            messages=[{"role": "system", "content": system_prompt}] + list(messages),
+            stream=True,
+        )
+        async for chunk in response:
+            content = chunk["choices"][0]["delta"].get("content")
+            if content:
+                yield content
+
+
+class TutorRuntime:
+    """Routes questions to agents, calling the backend only on cache misses"""
+
+    def __init__(self, backend: Optional[LLMBackend] = None, cache: Optional[ResponseCache] = None,
+                 prompts_path: str = PROMPTS_PATH, facts=None):
+        """
+        Args:
+            backend: Language model backend (defaults to LocalStubBackend)
+            cache: Response cache (defaults to a fresh ResponseCache)
+            prompts_path: Agent prompts YAML
+            facts: Optional MarketFactsIndex used to ground data-driven agents
+        """
+        compiled = load_agents(prompts_path)
+        self.agents = compiled["agents"]
+        self.context_templates = compiled["context_templates"]
+        self.router = AgentRouter(self.agents, compiled["examples"])
+        self.backend = backend or LocalStubBackend()
+        self.cache = cache or ResponseCache()
+        self.facts = facts
+
+    def build_prompt(self, question: str, context: Optional[Dict[str, Dict]] = None) -> str:
+        """
+        Prefix the question with rendered context templates
+
+        Args:
+            question: User question
+            context: Template name (e.g. 'user_profile') to its field values
+        """
+        lines = [
+            self.context_templates[name].render(**values)
+            for name, values in (context or {}).items()
+            if name in self.context_templates
+        ]
+        lines.append(question)
+        return "\n".join(lines)
+
+    def grounding(self, agent_key: str, question: str) -> tuple:
+        """
+        Precomputed market facts for tickers mentioned in a question
+
+        Only agents listed in DATA_AGENTS are grounded.
+
+        Returns:
+            (list of fact summary lines, facts snapshot id or '')
+        """
+        if self.facts is None or agent_key not in DATA_AGENTS:
+            return [], ""
+
+        lines = [self.facts.summary(ticker) for ticker in self.facts.tickers_in(question)]
+        if not lines:
+            return [], ""
+        return lines, self.facts.snapshot_id
+
+    @staticmethod
+    def cache_key(agent_key: str, prompt: str, snapshot_id: str = "") -> tuple:
+        """Response cache key for an agent, prompt, and data snapshot"""
+        return (agent_key, normalize_prompt(prompt), snapshot_id)
+
+    def ask(self, question: str, agent: Optional[str] = None,
+            context: Optional[Dict[str, Dict]] = None, snapshot_id: str = "") -> Dict:
+        """
+        Answer a question with the routed (or given) agent
+
+        Args:
+            question: User question
+            agent: Optional agent key overriding the router
+            context: Optional context template values
+            snapshot_id: Version of the data the answer depends on
+
+        Returns:
+            Dictionary with agent key, agent name, response text, and cache flag
+        """
+        agent_key = agent or self.router.route(question)
+        prompt = self.build_prompt(question, context)
+        facts, facts_snapshot = self.grounding(agent_key, question)
+        if facts:
+            prompt = "\n".join(facts + [prompt])
+            snapshot_id = snapshot_id or facts_snapshot
+        key = self.cache_key(agent_key, prompt, snapshot_id)
+
+        response = self.cache.get(key)
+        cached = response is not None
+        if not cached:
+            response = self.backend.complete(self.agents[agent_key].system_prompt, prompt)
+            self.cache.put(key, response)
+
+        return {
+            "agent": agent_key,
+            "agent_name": self.agents[agent_key].name,
+            "response": response,
+            "cached": cached,
+        }
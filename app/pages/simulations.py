@@ -9,18 +9,107 @@ import numpy as np
 import yfinance as yf
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+import os
 import sys
-sys.path.append('..')
+import uuid
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from app.resources import get_ledger_store, get_price_scheduler
+from core.downsampling import DEFAULT_MAX_POINTS, aggregate_ohlcv, downsample_series, percentile_bands
+from models.monte_carlo import monte_carlo_simulation
+from simulations.attribution import TradeReplay
 from simulations.trading_sim import TradingSimulator
 
 # Page configuration
 st.set_page_config(page_title="Stock Simulator", page_icon="💵", layout="wide")
 
+# Accounts live in the shared ledger so trades survive restarts and are visible to every replica
+ledger = get_ledger_store()
+
+def open_account():
+    """Load the account named in the sidebar (creating it if new) and persist its trades"""
+    account_id = st.session_state.account_id.strip()
+    if not account_id:
+        account_id = st.session_state.account_id = uuid.uuid4().hex[:8]
+    
+    # Only cash and positions are loaded; history is read from the ledger when needed
+    simulator = ledger.load_simulator(account_id)
+    if simulator is None:
+        simulator = TradingSimulator(initial_capital=100000)
+    ledger.attach(simulator, account_id)
+    
+    st.session_state.simulator = simulator
+    st.session_state.trade_history = []
+
+def reset_account():
+    """Start over with a fresh account (the old one stays in the ledger)"""
+    st.session_state.account_id = uuid.uuid4().hex[:8]
+    open_account()
+
 # Initialize session state
+if 'account_id' not in st.session_state:
+    st.session_state.account_id = uuid.uuid4().hex[:8]
 if 'simulator' not in st.session_state:
-    st.session_state.simulator = TradingSimulator(initial_capital=100000)
+    open_account()
 if 'trade_history' not in st.session_state:
     st.session_state.trade_history = []
+if 'price_session_id' not in st.session_state:
+    st.session_state.price_session_id = uuid.uuid4().hex
+
+popular_tickers = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'NVDA', 'META', 'JPM', 'V', 'WMT']
+
+# Chart period -> bar interval (intraday for short periods)
+CHART_INTERVALS = {'1d': '1m', '5d': '5m', '1mo': '30m', '3mo': '1d', '6mo': '1d',
+                   '1y': '1d', '2y': '1d', '5y': '1d', 'max': '1d'}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_chart_payload(ticker, period, max_bars=DEFAULT_MAX_POINTS):
+    """Price history aggregated to at most max_bars candles, plus headline figures"""
+    hist = yf.Ticker(ticker).history(period=period, interval=CHART_INTERVALS[period])
+    if hist.empty:
+        return {'bars': hist, 'raw_bars': 0}
+
+    # Daily Change compares against the previous session's close, not the previous bar
+    daily = hist if CHART_INTERVALS[period] == '1d' else yf.Ticker(ticker).history(period='5d', interval='1d')
+    closes = daily['Close'].dropna()
+    earlier = closes[closes.index.date < hist.index[-1].date()]
+    return {
+        'bars': aggregate_ohlcv(hist, max_bars),
+        'raw_bars': len(hist),
+        'last_close': hist['Close'].iloc[-1],
+        'prev_close': earlier.iloc[-1] if len(earlier) else hist['Close'].iloc[0],
+    }
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_projection_bands(ticker, days=252, simulations=1000):
+    """Monte Carlo paths from the last year of daily closes, reduced to percentile bands"""
+    closes = yf.Ticker(ticker).history(period='1y')['Close']
+    paths = monte_carlo_simulation(closes, days=days, simulations=simulations)
+    dates = pd.bdate_range(closes.index[-1].date(), periods=days + 1)
+    return percentile_bands(paths, index=dates)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_price_panel(tickers, start):
+    """Daily closes for the traded tickers since start, dates x tickers"""
+    closes = yf.download(list(tickers), start=start, progress=False, auto_adjust=False)['Close']
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(tickers[0])
+    return closes
+
+# Quotes come from the shared background scheduler instead of per-session requests.
+# Only a cold server (no refresh published yet) waits briefly; otherwise reruns
+# never block and missing quotes are shown as unavailable.
+scheduler = get_price_scheduler()
+watched = set(popular_tickers) | set(st.session_state.simulator.portfolio)
+scheduler.watch(st.session_state.price_session_id, watched)
+prices = scheduler.snapshot
+if prices.version == 0:
+    prices = scheduler.wait_for(watched, timeout=5)
+
+# Holdings without a quote are valued at their last trade price rather than fetched inline
+marks = dict(prices.prices)
+unavailable = sorted(set(st.session_state.simulator.portfolio) - marks.keys())
+if unavailable:
+    marks.update(ledger.last_trade_prices(st.session_state.account_id, unavailable))
 
 # Title and description
 st.title("💵 Stock Picking Simulator")
@@ -33,18 +122,24 @@ track your portfolio, and see real-time performance metrics.
 with st.sidebar:
     st.header("🎯 Trading Dashboard")
     
+    st.text_input("Account ID", key="account_id", on_change=open_account,
+                  help="Your account is saved. Enter this ID later to resume it.")
+    
     # Portfolio summary
+    portfolio_value = st.session_state.simulator.get_portfolio_value(marks)
     st.metric("Portfolio Value", 
-              f"${st.session_state.simulator.get_portfolio_value():,.2f}",
-              delta=f"${st.session_state.simulator.get_portfolio_value() - st.session_state.simulator.initial_capital:,.2f}")
+              f"${portfolio_value:,.2f}",
+              delta=f"${portfolio_value - st.session_state.simulator.initial_capital:,.2f}")
     
     st.metric("Available Cash", 
               f"${st.session_state.simulator.cash:,.2f}")
     
-    returns = st.session_state.simulator.get_returns()
+    returns = st.session_state.simulator.get_returns(marks)
     st.metric("Total Return", 
               f"{returns['percentage_return']:.2f}%",
               delta=f"${returns['absolute_return']:,.2f}")
+    if unavailable:
+        st.caption(f"Quotes unavailable for {', '.join(unavailable)}; valued at last trade price")
     
     st.divider()
     
@@ -54,17 +149,16 @@ with st.sidebar:
     action = st.radio("Action", ["Buy", "Sell"])
     
     # Stock selector with popular tickers
-    popular_tickers = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'NVDA', 'META', 'JPM', 'V', 'WMT']
     ticker = st.selectbox("Ticker Symbol", popular_tickers)
     
-    # Get current price
-    try:
-        stock = yf.Ticker(ticker)
-        current_price = stock.history(period='1d')['Close'].iloc[-1]
+    # Get current price from the shared snapshot
+    current_price = prices.get(ticker)
+    if current_price is not None:
         st.info(f"Current Price: ${current_price:.2f}")
-    except:
+        st.caption(f"Updated {prices.age(ticker):.0f}s ago")
+    else:
         current_price = 0
-        st.warning("Unable to fetch price")
+        st.warning("Price unavailable")
     
     quantity = st.number_input("Quantity", min_value=1, value=10, step=1)
     
@@ -92,10 +186,8 @@ with st.sidebar:
             st.error(result['message'])
     
     # Reset button
-    if st.button("🔄 Reset Portfolio", use_container_width=True):
-        st.session_state.simulator = TradingSimulator(initial_capital=100000)
-        st.session_state.trade_history = []
-        st.rerun()
+    st.button("🔄 Reset Portfolio", use_container_width=True, on_click=reset_account,
+              help="Starts a new account with $100,000")
 
 # Main content area
 tab1, tab2, tab3, tab4 = st.tabs(["💼 Portfolio", "📈 Charts", "📊 Performance", "📑 History"])
@@ -109,21 +201,17 @@ with tab1:
         total_value = 0
         
         for ticker, quantity in st.session_state.simulator.portfolio.items():
-            try:
-                stock = yf.Ticker(ticker)
-                current_price = stock.history(period='1d')['Close'].iloc[-1]
-                value = quantity * current_price
-                total_value += value
-                
-                holdings_data.append({
-                    'Ticker': ticker,
-                    'Quantity': quantity,
-                    'Current Price': f"${current_price:.2f}",
-                    'Total Value': f"${value:,.2f}",
-                    'Weight': f"{(value / st.session_state.simulator.get_portfolio_value()) * 100:.1f}%"
-                })
-            except:
-                pass
+            current_price = prices.get(ticker)
+            value = quantity * marks.get(ticker, 0.0)
+            total_value += value
+            
+            holdings_data.append({
+                'Ticker': ticker,
+                'Quantity': quantity,
+                'Current Price': f"${current_price:.2f}" if current_price is not None else "Unavailable",
+                'Total Value': f"${value:,.2f}",
+                'Weight': f"{(value / portfolio_value) * 100:.1f}%"
+            })
         
         if holdings_data:
             df = pd.DataFrame(holdings_data)
@@ -153,21 +241,21 @@ with tab2:
         chart_ticker = st.selectbox("Select Stock to Analyze", popular_tickers, key='chart_ticker')
     
     with col2:
-        period = st.selectbox("Time Period", ['1d', '5d', '1mo', '3mo', '6mo', '1y'], index=4)
+        period = st.selectbox("Time Period", list(CHART_INTERVALS), index=4)
     
     try:
-        # Fetch data
-        stock = yf.Ticker(chart_ticker)
-        hist = stock.history(period=period)
+        # Fetch data (downsampled server-side and cached per ticker/period)
+        chart = load_chart_payload(chart_ticker, period)
+        bars = chart['bars']
         
-        if not hist.empty:
+        if not bars.empty:
             # Candlestick chart
             fig = go.Figure(data=[go.Candlestick(
-                x=hist.index,
-                open=hist['Open'],
-                high=hist['High'],
-                low=hist['Low'],
-                close=hist['Close'],
+                x=bars.index,
+                open=bars['Open'],
+                high=bars['High'],
+                low=bars['Low'],
+                close=bars['Close'],
                 name=chart_ticker
             )])
             
@@ -180,11 +268,13 @@ with tab2:
             )
             
             st.plotly_chart(fig, use_container_width=True)
+            if chart['raw_bars'] > len(bars):
+                st.caption(f"{chart['raw_bars']:,} bars aggregated into {len(bars):,} candles")
             
             # Volume chart
             fig_vol = go.Figure(data=[go.Bar(
-                x=hist.index,
-                y=hist['Volume'],
+                x=bars.index,
+                y=bars['Volume'],
                 name='Volume'
             )])
             
@@ -201,14 +291,28 @@ with tab2:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("Current Price", f"${hist['Close'].iloc[-1]:.2f}")
+                st.metric("Current Price", f"${chart['last_close']:.2f}")
             with col2:
-                daily_change = ((hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100)
+                daily_change = (chart['last_close'] - chart['prev_close']) / chart['prev_close'] * 100
                 st.metric("Daily Change", f"{daily_change:.2f}%")
             with col3:
-                st.metric("52W High", f"${hist['High'].max():.2f}")
+                st.metric("52W High", f"${bars['High'].max():.2f}")
             with col4:
-                st.metric("52W Low", f"${hist['Low'].min():.2f}")
+                st.metric("52W Low", f"${bars['Low'].min():.2f}")
+            
+            # Monte Carlo fan chart: percentile bands instead of one trace per path
+            with st.expander("🎲 Monte Carlo Projection (1 year)"):
+                bands = load_projection_bands(chart_ticker)
+                fig_mc = go.Figure()
+                fig_mc.add_trace(go.Scatter(x=bands.index, y=bands['p95'], line=dict(width=0), showlegend=False))
+                fig_mc.add_trace(go.Scatter(x=bands.index, y=bands['p5'], fill='tonexty', line=dict(width=0),
+                                            fillcolor='rgba(31, 119, 180, 0.15)', name='5th-95th percentile'))
+                fig_mc.add_trace(go.Scatter(x=bands.index, y=bands['p75'], line=dict(width=0), showlegend=False))
+                fig_mc.add_trace(go.Scatter(x=bands.index, y=bands['p25'], fill='tonexty', line=dict(width=0),
+                                            fillcolor='rgba(31, 119, 180, 0.35)', name='25th-75th percentile'))
+                fig_mc.add_trace(go.Scatter(x=bands.index, y=bands['p50'], line=dict(color='#1f77b4'), name='Median'))
+                fig_mc.update_layout(yaxis_title='Price ($)', height=400, template='plotly_white')
+                st.plotly_chart(fig_mc, use_container_width=True)
         else:
             st.warning("No data available for this period")
     except Exception as e:
@@ -218,7 +322,7 @@ with tab2:
 with tab3:
     st.header("📊 Performance Metrics")
     
-    returns = st.session_state.simulator.get_returns()
+    returns = st.session_state.simulator.get_returns(marks)
     
     # Key metrics in columns
     col1, col2, col3 = st.columns(3)
@@ -243,6 +347,37 @@ with tab3:
     
     st.divider()
     
+    # Equity curve and attribution replay the full ledger history, so it is only read on request
+    if st.toggle("Show equity curve and P&L attribution", key="show_replay"):
+        history = ledger.transaction_history(st.session_state.account_id)
+    else:
+        history = []
+    if history:
+        st.subheader("📈 Equity Curve")
+        traded = tuple(sorted({t['ticker'] for t in history}))
+        start = (min(t['date'] for t in history) - timedelta(days=7)).strftime('%Y-%m-%d')
+        panel = load_price_panel(traded, start)
+        
+        if not panel.empty:
+            replay = TradeReplay(panel).replay(history, st.session_state.simulator.initial_capital)
+            nav = downsample_series(replay['nav'])
+            
+            fig_nav = go.Figure(data=[go.Scatter(x=nav.index, y=nav, name='Portfolio Value')])
+            fig_nav.add_hline(y=st.session_state.simulator.initial_capital, line_dash='dash', line_color='gray')
+            fig_nav.update_layout(yaxis_title='Value ($)', height=350, template='plotly_white')
+            st.plotly_chart(fig_nav, use_container_width=True)
+            
+            st.subheader("🧾 P&L Attribution")
+            st.dataframe(replay['summary'].style.format({
+                'position': '{:,.0f}', 'average_cost': '${:,.2f}', 'market_value': '${:,.2f}',
+                'realized_pnl': '${:,.2f}', 'unrealized_pnl': '${:,.2f}', 'total_pnl': '${:,.2f}',
+                'contribution_pct': '{:.2f}%'
+            }), use_container_width=True)
+        else:
+            st.warning("Unable to load price history for the equity curve")
+        
+        st.divider()
+    
     # Performance insights
     st.subheader("💡 Performance Insights")
     
@@ -0,0 +1,54 @@
+"""Shared App Resources
+
+Objects built once per Streamlit server and shared by all sessions
+"""
+
+import os
+
+import streamlit as st
+
+# Tickers the tutor keeps fact sheets for (override with FINLEARNX_FACTS_TICKERS)
+DEFAULT_FACTS_TICKERS = "AAPL,GOOGL,MSFT,AMZN,TSLA,NVDA,META,JPM,V,WMT,SPY,QQQ"
+
+
+@st.cache_resource
+def get_progress_tracker():
+    """Quiz progress shared by all sessions, built once per server"""
+    from education.catalog import get_catalog
+    from education.progress import ProgressTracker, QuizGrader
+    return ProgressTracker(QuizGrader(get_catalog()))
+
+
+@st.cache_resource
+def get_market_facts():
+    """Fact sheets for a ticker universe, downloaded and refreshed daily on the scheduler thread"""
+    from ai.market_facts import MarketFactsIndex
+    from core.data_ingestion import DataIngestion
+    facts = MarketFactsIndex()
+    store = DataIngestion()
+    tickers = os.environ.get("FINLEARNX_FACTS_TICKERS", DEFAULT_FACTS_TICKERS).split(",")
+    get_price_scheduler().every(24 * 3600, lambda: facts.refresh_from_ingestion(store, tickers, "facts_closes.csv"))
+    return facts
+
+
+@st.cache_resource
+def get_tutor_runtime():
+    """Tutor runtime shared by all sessions so cached answers are reused"""
+    from ai.tutor import OpenAIBackend, TutorRuntime
+    backend = OpenAIBackend() if os.environ.get("OPENAI_API_KEY") else None
+    return TutorRuntime(backend=backend, facts=get_market_facts())
+
+
+@st.cache_resource
+def get_price_scheduler():
+    """Background quote refresher shared by all sessions"""
+    from core.price_scheduler import PriceScheduler, YFinanceSource
+    interval = float(os.environ.get("FINLEARNX_PRICE_INTERVAL", "30"))
+    return PriceScheduler(YFinanceSource(), interval=interval).start()
+
+
+@st.cache_resource
+def get_ledger_store():
+    """Paper trading ledger shared by all sessions (and replicas using the same database)"""
+    from simulations.ledger import LedgerStore
+    return LedgerStore(os.environ.get("FINLEARNX_LEDGER_URL", "sqlite:///data/ledger.db"))
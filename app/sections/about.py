@@ -0,0 +1,25 @@
+"""About Page"""
+
+import streamlit as st
+
+
+def render():
+    st.title("ℹ️ About FinLearnX")
+    st.markdown("""
+    ### FinLearnX
+
+    **AI-Driven Financial Learning + Portfolio Platform**
+
+    Built for educational purposes to empower users with:
+    - AI-powered tutoring
+    - Portfolio optimization
+    - Trading simulations
+    - Comprehensive financial education
+
+    ---
+
+    ⚠️ **Disclaimer**: This platform is for educational purposes only.
+    Not financial advice. Always consult with licensed professionals.
+
+    👨‍💻 Created by Sagar Mandavkar
+    """)
@@ -0,0 +1,8 @@
+"""Backtesting Page"""
+
+import streamlit as st
+
+
+def render():
+    st.title("⏱️ Backtesting Engine")
+    st.write("Test your strategies against historical data...")
@@ -0,0 +1,30 @@
+"""Home Page"""
+
+import streamlit as st
+
+from app.resources import get_progress_tracker
+
+
+def render():
+    st.title("🏠 Dashboard")
+    st.markdown("""
+    ### Welcome to FinLearnX!
+
+    Your AI-powered platform for financial learning, portfolio management, and trading simulation.
+
+    #### Quick Stats
+    """)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Portfolio Value", "$0", "0%")
+    with col2:
+        progress = get_progress_tracker().dashboard_metrics(st.session_state.learner_id)
+        st.metric("Learning Progress", f"{progress['progress_pct']:.0f}%",
+                  f"{progress['modules_completed']} modules")
+    with col3:
+        st.metric("Simulations Run", "0", "0 today")
+    with col4:
+        st.metric("AI Interactions", "0", "0 today")
+
+    st.info("🚧 This is a demo version. Start by exploring the Learning Hub or AI Tutor!")
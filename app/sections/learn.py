@@ -0,0 +1,39 @@
+"""Learn Page"""
+
+import streamlit as st
+
+from app.resources import get_progress_tracker
+from education.catalog import get_catalog
+
+
+def render():
+    st.title("📚 Learning Hub")
+    st.write("Educational modules, videos, articles, and interactive lessons...")
+
+    catalog = get_catalog()
+
+    query = st.text_input("Search modules", placeholder="e.g. diversification, ETFs, moving averages")
+    modules = catalog.search(query) if query else catalog.modules
+
+    if not modules:
+        st.info("No modules match your search.")
+
+    for module in modules:
+        with st.expander(f"{module['title']} · {module.get('duration', '?')} min · {module.get('difficulty', '')}"):
+            st.write(module.get("description", ""))
+            st.markdown("**Topics:** " + ", ".join(module.get("topics", [])))
+            st.markdown("**Learning outcomes:**")
+            for outcome in module.get("learning_outcomes", []):
+                st.markdown(f"- {outcome}")
+
+            for i, item in enumerate(module.get("quiz", [])):
+                question_id = f"{module['id']}:{i}"
+                choice = st.radio(item["question"], item["options"], key=f"quiz_{question_id}", index=None)
+                if st.button("Check answer", key=f"check_{question_id}") and choice is not None:
+                    correct = get_progress_tracker().record(
+                        st.session_state.learner_id, question_id, item["options"].index(choice)
+                    )
+                    if correct:
+                        st.success("Correct!")
+                    else:
+                        st.error("Not quite - try again.")
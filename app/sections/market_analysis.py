@@ -0,0 +1,8 @@
+"""Market Analysis Page"""
+
+import streamlit as st
+
+
+def render():
+    st.title("📈 Market Analysis")
+    st.write("Technical indicators, sector rotation, macro analysis...")
@@ -0,0 +1,8 @@
+"""Paper Trading Page"""
+
+import streamlit as st
+
+
+def render():
+    st.title("💵 Paper Trading")
+    st.write("Practice trading with virtual cash...")
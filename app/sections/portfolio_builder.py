@@ -0,0 +1,8 @@
+"""Portfolio Builder Page"""
+
+import streamlit as st
+
+
+def render():
+    st.title("💼 Portfolio Construction")
+    st.write("Build and optimize your portfolio with AI assistance...")
@@ -0,0 +1,57 @@
+"""Settings Page"""
+
+import streamlit as st
+
+from app.resources import get_tutor_runtime
+from core import instrumentation
+
+
+def render():
+    st.title("⚙️ Settings")
+    st.write("Configure your preferences, API keys, and profile...")
+
+    st.subheader("Performance Metrics")
+    # Instrumentation is process-wide: show its current state and change it only when toggled
+    st.session_state.metrics_enabled = instrumentation.is_enabled()
+    st.toggle("Record metrics", key="metrics_enabled",
+              on_change=lambda: instrumentation.enable(st.session_state.metrics_enabled))
+    st.toggle("Profile each rerun (cProfile)", key="profile_reruns")
+
+    snapshot = instrumentation.registry.snapshot()
+    if snapshot["timers"]:
+        st.dataframe([
+            {
+                "metric": name,
+                "calls": stats["count"],
+                "total ms": stats["total"] * 1000,
+                "mean ms": stats["total"] / stats["count"] * 1000,
+                "max ms": stats["max"] * 1000,
+            }
+            for name, stats in sorted(snapshot["timers"].items())
+        ], use_container_width=True)
+    else:
+        st.info("No timings recorded yet. Enable metrics and use the other pages.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Counters**")
+        st.json(snapshot["counters"])
+    with col2:
+        st.write("**Memory high-water marks (MB)**")
+        st.json({name: round(value / 2**20, 1) for name, value in snapshot["gauges"].items()})
+
+    tutor_cache = get_tutor_runtime().cache
+    st.caption(f"Tutor response cache: {tutor_cache.hits} hits, {tutor_cache.misses} misses")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("Download Prometheus metrics", instrumentation.render_prometheus(),
+                           file_name="finlearnx_metrics.prom", mime="text/plain")
+    with col2:
+        if st.button("Reset metrics"):
+            instrumentation.registry.reset()
+            st.rerun()
+
+    if instrumentation.registry.last_profile:
+        with st.expander("Last rerun profile"):
+            st.code(instrumentation.registry.last_profile)
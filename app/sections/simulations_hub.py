@@ -0,0 +1,8 @@
+"""Simulations Hub Page"""
+
+import streamlit as st
+
+
+def render():
+    st.title("🎮 Simulations")
+    st.write("Trading simulations, market crash scenarios, bond pricing...")
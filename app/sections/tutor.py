@@ -0,0 +1,38 @@
+"""AI Tutor Page"""
+
+import streamlit as st
+
+from ai.conversation import TutorSession, iterate_sync
+from app.resources import get_tutor_runtime
+
+
+def render():
+    st.title("🤖 AI Financial Tutor")
+    st.write("Chat with AI agents for personalized financial education...")
+
+    if "tutor_session" not in st.session_state:
+        st.session_state.tutor_session = TutorSession(get_tutor_runtime())
+    session = st.session_state.tutor_session
+
+    # Only the bounded window is rendered; older turns live on as a summary
+    if session.window.summary:
+        with st.expander(f"Earlier conversation ({session.window.total_turns - len(session.window.turns)} turns summarized)"):
+            st.text(session.window.summary)
+
+    for message in session.window.turns:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+    if prompt := st.chat_input("Ask me anything about finance..."):
+        with st.chat_message("user"):
+            st.markdown(prompt)
+
+        with st.chat_message("assistant"):
+            # Stream into a placeholder (st.write_stream needs a newer Streamlit than the pin)
+            placeholder = st.empty()
+            reply = ""
+            for chunk in iterate_sync(session.astream(prompt)):
+                reply += chunk
+                placeholder.markdown(reply + "▌")
+            placeholder.markdown(reply)
+            st.caption(get_tutor_runtime().agents[session.last_agent].name)
@@ -5,17 +5,39 @@ Test trading strategies against historical data
 
 import pandas as pd
 import numpy as np
-import yfinance as yf
+
+from core.instrumentation import count, timed
+from core.lazy import lazy_import
+
+yf = lazy_import("yfinance")
 
 class BacktestEngine:
     """Simple backtesting engine for trading strategies"""
     
     def __init__(self, ticker, start_date, end_date, initial_capital=100000):
         self.ticker = ticker
+        count("network.yf_download")
         self.data = yf.download(ticker, start=start_date, end=end_date)
         self.initial_capital = initial_capital
         self.results = None
     
+    @classmethod
+    def from_data(cls, ticker, data, initial_capital=100000):
+        """
+        Create an engine from already loaded price data (no download)
+        
+        Args:
+            ticker: Stock ticker
+            data: DataFrame with an 'Adj Close' column
+            initial_capital: Starting capital
+        """
+        engine = cls.__new__(cls)
+        engine.ticker = ticker
+        engine.data = data
+        engine.initial_capital = initial_capital
+        engine.results = None
+        return engine
+    
     def moving_average_strategy(self, short_window=20, long_window=50):
         """Simple moving average crossover strategy"""
         signals = pd.DataFrame(index=self.data.index)
@@ -23,8 +45,8 @@ class BacktestEngine:
         signals['short_ma'] = self.data['Adj Close'].rolling(window=short_window).mean()
         signals['long_ma'] = self.data['Adj Close'].rolling(window=long_window).mean()
         signals['signal'] = 0.0
-        signals['signal'][short_window:] = np.where(
-            signals['short_ma'][short_window:] > signals['long_ma'][short_window:], 1.0, 0.0
+        signals.loc[signals.index[short_window:], 'signal'] = np.where(
+            signals['short_ma'].iloc[short_window:] > signals['long_ma'].iloc[short_window:], 1.0, 0.0
         )
         signals['positions'] = signals['signal'].diff()
         
@@ -44,6 +66,7 @@ class BacktestEngine:
         
         return portfolio
     
+    @timed("backtesting.run_backtest")
     def run_backtest(self, strategy='moving_average'):
         """Run backtest and calculate metrics"""
         if strategy == 'moving_average':
@@ -0,0 +1,99 @@
+"""Benchmark Comparison
+
+Compare benchmark results against a stored baseline and flag regressions
+
+Usage:
+    python -m benchmarks.compare benchmarks/baseline.json benchmarks/results.json --threshold 0.25
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 0.25) -> List[Dict]:
+    """
+    Compare best timings of two result documents
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        threshold: Relative slowdown (0.25 = 25%) counted as a regression
+
+    Returns:
+        One row per benchmark with the ratio and a status of
+        'regression', 'improved', 'ok', 'new', or 'missing'
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+
+    for key in sorted(set(base_results) | set(current_results)):
+        base = base_results.get(key)
+        now = current_results.get(key)
+
+        if base is None or now is None:
+            rows.append({
+                "benchmark": key,
+                "baseline": base["best"] if base else None,
+                "current": now["best"] if now else None,
+                "ratio": None,
+                "status": "new" if base is None else "missing",
+            })
+            continue
+
+        ratio = now["best"] / base["best"] if base["best"] > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improved"
+        else:
+            status = "ok"
+
+        rows.append({
+            "benchmark": key,
+            "baseline": base["best"],
+            "current": now["best"],
+            "ratio": ratio,
+            "status": status,
+        })
+
+    return rows
+
+
+def format_report(rows: List[Dict]) -> str:
+    """Plain-text comparison table"""
+    lines = [f"{'benchmark':<70} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}  status"]
+    for row in rows:
+        base = f"{row['baseline'] * 1000:.2f}" if row["baseline"] is not None else "-"
+        now = f"{row['current'] * 1000:.2f}" if row["current"] is not None else "-"
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        lines.append(f"{row['benchmark']:<70} {base:>12} {now:>12} {ratio:>7}  {row['status']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results to a baseline")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, args.threshold)
+    print(format_report(rows))
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
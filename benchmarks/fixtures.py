@@ -0,0 +1,57 @@
+"""Benchmark Fixtures
+
+Deterministic synthetic market data so benchmarks never touch the network
+"""
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+
+def synthetic_prices(num_assets: int = 5, years: float = 3, seed: int = 42,
+                     start: str = "2015-01-02") -> pd.DataFrame:
+    """
+    Correlated geometric Brownian motion closing prices
+
+    Args:
+        num_assets: Number of tickers
+        years: History length in years of trading days
+        seed: Random seed
+        start: First business date
+
+    Returns:
+        DataFrame of prices, business days x tickers 'SYN000', 'SYN001', ...
+    """
+    rng = np.random.default_rng(seed)
+    days = int(years * TRADING_DAYS)
+
+    # One-factor correlation structure with varied drift and volatility
+    market = rng.normal(0, 0.01, size=(days, 1))
+    betas = rng.uniform(0.5, 1.5, size=num_assets)
+    idiosyncratic = rng.normal(0, 0.01, size=(days, num_assets))
+    drift = rng.uniform(0.0001, 0.0008, size=num_assets)
+    returns = drift + market * betas + idiosyncratic
+
+    prices = 100 * np.exp(np.cumsum(returns, axis=0))
+    index = pd.bdate_range(start, periods=days)
+    columns = [f"SYN{i:03d}" for i in range(num_assets)]
+
+    return pd.DataFrame(prices, index=index, columns=columns)
+
+
+def synthetic_ohlcv(years: float = 3, seed: int = 42) -> pd.DataFrame:
+    """Single-ticker OHLCV bars in the layout yfinance returns"""
+    close = synthetic_prices(1, years, seed).iloc[:, 0]
+    rng = np.random.default_rng(seed + 1)
+    spread = np.abs(rng.normal(0, 0.005, size=len(close)))
+    open_ = close.shift(1).fillna(close.iloc[0])
+
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) * (1 + spread),
+        "Low": np.minimum(open_, close) * (1 - spread),
+        "Close": close,
+        "Adj Close": close,
+        "Volume": rng.integers(1_000_000, 5_000_000, size=len(close)),
+    }, index=close.index)
@@ -0,0 +1,205 @@
+"""Benchmark Runner
+
+Times every numeric hot path across scaling sizes and writes JSON results
+
+Usage:
+    python -m benchmarks.run --suite quick --output benchmarks/results.json
+    python -m benchmarks.run --suite full --filter monte_carlo
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import synthetic_ohlcv, synthetic_prices
+
+# Parameter grids per suite: quick runs in CI, full explores scaling
+SUITES = {
+    "quick": {
+        "monte_carlo_simulation": [{"simulations": 100, "days": 252}, {"simulations": 500, "days": 252}],
+        "portfolio_monte_carlo": [{"simulations": 20, "days": 252, "assets": 5}],
+        "backtest": [{"years": 1}, {"years": 5}],
+        "mpt_optimize_sharpe": [{"assets": 5}, {"assets": 20}],
+        "mpt_efficient_frontier": [{"assets": 5, "portfolios": 1000}],
+        "data_cache_load": [{"assets": 5, "years": 5}],
+        "trading_throughput": [{"trades": 10000}],
+        "trade_replay": [{"trades": 5000, "assets": 20, "years": 5}],
+    },
+    "full": {
+        "monte_carlo_simulation": [{"simulations": s, "days": 252} for s in (100, 1000, 5000)],
+        "portfolio_monte_carlo": [{"simulations": s, "days": 252, "assets": a} for s in (50, 200) for a in (5, 20)],
+        "backtest": [{"years": y} for y in (1, 5, 20)],
+        "mpt_optimize_sharpe": [{"assets": a} for a in (5, 20, 50)],
+        "mpt_efficient_frontier": [{"assets": a, "portfolios": 5000} for a in (5, 50)],
+        "data_cache_load": [{"assets": a, "years": y} for a in (5, 50) for y in (5, 20)],
+        "trading_throughput": [{"trades": t} for t in (10000, 100000)],
+        "trade_replay": [{"trades": t, "assets": 50, "years": 10} for t in (5000, 50000)],
+    },
+}
+
+
+def _bench_monte_carlo_simulation(simulations, days):
+    from models.monte_carlo import monte_carlo_simulation
+    prices = synthetic_prices(1, 3).iloc[:, 0]
+    return lambda: monte_carlo_simulation(prices, days=days, simulations=simulations)
+
+
+def _bench_portfolio_monte_carlo(simulations, days, assets):
+    from models.monte_carlo import portfolio_monte_carlo
+    returns = synthetic_prices(assets, 3).pct_change().dropna()
+    weights = np.full(assets, 1 / assets)
+    return lambda: portfolio_monte_carlo(returns, weights, days=days, simulations=simulations)
+
+
+def _bench_backtest(years):
+    from backtesting.engine import BacktestEngine
+    data = synthetic_ohlcv(years)
+    return lambda: BacktestEngine.from_data("SYN000", data).run_backtest()
+
+
+def _bench_mpt_optimize_sharpe(assets):
+    from portfolio.optimize_mpt import MPTOptimizer
+    optimizer = MPTOptimizer.from_prices(synthetic_prices(assets, 3))
+    return optimizer.optimize_sharpe
+
+
+def _bench_mpt_efficient_frontier(assets, portfolios):
+    from portfolio.optimize_mpt import MPTOptimizer
+    optimizer = MPTOptimizer.from_prices(synthetic_prices(assets, 3))
+    return lambda: optimizer.efficient_frontier(num_portfolios=portfolios)
+
+
+def _bench_data_cache_load(assets, years):
+    from core.data_ingestion import DataIngestion
+    ingestion = DataIngestion(cache_dir=tempfile.mkdtemp(prefix="finlearnx-bench-"))
+    ingestion.cache_data(synthetic_prices(assets, years), "prices.csv")
+    return lambda: ingestion.load_cached_data("prices.csv")
+
+
+def _bench_trading_throughput(trades):
+    from simulations.trading_sim import TradingSimulator
+    tickers = [f"SYN{i:03d}" for i in range(10)]
+
+    def run():
+        simulator = TradingSimulator(initial_capital=1e12)
+        for i in range(trades // 2):
+            ticker = tickers[i % len(tickers)]
+            simulator.buy(ticker, 10, 100.0)
+            simulator.sell(ticker, 5, 101.0)
+        return simulator
+
+    return run
+
+
+def _bench_trade_replay(trades, assets, years):
+    from simulations.attribution import TradeReplay
+    prices = synthetic_prices(assets, years)
+    rng = np.random.default_rng(0)
+    dates = np.sort(rng.choice(prices.index, size=trades))
+    tickers = prices.columns[rng.integers(assets, size=trades)]
+    # Buy-only so the random history never sells more than it holds
+    history = [
+        {"type": "BUY", "ticker": ticker, "quantity": 10, "price": prices.at[date, ticker], "date": date}
+        for date, ticker in zip(dates, tickers)
+    ]
+    replay = TradeReplay(prices)
+    return lambda: replay.replay(history, initial_capital=1e9)
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "monte_carlo_simulation": _bench_monte_carlo_simulation,
+    "portfolio_monte_carlo": _bench_portfolio_monte_carlo,
+    "backtest": _bench_backtest,
+    "mpt_optimize_sharpe": _bench_mpt_optimize_sharpe,
+    "mpt_efficient_frontier": _bench_mpt_efficient_frontier,
+    "data_cache_load": _bench_data_cache_load,
+    "trading_throughput": _bench_trading_throughput,
+    "trade_replay": _bench_trade_replay,
+}
+
+
+def benchmark_id(name: str, params: dict) -> str:
+    """Stable identifier such as 'backtest[years=5]'"""
+    args = ",".join(f"{key}={value}" for key, value in sorted(params.items()))
+    return f"{name}[{args}]"
+
+
+def time_call(func: Callable, repeat: int = 3) -> Dict:
+    """Best and median wall time of several runs, after seeding the global RNG"""
+    timings = []
+    for _ in range(repeat):
+        np.random.seed(0)
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return {"best": min(timings), "median": float(np.median(timings)), "repeat": repeat}
+
+
+def run_suite(suite: str = "quick", name_filter: Optional[str] = None, repeat: int = 3,
+              verbose: bool = True) -> Dict:
+    """
+    Run a benchmark suite
+
+    Args:
+        suite: 'quick' or 'full'
+        name_filter: Only run benchmarks whose name contains this string
+        repeat: Timed runs per benchmark
+        verbose: Print results as they complete
+
+    Returns:
+        Results document with environment metadata and timings per benchmark id
+    """
+    results = {}
+    for name, grid in SUITES[suite].items():
+        if name_filter and name_filter not in name:
+            continue
+        for params in grid:
+            func = BENCHMARKS[name](**params)
+            key = benchmark_id(name, params)
+            results[key] = dict(time_call(func, repeat), name=name, params=params)
+            if verbose:
+                print(f"{key:<70} {results[key]['best'] * 1000:10.2f} ms")
+
+    return {
+        "meta": {
+            "suite": suite,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Run FinLearnX benchmarks")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    parser.add_argument("--filter", dest="name_filter", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    args = parser.parse_args(argv)
+
+    document = run_suite(args.suite, args.name_filter, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,17 @@
 Handles fetching and caching market data from multiple sources
 """
 
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
 from typing import List, Dict, Optional
 
+from core.instrumentation import count, timed
+from core.lazy import lazy_import
+
+yf = lazy_import("yfinance")
+
 class DataIngestion:
     """Main class for data ingestion from multiple APIs"""
     
@@ -17,6 +21,7 @@ class DataIngestion:
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
     
+    @timed("data.load_data")
     def load_data(self, tickers: List[str], start_date: str, end_date: str,
                   interval: str = "1d") -> pd.DataFrame:
         """
@@ -32,6 +37,7 @@ class DataIngestion:
             DataFrame with OHLCV data
         """
         try:
+            count("network.yf_download")
             data = yf.download(tickers, start=start_date, end=end_date,
                              interval=interval, progress=False)
             return self._clean_data(data)
@@ -45,13 +51,14 @@ class DataIngestion:
         df = df.dropna()
         
         # Forward fill any remaining gaps
-        df = df.fillna(method='ffill')
+        df = df.ffill()
         
         return df
     
     def get_latest_price(self, ticker: str) -> float:
         """Get latest closing price for a ticker"""
         try:
+            count("network.yf_history")
             stock = yf.Ticker(ticker)
             data = stock.history(period="1d")
             return data['Close'].iloc[-1] if not data.empty else 0.0
@@ -61,6 +68,7 @@ class DataIngestion:
     def get_company_info(self, ticker: str) -> Dict:
         """Get company information"""
         try:
+            count("network.yf_info")
             stock = yf.Ticker(ticker)
             return stock.info
         except:
@@ -71,9 +79,12 @@ class DataIngestion:
         filepath = os.path.join(self.cache_dir, filename)
         df.to_csv(filepath)
     
+    @timed("data.load_cached_data")
     def load_cached_data(self, filename: str) -> Optional[pd.DataFrame]:
         """Load data from cache"""
         filepath = os.path.join(self.cache_dir, filename)
         if os.path.exists(filepath):
+            count("cache.data.hit")
             return pd.read_csv(filepath, index_col=0, parse_dates=True)
+        count("cache.data.miss")
         return None
@@ -0,0 +1,136 @@
+"""Chart Downsampling
+
+Reduce price series, OHLCV bars, and simulation paths to what a chart can show
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+
+from core.instrumentation import timed
+
+# Points a full-width chart can usefully display
+DEFAULT_MAX_POINTS = 500
+
+
+def _as_float(x) -> np.ndarray:
+    """Numeric x coordinates (datetimes, tz-aware included, become UTC nanoseconds)"""
+    if isinstance(x, (pd.Index, pd.Series)) and pd.api.types.is_datetime64_any_dtype(x):
+        return pd.DatetimeIndex(x).asi8.astype(float)
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+
+def lttb(x, y, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the first and last points and, from each bucket in between, the point
+    forming the largest triangle with the previously kept point and the mean of
+    the next bucket, which preserves peaks and troughs of line charts.
+
+    Args:
+        x: X coordinates (numbers or datetimes), increasing
+        y: Y values
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = _as_float(x)
+    y = np.asarray(y, dtype=float)
+
+    # threshold - 2 buckets over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def downsample_series(series: pd.Series, max_points: int = DEFAULT_MAX_POINTS) -> pd.Series:
+    """Downsample a line series with LTTB"""
+    series = series.dropna()
+    return series.iloc[lttb(series.index, series.to_numpy(), max_points)]
+
+
+@timed("core.downsampling.aggregate_ohlcv")
+def aggregate_ohlcv(bars: pd.DataFrame, max_bars: int = DEFAULT_MAX_POINTS) -> pd.DataFrame:
+    """
+    Merge consecutive OHLCV bars into at most max_bars candles
+
+    Each candle keeps the first Open, highest High, lowest Low, last Close, and
+    summed Volume of its bucket, indexed by the bucket's first timestamp.
+
+    Args:
+        bars: DataFrame with Open/High/Low/Close and optionally Volume columns
+        max_bars: Maximum number of output candles
+
+    Returns:
+        Aggregated DataFrame (the input itself if it is already small enough)
+    """
+    n = len(bars)
+    if n <= max_bars:
+        return bars
+
+    starts = np.linspace(0, n, max_bars, endpoint=False).astype(int)
+    ends = np.r_[starts[1:], n] - 1
+
+    columns = {
+        "Open": bars["Open"].to_numpy()[starts],
+        "High": np.fmax.reduceat(bars["High"].to_numpy(dtype=float), starts),
+        "Low": np.fmin.reduceat(bars["Low"].to_numpy(dtype=float), starts),
+        "Close": bars["Close"].to_numpy()[ends],
+    }
+    if "Volume" in bars:
+        columns["Volume"] = np.add.reduceat(bars["Volume"].fillna(0).to_numpy(), starts)
+
+    return pd.DataFrame(columns, index=bars.index[starts])
+
+
+@timed("core.downsampling.percentile_bands")
+def percentile_bands(paths, percentiles: Sequence[float] = (5, 25, 50, 75, 95),
+                     index: Optional[pd.Index] = None,
+                     max_points: Optional[int] = DEFAULT_MAX_POINTS) -> pd.DataFrame:
+    """
+    Summarize simulated paths as percentile bands
+
+    Args:
+        paths: Array of shape (simulations, steps)
+        percentiles: Percentiles to compute
+        index: Optional labels for the steps (e.g. future dates)
+        max_points: Maximum steps kept (evenly spaced, always including the last)
+
+    Returns:
+        DataFrame of steps x 'p5', 'p25', ... columns
+    """
+    paths = np.asarray(paths, dtype=float)
+    bands = np.percentile(paths, percentiles, axis=0).T
+    steps = bands.shape[0]
+    index = index if index is not None else pd.RangeIndex(steps)
+
+    if max_points and steps > max_points:
+        keep = np.unique(np.linspace(0, steps - 1, max_points).round().astype(int))
+        bands, index = bands[keep], index[keep]
+
+    return pd.DataFrame(bands, index=index, columns=[f"p{p:g}" for p in percentiles])
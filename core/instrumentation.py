@@ -0,0 +1,285 @@
+"""Instrumentation Module
+
+Lightweight timers, counters, and memory high-water marks for hot paths
+"""
+
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Disabled unless FINLEARNX_METRICS=1 or enable() is called; when disabled
+# every hook is a single flag check.
+_enabled = os.environ.get("FINLEARNX_METRICS", "0") == "1"
+
+# Whether trace_allocations() started tracemalloc (and so should stop it again)
+_owns_tracing = False
+
+
+class MetricsRegistry:
+    """Process-wide store of timer, counter, and gauge values"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded metrics"""
+        with self._lock:
+            self.timers = {}
+            self.counters = {}
+            self.gauges = {}
+            self.last_profile = None
+
+    def observe(self, name: str, seconds: float):
+        """Record one timed call"""
+        with self._lock:
+            stats = self.timers.get(name)
+            if stats is None:
+                self.timers[name] = {"count": 1, "total": seconds, "max": seconds}
+            else:
+                stats["count"] += 1
+                stats["total"] += seconds
+                stats["max"] = max(stats["max"], seconds)
+
+    def increment(self, name: str, value: float = 1):
+        """Add to a counter"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def high_water(self, name: str, value: float):
+        """Raise a gauge to value if it is higher"""
+        with self._lock:
+            if value > self.gauges.get(name, 0):
+                self.gauges[name] = value
+
+    def snapshot(self) -> Dict:
+        """Copy of all metrics"""
+        with self._lock:
+            return {
+                "timers": {name: dict(stats) for name, stats in self.timers.items()},
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+            }
+
+
+registry = MetricsRegistry()
+
+
+def enable(flag: bool = True):
+    """Turn instrumentation on or off"""
+    global _enabled
+    _enabled = flag
+
+
+def trace_allocations(flag: bool = True):
+    """
+    Start or stop tracemalloc for the traced_peak_bytes gauge
+
+    Separate from enable() because tracing slows every allocation in the
+    process; stopping only affects tracing this function started.
+    """
+    global _owns_tracing
+    if flag and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _owns_tracing = True
+    elif not flag and _owns_tracing:
+        tracemalloc.stop()
+        _owns_tracing = False
+
+
+if os.environ.get("FINLEARNX_TRACE_MALLOC", "0") == "1":
+    trace_allocations()
+
+
+def is_enabled() -> bool:
+    """Whether instrumentation is recording"""
+    return _enabled
+
+
+def record_memory():
+    """Update process and traced-allocation memory high-water marks"""
+    if resource is not None:
+        # ru_maxrss is kilobytes on Linux
+        registry.high_water("process_max_rss_bytes", resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+    if tracemalloc.is_tracing():
+        registry.high_water("traced_peak_bytes", tracemalloc.get_traced_memory()[1])
+
+
+class _Timer:
+    """Context manager recording elapsed time under a metric name"""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        registry.observe(self.name, time.perf_counter() - self.start)
+        record_memory()
+        return False
+
+
+class _NoopTimer:
+    """Shared do-nothing context manager used while disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopTimer()
+
+
+def timer(name: str):
+    """
+    Time a block of code
+
+    Example:
+        with timer("portfolio.optimize_sharpe"):
+            ...
+    """
+    return _Timer(name) if _enabled else _NOOP
+
+
+def timed(name: Optional[str] = None):
+    """
+    Decorator timing every call of a function
+
+    Args:
+        name: Metric name (defaults to module.qualname)
+    """
+    def decorator(func):
+        metric = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Timer(metric):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, value: float = 1):
+    """Increment a counter (e.g. network calls, cache hits)"""
+    if _enabled:
+        registry.increment(name, value)
+
+
+def _metric_name(name: str) -> str:
+    """Prometheus-safe metric name"""
+    return "finlearnx_" + "".join(c if c.isalnum() else "_" for c in name)
+
+
+def render_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    snapshot = registry.snapshot()
+    lines = []
+
+    for name, value in sorted(snapshot["counters"].items()):
+        metric = _metric_name(name) + "_total"
+        lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+    for name, stats in sorted(snapshot["timers"].items()):
+        metric = _metric_name(name) + "_seconds"
+        lines += [
+            f"# TYPE {metric} summary",
+            f"{metric}_count {stats['count']}",
+            f"{metric}_sum {stats['total']:.6f}",
+            f"# TYPE {metric}_max gauge",
+            f"{metric}_max {stats['max']:.6f}",
+        ]
+
+    for name, value in sorted(snapshot["gauges"].items()):
+        metric = _metric_name(name)
+        lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: str):
+    """Write metrics to a file (JSON for .json paths, Prometheus text otherwise)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    with open(path, "w") as f:
+        if path.endswith(".json"):
+            json.dump(registry.snapshot(), f, indent=2, sort_keys=True)
+        else:
+            f.write(render_prometheus())
+
+
+def serve_prometheus(port: int = 9108, host: str = "127.0.0.1"):
+    """
+    Serve render_prometheus() at http://host:port/metrics from a daemon thread
+
+    Returns:
+        The running HTTPServer
+    """
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = HTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_profile() -> cProfile.Profile:
+    """Start a cProfile capture (e.g. at the top of a Streamlit rerun)"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_profile(profiler: Optional[cProfile.Profile], limit: int = 30) -> Optional[str]:
+    """
+    Stop a capture and keep its top functions by cumulative time
+
+    Returns:
+        Formatted pstats report, also stored as registry.last_profile
+    """
+    if profiler is None:
+        return None
+
+    profiler.disable()
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    registry.last_profile = stream.getvalue()
+    return registry.last_profile
@@ -0,0 +1,286 @@
+"""Price Refresh Scheduler
+
+Background thread that refreshes quotes for every ticker any session watches
+and publishes them as an immutable snapshot shared by all sessions
+"""
+
+import logging
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from core.instrumentation import count, timed
+from core.lazy import lazy_import
+
+yf = lazy_import("yfinance")
+
+logger = logging.getLogger(__name__)
+
+
+class PriceSource(ABC):
+    """Interface for batch quote providers"""
+
+    @abstractmethod
+    def fetch(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Latest prices for a batch of tickers
+
+        Returns:
+            Ticker -> price for every ticker that could be priced
+        """
+
+
+class YFinanceSource(PriceSource):
+    """Latest closes from one yfinance download per batch"""
+
+    def __init__(self, period: str = "5d", interval: str = "1d"):
+        self.period = period
+        self.interval = interval
+
+    def fetch(self, tickers: List[str]) -> Dict[str, float]:
+        count("network.yf_download")
+        data = yf.download(tickers, period=self.period, interval=self.interval,
+                           progress=False, auto_adjust=False)
+        if data.empty:
+            return {}
+
+        close = data["Close"]
+        if isinstance(close, pd.Series):
+            close = close.to_frame(tickers[0])
+
+        last = close.ffill().iloc[-1]
+        return {ticker: float(price) for ticker, price in last.items() if pd.notna(price)}
+
+
+class StaticPriceSource(PriceSource):
+    """In-memory prices for tests and offline use; records each batch requested"""
+
+    def __init__(self, prices: Optional[Dict[str, float]] = None):
+        self.prices = dict(prices or {})
+        self.batches = []
+
+    def set(self, ticker: str, price: float):
+        self.prices[ticker] = price
+
+    def fetch(self, tickers: List[str]) -> Dict[str, float]:
+        self.batches.append(list(tickers))
+        return {ticker: self.prices[ticker] for ticker in tickers if ticker in self.prices}
+
+
+class PriceSnapshot:
+    """Immutable set of quotes published by one refresh"""
+
+    __slots__ = ("prices", "updated", "version", "as_of")
+
+    def __init__(self, prices: Dict[str, float], updated: Dict[str, float], version: int, as_of: float):
+        object.__setattr__(self, "prices", MappingProxyType(dict(prices)))
+        object.__setattr__(self, "updated", MappingProxyType(dict(updated)))
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "as_of", as_of)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PriceSnapshot is immutable")
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.prices
+
+    def get(self, ticker: str, default=None):
+        """Latest price for a ticker, or default if never fetched"""
+        return self.prices.get(ticker, default)
+
+    def age(self, ticker: str, now: Optional[float] = None) -> Optional[float]:
+        """Seconds since the ticker's price was last refreshed"""
+        updated = self.updated.get(ticker)
+        if updated is None:
+            return None
+        return (now if now is not None else time.time()) - updated
+
+
+EMPTY_SNAPSHOT = PriceSnapshot({}, {}, 0, 0.0)
+
+
+class PriceScheduler:
+    """
+    Refresh the union of watched tickers on a jittered cadence
+
+    Sessions register tickers with watch() on every rerun, which doubles as a
+    heartbeat; sessions not seen for session_ttl seconds stop being refreshed.
+    Readers only ever dereference `snapshot`, which is replaced atomically.
+    """
+
+    def __init__(self, source: PriceSource, interval: float = 30.0, jitter: float = 0.1,
+                 batch_size: int = 50, session_ttl: float = 600.0,
+                 clock: Callable[[], float] = time.time, seed: Optional[int] = None):
+        """
+        Args:
+            source: Quote provider
+            interval: Seconds between refreshes
+            jitter: Relative random spread of the interval (0.1 = +/-10%)
+            batch_size: Maximum tickers per source request
+            session_ttl: Seconds before an inactive session's tickers are dropped
+            clock: Time function (injectable for tests)
+            seed: Random seed for the jitter
+        """
+        self.source = source
+        self.interval = interval
+        self.jitter = jitter
+        self.batch_size = batch_size
+        self.session_ttl = session_ttl
+        self.clock = clock
+        self.snapshot = EMPTY_SNAPSHOT
+
+        self._rng = random.Random(seed)
+        self._watchers = {}
+        self._requested = set()
+        self._tasks = []
+        self._lock = threading.Lock()
+        self._published = threading.Condition()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def watch(self, session_id: str, tickers: Iterable[str]):
+        """
+        Set the tickers a session needs
+
+        Wakes the refresher early only for tickers never requested before;
+        tickers that were requested but could not be priced (delisted, rate
+        limited) wait for the regular cadence.
+
+        Args:
+            session_id: Unique session identifier
+            tickers: Ticker symbols the session displays
+        """
+        tickers = frozenset(tickers)
+        with self._lock:
+            self._watchers[session_id] = (tickers, self.clock())
+            unseen = not tickers <= self._requested
+
+        if unseen:
+            self._wake.set()
+
+    def unwatch(self, session_id: str):
+        """Stop refreshing a session's tickers"""
+        with self._lock:
+            self._watchers.pop(session_id, None)
+
+    def watched(self) -> List[str]:
+        """Sorted union of tickers watched by active sessions"""
+        cutoff = self.clock() - self.session_ttl
+        with self._lock:
+            expired = [sid for sid, (_, seen) in self._watchers.items() if seen < cutoff]
+            for sid in expired:
+                del self._watchers[sid]
+            return sorted(set().union(*(tickers for tickers, _ in self._watchers.values())))
+
+    @timed("core.price_scheduler.refresh")
+    def refresh_now(self) -> PriceSnapshot:
+        """
+        Fetch every watched ticker in batches and publish a new snapshot
+
+        Tickers whose batch fails keep their previous (stale) price.
+        """
+        tickers = self.watched()
+        previous = self.snapshot
+        prices = dict(previous.prices)
+        updated = dict(previous.updated)
+
+        with self._lock:
+            self._requested.update(tickers)
+
+        for start in range(0, len(tickers), self.batch_size):
+            batch = tickers[start:start + self.batch_size]
+            try:
+                fetched = self.source.fetch(batch)
+            except Exception:
+                count("price_scheduler.batch_errors")
+                continue
+
+            now = self.clock()
+            for ticker, price in fetched.items():
+                prices[ticker] = price
+                updated[ticker] = now
+
+        snapshot = PriceSnapshot(prices, updated, previous.version + 1, self.clock())
+        with self._published:
+            self.snapshot = snapshot
+            self._published.notify_all()
+        return snapshot
+
+    def every(self, seconds: float, task: Callable[[], object]):
+        """
+        Run a task on the refresh thread every `seconds`
+
+        The first run happens on the next wake-up (triggered immediately), so
+        slow work such as recomputing daily statistics stays off page renders.
+
+        Args:
+            seconds: Minimum seconds between runs
+            task: Callable taking no arguments
+        """
+        with self._lock:
+            self._tasks.append([task, seconds, self.clock()])
+        self._wake.set()
+
+    def run_due_tasks(self) -> int:
+        """Run periodic tasks whose time has come; returns how many ran"""
+        now = self.clock()
+        with self._lock:
+            due = [entry for entry in self._tasks if entry[2] <= now]
+            for entry in due:
+                entry[2] = now + entry[1]
+
+        for task, _, _ in due:
+            try:
+                task()
+            except Exception:
+                count("price_scheduler.task_errors")
+                logger.warning("Scheduled task %r failed", task, exc_info=True)
+        return len(due)
+
+    def next_delay(self) -> float:
+        """Seconds until the next refresh, with jitter applied"""
+        return self.interval * (1 + self._rng.uniform(-self.jitter, self.jitter))
+
+    def wait_for(self, tickers: Iterable[str], timeout: float = 5.0) -> PriceSnapshot:
+        """
+        Block until every ticker has a price or the timeout passes
+
+        Returns:
+            The latest snapshot (which may still lack some tickers)
+        """
+        tickers = set(tickers)
+        with self._published:
+            self._published.wait_for(lambda: tickers <= self.snapshot.prices.keys(), timeout)
+            return self.snapshot
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.refresh_now()
+            except Exception:
+                count("price_scheduler.refresh_errors")
+            self.run_due_tasks()
+            self._wake.wait(self.next_delay())
+
+    def start(self) -> "PriceScheduler":
+        """Start the background refresh thread (idempotent)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="price-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background thread"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,222 @@
+"""Education Content Catalog
+
+Indexed access to the learning modules with a compiled binary cache
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from typing import Dict, List, Optional
+
+import yaml
+
+MODULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modules")
+DEFAULT_CACHE_PATH = "./data/cache/education_catalog.pkl"
+
+# Bump whenever the compiled layout changes so stale caches are rebuilt
+CATALOG_VERSION = 1
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "basics", "for", "how", "in", "is", "of", "on",
+    "the", "to", "what", "why", "with", "vs",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords"""
+    return [token for token in re.findall(r"[a-z0-9]+", str(text).lower()) if token not in STOPWORDS]
+
+
+class ContentCatalog:
+    """Learning modules compiled into lookup and search indexes
+
+    YAML is parsed only when the module files change. The compiled indexes
+    are pickled to a versioned cache; a file signature (mtime and size)
+    detects changes cheaply and content hashes confirm them, so a touched
+    but unchanged file does not force a rebuild.
+    """
+
+    def __init__(self, modules_dir: str = MODULES_DIR, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
+        self.modules_dir = modules_dir
+        self.cache_path = cache_path
+        self._data = None
+        self.refresh()
+
+    def _files(self) -> List[str]:
+        """Module YAML files in a stable order"""
+        return sorted(
+            os.path.join(self.modules_dir, name)
+            for name in os.listdir(self.modules_dir)
+            if name.endswith((".yaml", ".yml"))
+        )
+
+    def _signature(self, files: List[str]) -> tuple:
+        """Cheap change detector: (name, mtime, size) per file"""
+        signature = []
+        for path in files:
+            stat = os.stat(path)
+            signature.append((os.path.basename(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    @staticmethod
+    def _hashes(files: List[str]) -> Dict[str, str]:
+        """Content hash per file"""
+        hashes = {}
+        for path in files:
+            with open(path, "rb") as f:
+                hashes[os.path.basename(path)] = hashlib.sha256(f.read()).hexdigest()
+        return hashes
+
+    def refresh(self) -> bool:
+        """
+        Make sure the indexes reflect the module files
+
+        Returns:
+            True if the YAML was re-parsed
+        """
+        files = self._files()
+        signature = self._signature(files)
+
+        if self._data is not None and self._data["signature"] == signature:
+            return False
+
+        if self._data is None:
+            self._data = self._read_cache()
+            if self._data is not None and self._data["signature"] == signature:
+                return False
+
+        hashes = self._hashes(files)
+        if self._data is not None and self._data["hashes"] == hashes:
+            self._data["signature"] = signature
+            self._write_cache()
+            return False
+
+        self._data = self._compile(files, signature, hashes)
+        self._write_cache()
+        return True
+
+    def _read_cache(self) -> Optional[dict]:
+        """Load the compiled catalog if it exists and matches this version"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            return None
+
+        if data.get("version") != CATALOG_VERSION or data.get("modules_dir") != self.modules_dir:
+            return None
+        return data
+
+    def _write_cache(self):
+        """Persist the compiled catalog atomically"""
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self._data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.cache_path)
+
+    def _compile(self, files: List[str], signature: tuple, hashes: Dict[str, str]) -> dict:
+        """Parse every module file and build the indexes"""
+        modules = {}
+        case_studies = []
+        by_difficulty = {}
+        by_topic = {}
+        by_level = {}
+        inverted = {}
+
+        for path in files:
+            level = os.path.splitext(os.path.basename(path))[0]
+            with open(path, "r", encoding="utf-8") as f:
+                content = yaml.safe_load(f) or {}
+
+            for module in content.get("modules", []):
+                module = dict(module, level=level)
+                module_id = module["id"]
+                modules[module_id] = module
+
+                by_level.setdefault(level, []).append(module_id)
+                by_difficulty.setdefault(module.get("difficulty", level), []).append(module_id)
+                for topic in module.get("topics", []):
+                    by_topic.setdefault(topic.lower(), []).append(module_id)
+
+                text = " ".join([module.get("title", ""), module.get("description", "")] + module.get("topics", []))
+                for token in set(tokenize(text)):
+                    inverted.setdefault(token, []).append(module_id)
+
+            for case_study in content.get("case_studies", []):
+                case_studies.append(dict(case_study, level=level))
+
+        return {
+            "version": CATALOG_VERSION,
+            "modules_dir": self.modules_dir,
+            "signature": signature,
+            "hashes": hashes,
+            "modules": modules,
+            "order": {module_id: i for i, module_id in enumerate(modules)},
+            "case_studies": case_studies,
+            "by_difficulty": by_difficulty,
+            "by_topic": by_topic,
+            "by_level": by_level,
+            "inverted": {token: frozenset(ids) for token, ids in inverted.items()},
+        }
+
+    @property
+    def modules(self) -> List[dict]:
+        """All modules in curriculum order"""
+        return list(self._data["modules"].values())
+
+    @property
+    def case_studies(self) -> List[dict]:
+        """All case studies"""
+        return self._data["case_studies"]
+
+    def get(self, module_id: str) -> Optional[dict]:
+        """Module by id"""
+        return self._data["modules"].get(module_id)
+
+    def by_difficulty(self, difficulty: str) -> List[dict]:
+        """Modules at a difficulty level"""
+        return [self._data["modules"][i] for i in self._data["by_difficulty"].get(difficulty, [])]
+
+    def by_topic(self, topic: str) -> List[dict]:
+        """Modules covering a topic (case-insensitive exact match)"""
+        return [self._data["modules"][i] for i in self._data["by_topic"].get(topic.lower(), [])]
+
+    def search(self, query: str) -> List[dict]:
+        """
+        Modules whose title, description, or topics contain every query word
+
+        Args:
+            query: Free-text search query
+
+        Returns:
+            Matching modules in curriculum order
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        inverted = self._data["inverted"]
+        postings = sorted((inverted.get(token, frozenset()) for token in tokens), key=len)
+        matches = postings[0].intersection(*postings[1:])
+
+        order = self._data["order"]
+        return [self._data["modules"][module_id] for module_id in sorted(matches, key=order.get)]
+
+
+_catalog = None
+
+
+def get_catalog() -> ContentCatalog:
+    """Shared catalog instance, refreshed only when module files change"""
+    global _catalog
+    if _catalog is None:
+        _catalog = ContentCatalog()
+    else:
+        _catalog.refresh()
+    return _catalog
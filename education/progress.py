@@ -0,0 +1,172 @@
+"""Quiz Grading and Learner Progress
+
+Vectorized grading with incrementally maintained mastery statistics
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional
+
+UNANSWERED = -1
+
+
+class QuizGrader:
+    """Answer key compiled from the catalog's module quizzes"""
+
+    def __init__(self, catalog):
+        """
+        Args:
+            catalog: ContentCatalog providing modules with 'quiz' items
+        """
+        self.question_ids = []
+        answers = []
+        question_module = []
+        self.module_ids = []
+
+        for module in catalog.modules:
+            quiz = module.get("quiz") or []
+            if not quiz:
+                continue
+            self.module_ids.append(module["id"])
+            for i, item in enumerate(quiz):
+                self.question_ids.append(f"{module['id']}:{i}")
+                answers.append(item["answer"])
+                question_module.append(len(self.module_ids) - 1)
+
+        self.question_index = {question_id: i for i, question_id in enumerate(self.question_ids)}
+        self.answer_key = np.array(answers, dtype=np.int8)
+        self.question_module = np.array(question_module, dtype=np.int32)
+        self.questions_per_module = np.bincount(self.question_module, minlength=len(self.module_ids))
+
+    def grade(self, responses: np.ndarray) -> np.ndarray:
+        """
+        Grade a whole cohort in one comparison
+
+        Args:
+            responses: Learners x questions answer indexes (-1 for unanswered)
+
+        Returns:
+            Boolean learners x questions matrix of correct answers
+        """
+        return np.asarray(responses) == self.answer_key
+
+
+class ProgressTracker:
+    """Learner x question answer matrix with incremental aggregates
+
+    Answers are stored as int8 option indexes. Per-question attempt/correct
+    counts and per-learner module scores are updated in O(1) per answer, so
+    dashboards read cached aggregates rather than rescanning history.
+    """
+
+    def __init__(self, grader: QuizGrader, capacity: int = 64, mastery_threshold: float = 0.8):
+        self.grader = grader
+        self.mastery_threshold = mastery_threshold
+        self.learner_index = {}
+
+        num_questions = len(grader.question_ids)
+        self.responses = np.full((capacity, num_questions), UNANSWERED, dtype=np.int8)
+        self.module_correct = np.zeros((capacity, len(grader.module_ids)), dtype=np.int32)
+        self.attempts = np.zeros(num_questions, dtype=np.int64)
+        self.correct = np.zeros(num_questions, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def _learner_row(self, learner_id: str) -> int:
+        """Row for a learner, growing the arrays geometrically when full"""
+        row = self.learner_index.get(learner_id)
+        if row is not None:
+            return row
+
+        row = len(self.learner_index)
+        if row == self.responses.shape[0]:
+            extra = self.responses.shape[0]
+            self.responses = np.vstack([self.responses, np.full((extra, self.responses.shape[1]), UNANSWERED, dtype=np.int8)])
+            self.module_correct = np.vstack([self.module_correct, np.zeros((extra, self.module_correct.shape[1]), dtype=np.int32)])
+
+        self.learner_index[learner_id] = row
+        return row
+
+    def record(self, learner_id: str, question_id: str, answer: int) -> bool:
+        """
+        Record one answer, replacing any previous answer to the same question
+
+        Returns:
+            Whether the answer is correct
+        """
+        return bool(self.record_batch([learner_id], [question_id], [answer])[0])
+
+    def record_batch(self, learner_ids: List[str], question_ids: List[str], answers) -> np.ndarray:
+        """
+        Record many answers at once
+
+        Returns:
+            Boolean array of correct answers
+        """
+        with self._lock:
+            rows = np.array([self._learner_row(learner_id) for learner_id in learner_ids], dtype=np.int64)
+            cols = np.array([self.grader.question_index[q] for q in question_ids], dtype=np.int64)
+            answers = np.asarray(answers, dtype=np.int8)
+
+            is_correct = answers == self.grader.answer_key[cols]
+
+            # Only the last answer per (learner, question) in the batch counts
+            keys = rows * self.responses.shape[1] + cols
+            _, last = np.unique(keys[::-1], return_index=True)
+            keep = len(keys) - 1 - last
+            rows, cols, answers = rows[keep], cols[keep], answers[keep]
+            modules = self.grader.question_module[cols]
+
+            # Remove the contribution of answers being replaced
+            previous = self.responses[rows, cols]
+            answered = previous != UNANSWERED
+            was_correct = answered & (previous == self.grader.answer_key[cols])
+            np.subtract.at(self.attempts, cols[answered], 1)
+            np.subtract.at(self.correct, cols[was_correct], 1)
+            np.subtract.at(self.module_correct, (rows[was_correct], modules[was_correct]), 1)
+
+            now_correct = is_correct[keep]
+            self.responses[rows, cols] = answers
+            np.add.at(self.attempts, cols, 1)
+            np.add.at(self.correct, cols[now_correct], 1)
+            np.add.at(self.module_correct, (rows[now_correct], modules[now_correct]), 1)
+
+        return is_correct
+
+    def grade_cohort(self) -> np.ndarray:
+        """Correct-answer matrix for every tracked learner"""
+        return self.grader.grade(self.responses[:len(self.learner_index)])
+
+    def item_difficulty(self) -> Dict[str, float]:
+        """Share of attempts answered correctly per question (NaN if unattempted)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p_values = self.correct / self.attempts
+        return dict(zip(self.grader.question_ids, p_values.tolist()))
+
+    def module_mastery(self, learner_id: str) -> Dict[str, float]:
+        """Fraction of each module's questions the learner answered correctly"""
+        row = self.learner_index.get(learner_id)
+        if row is None:
+            return {module_id: 0.0 for module_id in self.grader.module_ids}
+
+        mastery = self.module_correct[row] / np.maximum(self.grader.questions_per_module, 1)
+        return dict(zip(self.grader.module_ids, mastery.tolist()))
+
+    def dashboard_metrics(self, learner_id: Optional[str] = None) -> Dict:
+        """
+        Progress summary for the home dashboard
+
+        Args:
+            learner_id: Learner to summarize
+
+        Returns:
+            Dictionary with completed module count, total, and progress percentage
+        """
+        total = len(self.grader.module_ids)
+        mastery = np.array(list(self.module_mastery(learner_id).values()))
+        completed = int((mastery >= self.mastery_threshold).sum()) if total else 0
+
+        return {
+            "modules_completed": completed,
+            "modules_total": total,
+            "progress_pct": completed / total * 100 if total else 0.0,
+        }
@@ -5,8 +5,13 @@ Simulate portfolio outcomes and price projections
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
+from core.instrumentation import timed
+from core.lazy import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+
+@timed("models.monte_carlo_simulation")
 def monte_carlo_simulation(price_series, days=252, simulations=1000):
     """
     Run Monte Carlo simulation for price projections
@@ -38,6 +43,7 @@ def monte_carlo_simulation(price_series, days=252, simulations=1000):
     
     return np.array(simulation_results)
 
+@timed("models.portfolio_monte_carlo")
 def portfolio_monte_carlo(returns, weights, initial_value=100000, days=252, simulations=1000):
     """
     Monte Carlo simulation for portfolio
@@ -5,19 +5,40 @@ Mean-variance optimization for portfolio construction
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize
-import yfinance as yf
+
+from core.instrumentation import count, timed
+from core.lazy import lazy_import
+
+yf = lazy_import("yfinance")
+optimize = lazy_import("scipy.optimize")
 
 class MPTOptimizer:
     """Portfolio optimization using Mean-Variance theory"""
     
     def __init__(self, tickers, start_date, end_date):
         self.tickers = tickers
+        count("network.yf_download")
         self.data = yf.download(tickers, start=start_date, end=end_date)['Adj Close']
         self.returns = self.data.pct_change().dropna()
         self.mean_returns = self.returns.mean()
         self.cov_matrix = self.returns.cov()
     
+    @classmethod
+    def from_prices(cls, prices):
+        """
+        Create an optimizer from already loaded prices (no download)
+        
+        Args:
+            prices: DataFrame of adjusted closes, dates x tickers
+        """
+        optimizer = cls.__new__(cls)
+        optimizer.tickers = list(prices.columns)
+        optimizer.data = prices
+        optimizer.returns = prices.pct_change().dropna()
+        optimizer.mean_returns = optimizer.returns.mean()
+        optimizer.cov_matrix = optimizer.returns.cov()
+        return optimizer
+    
     def portfolio_performance(self, weights):
         """Calculate portfolio return and volatility"""
         returns = np.sum(self.mean_returns * weights) * 252
@@ -29,6 +50,7 @@ class MPTOptimizer:
         returns, std = self.portfolio_performance(weights)
         return -(returns - risk_free_rate) / std
     
+    @timed("portfolio.optimize_sharpe")
     def optimize_sharpe(self):
         """Optimize for maximum Sharpe ratio"""
         num_assets = len(self.tickers)
@@ -36,7 +58,7 @@ class MPTOptimizer:
         bounds = tuple((0, 1) for _ in range(num_assets))
         initial_guess = num_assets * [1. / num_assets]
         
-        result = minimize(
+        result = optimize.minimize(
             self.neg_sharpe_ratio,
             initial_guess,
             method='SLSQP',
@@ -46,6 +68,7 @@ class MPTOptimizer:
         
         return result.x
     
+    @timed("portfolio.optimize_min_volatility")
     def optimize_min_volatility(self):
         """Optimize for minimum volatility"""
         num_assets = len(self.tickers)
@@ -57,7 +80,7 @@ class MPTOptimizer:
         bounds = tuple((0, 1) for _ in range(num_assets))
         initial_guess = num_assets * [1. / num_assets]
         
-        result = minimize(
+        result = optimize.minimize(
             portfolio_volatility,
             initial_guess,
             method='SLSQP',
@@ -67,6 +90,7 @@ class MPTOptimizer:
         
         return result.x
     
+    @timed("portfolio.efficient_frontier")
     def efficient_frontier(self, num_portfolios=100):
         """Generate efficient frontier"""
         results = np.zeros((3, num_portfolios))
@@ -0,0 +1,176 @@
+"""Trade Replay and Performance Attribution
+
+Reconstruct daily NAV, realized/unrealized P&L, and per-ticker contribution
+from a transaction history and a price panel
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from core.instrumentation import timed
+
+
+def _trade_frame(transactions: List[Dict]) -> pd.DataFrame:
+    """Transactions as a DataFrame in execution order with signed quantities"""
+    if transactions:
+        trades = pd.DataFrame(transactions)
+    else:
+        trades = pd.DataFrame(columns=["type", "ticker", "quantity", "price", "date"])
+    trades["date"] = pd.to_datetime(trades["date"])
+
+    # Ledger histories are newest first; its ids break ties within a timestamp
+    order = ["date", "id"] if "id" in trades else ["date"]
+    trades = trades.sort_values(order, kind="stable").reset_index(drop=True)
+
+    side = np.where(trades["type"].str.upper() == "BUY", 1.0, -1.0)
+    trades["signed_quantity"] = side * trades["quantity"].astype(float)
+    return trades
+
+
+def _average_cost_pass(tickers: np.ndarray, quantities: np.ndarray, prices: np.ndarray):
+    """
+    Single pass over trades tracking average cost per ticker
+
+    Returns:
+        Per-trade realized P&L and change in remaining cost basis
+    """
+    realized = np.zeros(len(quantities))
+    basis_change = np.zeros(len(quantities))
+    position = {}
+    basis = {}
+
+    for i in range(len(quantities)):
+        ticker, quantity, price = tickers[i], quantities[i], prices[i]
+        held = position.get(ticker, 0.0)
+        cost = basis.get(ticker, 0.0)
+
+        if quantity > 0:
+            basis_change[i] = quantity * price
+        elif held > 0:
+            average = cost / held
+            realized[i] = -quantity * (price - average)
+            basis_change[i] = quantity * average
+
+        position[ticker] = held + quantity
+        basis[ticker] = cost + basis_change[i]
+
+    return realized, basis_change
+
+
+class TradeReplay:
+    """Replay transaction histories against a daily price panel"""
+
+    def __init__(self, prices: pd.DataFrame):
+        """
+        Args:
+            prices: Closing prices, dates x tickers
+        """
+        prices = prices.sort_index()
+        prices.index = pd.DatetimeIndex(prices.index).normalize()
+        self.prices = prices
+
+    @timed("simulations.attribution.replay")
+    def replay(self, transactions: List[Dict], initial_capital: float = 100000) -> Dict:
+        """
+        Reconstruct the account day by day
+
+        Trades are applied at the close of their date (or of the next date in the
+        panel); trades after the last date are applied on the last date. Prices
+        are forward-filled, and back-filled before a ticker's first quote; a
+        ticker with no quotes in the panel is marked at its latest trade price.
+
+        Args:
+            transactions: Dicts with type ('BUY'/'SELL'), ticker, quantity, price, date
+                (TradingSimulator.transaction_history or LedgerStore.transaction_history)
+            initial_capital: Starting cash
+
+        Returns:
+            Dictionary with nav, cash, and returns Series; positions, market_value,
+            realized_pnl, unrealized_pnl, and contribution DataFrames (dates x tickers,
+            cumulative); and a per-ticker summary DataFrame
+        """
+        trades = _trade_frame(transactions)
+        dates = self.prices.index
+        tickers = sorted(set(trades["ticker"]))
+        ticker_pos = {ticker: j for j, ticker in enumerate(tickers)}
+        shape = (len(dates), len(tickers))
+
+        rows = np.minimum(dates.searchsorted(trades["date"].dt.normalize(), side="left"), len(dates) - 1)
+        cols = trades["ticker"].map(ticker_pos).to_numpy(dtype=int)
+        quantities = trades["signed_quantity"].to_numpy(dtype=float)
+        trade_prices = trades["price"].to_numpy(dtype=float)
+
+        realized, basis_change = _average_cost_pass(trades["ticker"].to_numpy(), quantities, trade_prices)
+
+        # Per-trade deltas scattered onto the date grid, then accumulated once
+        def accumulate(values):
+            deltas = np.zeros(shape)
+            np.add.at(deltas, (rows, cols), values)
+            return np.cumsum(deltas, axis=0)
+
+        positions = accumulate(quantities)
+        cost_basis = accumulate(basis_change)
+        realized_pnl = accumulate(realized)
+        cash = initial_capital + np.cumsum(np.bincount(rows, weights=-quantities * trade_prices, minlength=len(dates)))
+
+        marks = self.prices.reindex(columns=tickers).ffill().bfill().to_numpy(dtype=float)
+
+        # Latest trade price as of each date, for tickers missing from the panel
+        last_trade = np.full(shape, np.nan)
+        last_trade[rows, cols] = trade_prices
+        last_trade = pd.DataFrame(last_trade).ffill().to_numpy()
+        marks = np.where(np.isnan(marks), last_trade, marks)
+        market_value = np.nan_to_num(positions * marks)
+        unrealized_pnl = market_value - cost_basis
+        contribution = realized_pnl + unrealized_pnl
+        nav = cash + market_value.sum(axis=1)
+
+        def frame(values):
+            return pd.DataFrame(values, index=dates, columns=tickers)
+
+        nav = pd.Series(nav, index=dates, name="nav")
+
+        final_positions = positions[-1] if len(dates) else np.zeros(len(tickers))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            average_cost = np.where(final_positions > 0, cost_basis[-1] / final_positions, 0.0)
+
+        summary = pd.DataFrame({
+            "position": final_positions,
+            "average_cost": average_cost,
+            "market_value": market_value[-1],
+            "realized_pnl": realized_pnl[-1],
+            "unrealized_pnl": unrealized_pnl[-1],
+            "total_pnl": contribution[-1],
+            "contribution_pct": contribution[-1] / initial_capital * 100,
+        }, index=pd.Index(tickers, name="ticker"))
+
+        return {
+            "nav": nav,
+            "cash": pd.Series(cash, index=dates, name="cash"),
+            "returns": nav.pct_change().fillna(nav.iloc[0] / initial_capital - 1),
+            "positions": frame(positions),
+            "market_value": frame(market_value),
+            "realized_pnl": frame(realized_pnl),
+            "unrealized_pnl": frame(unrealized_pnl),
+            "contribution": frame(contribution),
+            "summary": summary,
+        }
+
+    def replay_simulator(self, simulator, initial_capital: Optional[float] = None) -> Dict:
+        """
+        Replay a TradingSimulator and fill its portfolio_value_history
+
+        Args:
+            simulator: TradingSimulator instance
+            initial_capital: Overrides simulator.initial_capital
+
+        Returns:
+            Same dictionary as replay()
+        """
+        capital = simulator.initial_capital if initial_capital is None else initial_capital
+        result = self.replay(simulator.transaction_history, capital)
+        simulator.portfolio_value_history = [
+            {"date": date, "value": value} for date, value in result["nav"].items()
+        ]
+        return result
@@ -0,0 +1,238 @@
+"""Market Crash Scenario Engine
+
+Stress test portfolios against historical crises and parametric shocks
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+from core.instrumentation import timed
+
+# Peak-to-trough windows of the S&P 500 and the benchmark loss over each window.
+# The market shock is used for assets without price history in the window.
+HISTORICAL_CRASHES = {
+    "gfc_2008": {
+        "name": "Global Financial Crisis",
+        "start": "2007-10-09",
+        "end": "2009-03-09",
+        "market_shock": -0.568,
+    },
+    "covid_2020": {
+        "name": "COVID-19 Crash",
+        "start": "2020-02-19",
+        "end": "2020-03-23",
+        "market_shock": -0.339,
+    },
+}
+
+
+class CrashScenarioEngine:
+    """Evaluate many crash scenarios against many portfolios at once
+
+    Every scenario is stored as a path of cumulative asset returns
+    (steps x assets). Stacking the paths gives a scenarios x steps x assets
+    tensor; the terminal slice is the scenarios x assets shock matrix which,
+    multiplied by an assets x portfolios holdings matrix, gives the P&L of
+    every portfolio under every scenario in a single matrix product.
+    """
+
+    def __init__(self, assets: List[str]):
+        self.assets = list(assets)
+        self._asset_index = {asset: i for i, asset in enumerate(self.assets)}
+        self.scenario_names = []
+        self._paths = []
+        self._tensor = None
+
+    def _add_path(self, name: str, path: np.ndarray):
+        """Register a (steps x assets) cumulative return path"""
+        path = np.asarray(path, dtype=float)
+        if path.ndim == 1:
+            path = path[np.newaxis, :]
+        if path.shape[1] != len(self.assets):
+            raise ValueError(f"Scenario '{name}' has {path.shape[1]} assets, expected {len(self.assets)}")
+
+        self.scenario_names.append(name)
+        self._paths.append(path)
+        self._tensor = None
+
+    def _betas(self, betas: Optional[Dict[str, float]]) -> np.ndarray:
+        """Beta vector aligned to the engine's assets (defaults to 1.0)"""
+        vector = np.ones(len(self.assets))
+        for asset, beta in (betas or {}).items():
+            if asset in self._asset_index:
+                vector[self._asset_index[asset]] = beta
+        return vector
+
+    def add_historical(self, key: str, prices: Optional[pd.DataFrame] = None,
+                       betas: Optional[Dict[str, float]] = None):
+        """
+        Add a historical crash window
+
+        Args:
+            key: Key into HISTORICAL_CRASHES (e.g. 'gfc_2008', 'covid_2020')
+            prices: Optional price DataFrame (dates x tickers) covering the window
+            betas: Optional market betas for assets without price history
+        """
+        crash = HISTORICAL_CRASHES[key]
+        beta_vector = self._betas(betas)
+
+        window = None
+        if prices is not None and not prices.empty:
+            window = prices.loc[crash["start"]:crash["end"]]
+            window = window[[c for c in window.columns if c in self._asset_index]]
+            window = window.dropna(axis=1, how="all").ffill().bfill()
+
+        if window is None or window.empty or window.shape[1] == 0:
+            # No usable history: a single step shock scaled by beta
+            self._add_path(key, beta_vector * crash["market_shock"])
+            return
+
+        observed = (window / window.iloc[0] - 1).to_numpy()
+        market_path = observed.mean(axis=1)
+
+        # Assets missing from the price data follow the observed market path
+        path = np.outer(market_path, beta_vector)
+        columns = [self._asset_index[c] for c in window.columns]
+        path[:, columns] = observed
+
+        self._add_path(key, path)
+
+    def add_parametric(self, name: str, market_shock: float,
+                       betas: Optional[Dict[str, float]] = None,
+                       idiosyncratic: Optional[Dict[str, float]] = None):
+        """
+        Add an instantaneous parametric shock
+
+        Args:
+            name: Scenario name
+            market_shock: Market return applied to every asset (e.g. -0.20)
+            betas: Optional per-asset market betas
+            idiosyncratic: Optional per-asset returns added on top of the market move
+        """
+        shock = self._betas(betas) * market_shock
+        for asset, extra in (idiosyncratic or {}).items():
+            if asset in self._asset_index:
+                shock[self._asset_index[asset]] += extra
+
+        self._add_path(name, shock)
+
+    def add_synthetic(self, num_scenarios: int, mean_returns, cov_matrix,
+                      days: int = 20, seed: Optional[int] = None, prefix: str = "synthetic"):
+        """
+        Add randomly generated crash paths drawn from a multivariate normal
+
+        Args:
+            num_scenarios: Number of scenarios to generate
+            mean_returns: Daily mean returns per asset (stressed)
+            cov_matrix: Daily covariance matrix (stressed)
+            days: Length of each scenario path in trading days
+            seed: Random seed for reproducibility
+            prefix: Prefix for generated scenario names
+        """
+        rng = np.random.default_rng(seed)
+        daily = rng.multivariate_normal(
+            np.asarray(mean_returns, dtype=float),
+            np.asarray(cov_matrix, dtype=float),
+            size=(num_scenarios, days)
+        )
+        paths = np.cumprod(1 + daily, axis=1) - 1
+
+        for i in range(num_scenarios):
+            self._add_path(f"{prefix}_{i}", paths[i])
+
+    @property
+    def path_tensor(self) -> np.ndarray:
+        """Scenarios x steps x assets tensor, shorter paths padded with their last step"""
+        if self._tensor is None:
+            if not self._paths:
+                return np.zeros((0, 1, len(self.assets)))
+
+            steps = max(path.shape[0] for path in self._paths)
+            tensor = np.empty((len(self._paths), steps, len(self.assets)))
+            for i, path in enumerate(self._paths):
+                tensor[i, :path.shape[0]] = path
+                tensor[i, path.shape[0]:] = path[-1]
+            self._tensor = tensor
+
+        return self._tensor
+
+    @property
+    def shock_matrix(self) -> np.ndarray:
+        """Scenarios x assets matrix of terminal returns"""
+        return self.path_tensor[:, -1, :]
+
+    @timed("simulations.crash_scenarios.evaluate")
+    def evaluate(self, holdings, cash=0.0, portfolio_names: Optional[List[str]] = None) -> Dict:
+        """
+        Evaluate every scenario against every portfolio
+
+        Args:
+            holdings: Dollar holdings, assets x portfolios (or a single asset vector)
+            cash: Cash per portfolio (scalar or vector), unaffected by shocks
+            portfolio_names: Optional column labels for the portfolios
+
+        Returns:
+            Dictionary with per-scenario P&L, return, and max drawdown DataFrames
+        """
+        holdings = np.asarray(holdings, dtype=float)
+        if holdings.ndim == 1:
+            holdings = holdings[:, np.newaxis]
+
+        start_value = holdings.sum(axis=0) + np.broadcast_to(np.asarray(cash, dtype=float), holdings.shape[1])
+
+        # P&L: (scenarios x assets) @ (assets x portfolios)
+        pnl = self.shock_matrix @ holdings
+
+        # Drawdown along each path: (scenarios x steps x assets) . (assets x portfolios)
+        values = start_value + np.tensordot(self.path_tensor, holdings, axes=([2], [0]))
+        values = np.concatenate([np.broadcast_to(start_value, (values.shape[0], 1, values.shape[2])), values], axis=1)
+        drawdown = (values / np.maximum.accumulate(values, axis=1) - 1).min(axis=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.where(start_value != 0, pnl / start_value, 0.0)
+
+        columns = portfolio_names if portfolio_names is not None else list(range(holdings.shape[1]))
+
+        return {
+            "pnl": pd.DataFrame(pnl, index=self.scenario_names, columns=columns),
+            "return": pd.DataFrame(returns * 100, index=self.scenario_names, columns=columns),
+            "max_drawdown": pd.DataFrame(drawdown * 100, index=self.scenario_names, columns=columns),
+        }
+
+    def holdings_matrix(self, simulators: Dict, prices: Dict[str, float]) -> np.ndarray:
+        """
+        Build the assets x accounts dollar holdings matrix for paper-trading accounts
+
+        Args:
+            simulators: Mapping of account id to TradingSimulator
+            prices: Current price per ticker
+
+        Returns:
+            Holdings matrix aligned to the engine's assets
+        """
+        matrix = np.zeros((len(self.assets), len(simulators)))
+
+        for j, simulator in enumerate(simulators.values()):
+            for ticker, quantity in simulator.portfolio.items():
+                if ticker not in self._asset_index:
+                    raise ValueError(f"No scenario data for ticker '{ticker}'")
+                matrix[self._asset_index[ticker], j] = quantity * prices[ticker]
+
+        return matrix
+
+    def stress_test_accounts(self, simulators: Dict, prices: Dict[str, float]) -> Dict:
+        """
+        Stress test every paper-trading account in one matrix operation
+
+        Args:
+            simulators: Mapping of account id to TradingSimulator
+            prices: Current price per ticker
+
+        Returns:
+            Same structure as evaluate(), one column per account
+        """
+        holdings = self.holdings_matrix(simulators, prices)
+        cash = np.array([simulator.cash for simulator in simulators.values()], dtype=float)
+
+        return self.evaluate(holdings, cash=cash, portfolio_names=list(simulators.keys()))
@@ -0,0 +1,207 @@
+"""ETF Allocation Simulator
+
+Look-through exposures, overlap, and concentration for portfolios of ETFs
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from typing import Dict
+
+
+class ETFAllocationSimulator:
+    """Sparse ETF x underlying holdings matrix with look-through analytics"""
+
+    def __init__(self, holdings: pd.DataFrame):
+        """
+        Args:
+            holdings: Long table with columns 'etf', 'ticker', 'weight'.
+                Weights are normalized to sum to 1 within each ETF.
+        """
+        holdings = holdings.groupby(["etf", "ticker"], sort=False)["weight"].sum().reset_index()
+
+        etf_codes, etfs = pd.factorize(holdings["etf"])
+        ticker_codes, underlyings = pd.factorize(holdings["ticker"])
+        self.etfs = list(etfs)
+        self.underlyings = list(underlyings)
+        self.etf_index = {etf: i for i, etf in enumerate(self.etfs)}
+        self.underlying_index = {ticker: i for i, ticker in enumerate(self.underlyings)}
+
+        matrix = sparse.csr_matrix(
+            (holdings["weight"].to_numpy(dtype=float), (etf_codes, ticker_codes)),
+            shape=(len(self.etfs), len(self.underlyings))
+        )
+        totals = np.asarray(matrix.sum(axis=1)).ravel()
+        totals[totals == 0] = 1.0
+        self.matrix = (sparse.diags(1 / totals) @ matrix).tocsr()
+
+    @classmethod
+    def from_directory(cls, path: str):
+        """
+        Load holdings from local CSV files
+
+        Each '<ETF>.csv' file in the directory lists one ETF's holdings
+        with 'ticker' and 'weight' columns.
+
+        Args:
+            path: Directory containing the holdings files
+        """
+        frames = []
+        for filename in sorted(os.listdir(path)):
+            if not filename.lower().endswith(".csv"):
+                continue
+            frame = pd.read_csv(os.path.join(path, filename), usecols=["ticker", "weight"])
+            frame["etf"] = os.path.splitext(filename)[0].upper()
+            frames.append(frame)
+
+        if not frames:
+            return cls(pd.DataFrame(columns=["etf", "ticker", "weight"]))
+
+        return cls(pd.concat(frames, ignore_index=True))
+
+    @classmethod
+    def from_csv(cls, filepath: str):
+        """Load holdings from a single CSV with 'etf', 'ticker', 'weight' columns"""
+        return cls(pd.read_csv(filepath, usecols=["etf", "ticker", "weight"]))
+
+    def _split(self, allocation: Dict[str, float]):
+        """Split an allocation into an ETF weight vector and direct holdings"""
+        vector = np.zeros(len(self.etfs))
+        direct = {}
+
+        for ticker, amount in allocation.items():
+            if ticker in self.etf_index:
+                vector[self.etf_index[ticker]] += amount
+            else:
+                direct[ticker] = direct.get(ticker, 0.0) + amount
+
+        return vector, direct
+
+    def _combine(self, look_through: np.ndarray, direct: Dict[str, float]) -> pd.Series:
+        """Merge look-through and direct exposures into one Series"""
+        exposures = pd.Series(look_through, index=self.underlyings)
+        extra = {}
+        for ticker, amount in direct.items():
+            if ticker in self.underlying_index:
+                exposures.iloc[self.underlying_index[ticker]] += amount
+            else:
+                extra[ticker] = amount
+
+        if extra:
+            exposures = pd.concat([exposures, pd.Series(extra)])
+
+        return exposures[exposures != 0].sort_values(ascending=False)
+
+    def exposures(self, allocation: Dict[str, float]) -> pd.Series:
+        """
+        Look-through exposure to each underlying security
+
+        Args:
+            allocation: ETF (or single stock) to weight or dollar amount
+
+        Returns:
+            Series of exposures in the same units as the allocation
+        """
+        vector, direct = self._split(allocation)
+        return self._combine(self.matrix.T @ vector, direct)
+
+    def overlap_matrix(self) -> pd.DataFrame:
+        """Pairwise ETF overlap as cosine similarity of holdings weights"""
+        gram = (self.matrix @ self.matrix.T).toarray()
+        norms = np.sqrt(np.diag(gram))
+        norms[norms == 0] = 1.0
+
+        return pd.DataFrame(gram / np.outer(norms, norms), index=self.etfs, columns=self.etfs)
+
+    def common_holdings(self) -> pd.DataFrame:
+        """Pairwise count of underlying securities held by both ETFs"""
+        held = (self.matrix != 0).astype(np.int32)
+        counts = (held @ held.T).toarray()
+
+        return pd.DataFrame(counts, index=self.etfs, columns=self.etfs)
+
+    def concentration(self, allocation: Dict[str, float], top_n: int = 10) -> Dict:
+        """
+        Effective concentration of the look-through portfolio
+
+        Args:
+            allocation: ETF (or single stock) to weight or dollar amount
+            top_n: Number of largest exposures to sum
+
+        Returns:
+            Dictionary with HHI, effective number of holdings, and top-N weight
+        """
+        exposures = self.exposures(allocation)
+        total = exposures.sum()
+        if total == 0:
+            return {"hhi": 0.0, "effective_holdings": 0.0, "top_weight": 0.0}
+
+        weights = exposures / total
+        hhi = float((weights ** 2).sum())
+
+        return {
+            "hhi": hhi,
+            "effective_holdings": 1 / hhi,
+            "top_weight": float(weights.nlargest(top_n).sum())
+        }
+
+
+class ExposureTracker:
+    """Incrementally maintained look-through exposure for a TradingSimulator
+
+    Each position is marked at its last traded price. A trade only touches
+    the non-zero entries of one ETF row, so updates cost O(holdings of that ETF)
+    instead of recomputing the full look-through.
+    """
+
+    def __init__(self, etf_simulator: ETFAllocationSimulator, simulator=None):
+        self.etf_simulator = etf_simulator
+        self.look_through = np.zeros(len(etf_simulator.underlyings))
+        self.direct = {}
+        self.quantities = {}
+        self.marks = {}
+
+        if simulator is not None:
+            self.attach(simulator)
+
+    def attach(self, simulator):
+        """Sync with a simulator's current portfolio and follow its trades"""
+        for transaction in simulator.transaction_history:
+            self.marks[transaction["ticker"]] = transaction["price"]
+        for ticker, quantity in simulator.portfolio.items():
+            self._set_value(ticker, quantity, self.marks.get(ticker, 0.0))
+
+        simulator.add_listener(self.on_transaction)
+
+    def on_transaction(self, transaction: dict):
+        """Apply one executed transaction"""
+        sign = 1 if transaction["type"] == "BUY" else -1
+        ticker = transaction["ticker"]
+        quantity = self.quantities.get(ticker, 0) + sign * transaction["quantity"]
+        self._set_value(ticker, quantity, transaction["price"])
+
+    def _set_value(self, ticker: str, quantity: float, price: float):
+        """Move a position to a new quantity and mark, updating exposures by the delta"""
+        delta = quantity * price - self.quantities.get(ticker, 0) * self.marks.get(ticker, 0.0)
+        self.quantities[ticker] = quantity
+        self.marks[ticker] = price
+
+        row = self.etf_simulator.etf_index.get(ticker)
+        if row is None:
+            self.direct[ticker] = self.direct.get(ticker, 0.0) + delta
+            return
+
+        matrix = self.etf_simulator.matrix
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        self.look_through[matrix.indices[start:end]] += delta * matrix.data[start:end]
+
+    def mark(self, prices: Dict[str, float]):
+        """Revalue positions at new prices"""
+        for ticker, price in prices.items():
+            if ticker in self.quantities:
+                self._set_value(ticker, self.quantities[ticker], price)
+
+    def exposures(self) -> pd.Series:
+        """Current dollar exposure to each underlying security"""
+        return self.etf_simulator._combine(self.look_through, self.direct)
@@ -0,0 +1,370 @@
+"""Paper Trading Ledger
+
+Persistent multi-user storage for TradingSimulator accounts
+"""
+
+import atexit
+import logging
+import math
+import os
+import threading
+import weakref
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    Column, DateTime, Float, Index, Integer, MetaData, String, Table,
+    bindparam, create_engine, event, func, select
+)
+
+from core.instrumentation import count
+from simulations.trading_sim import TradingSimulator
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failed timer flushes before the timer gives up (the next trade re-arms it)
+MAX_TIMER_RETRIES = 5
+
+metadata = MetaData()
+
+accounts = Table(
+    "accounts", metadata,
+    Column("account_id", String, primary_key=True),
+    Column("initial_capital", Float, nullable=False),
+    Column("cash", Float, nullable=False),
+)
+
+# Append-only: rows are never updated or deleted
+transactions = Table(
+    "transactions", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("account_id", String, nullable=False),
+    Column("ticker", String, nullable=False),
+    Column("type", String(4), nullable=False),
+    Column("quantity", Float, nullable=False),
+    Column("price", Float, nullable=False),
+    Column("date", DateTime, nullable=False),
+    Index("ix_transactions_account_ticker", "account_id", "ticker"),
+    Index("ix_transactions_account_date", "account_id", "date"),
+)
+
+# Materialized from transactions, kept in step within the same DB transaction
+positions = Table(
+    "positions", metadata,
+    Column("account_id", String, primary_key=True),
+    Column("ticker", String, primary_key=True),
+    Column("quantity", Float, nullable=False),
+)
+
+
+def _flush_on_exit(store_ref):
+    """atexit hook: write whatever a live store still has buffered"""
+    store = store_ref()
+    if store is not None:
+        store.flush()
+
+
+def _dialect_insert(dialect_name: str):
+    """Insert construct supporting ON CONFLICT for the given dialect"""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+class LedgerStore:
+    """Append-only transaction ledger with a materialized positions table
+
+    Transactions are buffered in memory and written in batches; each batch
+    inserts its transactions and applies the net position and cash changes
+    in one database transaction, so positions never disagree with the log.
+    A batch is written once it is full or max_latency seconds after its first
+    trade, whichever comes first, and again at interpreter exit, so other
+    processes see trades promptly and a restart does not lose them.
+    """
+
+    def __init__(self, url: str = "sqlite:///data/ledger.db", batch_size: int = 10,
+                 max_latency: Optional[float] = 1.0):
+        """
+        Args:
+            url: SQLAlchemy database URL
+            batch_size: Transactions per write
+            max_latency: Seconds a trade may wait in the buffer (None = only when full)
+
+        Raises:
+            ValueError: For in-memory SQLite with max_latency set, since the
+                timer thread would get its own empty database
+        """
+        self.engine = create_engine(url)
+        if self.engine.dialect.name == "sqlite":
+            if self.engine.url.database in (None, "", ":memory:"):
+                if max_latency is not None:
+                    raise ValueError("In-memory SQLite ledgers need max_latency=None; "
+                                     "each thread would see a different database")
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(self.engine.url.database)), exist_ok=True)
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._timer = None
+        self._timer_failures = 0
+        self._insert = _dialect_insert(self.engine.dialect.name)
+
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", self._configure_sqlite)
+
+        metadata.create_all(self.engine)
+        atexit.register(_flush_on_exit, weakref.ref(self))
+
+    @staticmethod
+    def _configure_sqlite(dbapi_connection, connection_record):
+        """Enable WAL so readers never block the writer"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    def open_account(self, account_id: str, initial_capital: float = 100000):
+        """Create an account if it does not exist yet"""
+        statement = self._insert(accounts).values(
+            account_id=account_id,
+            initial_capital=initial_capital,
+            cash=initial_capital
+        ).on_conflict_do_nothing(index_elements=["account_id"])
+
+        with self.engine.begin() as conn:
+            conn.execute(statement)
+
+    @staticmethod
+    def _row(account_id: str, transaction: dict) -> dict:
+        """Transactions table row for a TradingSimulator transaction"""
+        return {
+            "account_id": account_id,
+            "ticker": transaction["ticker"],
+            "type": transaction["type"],
+            "quantity": transaction["quantity"],
+            "price": transaction["price"],
+            "date": transaction["date"],
+        }
+
+    def record(self, account_id: str, transaction: dict):
+        """
+        Queue a transaction, flushing once the batch is full
+
+        Args:
+            account_id: Account the transaction belongs to
+            transaction: Transaction dict as produced by TradingSimulator
+        """
+        with self._lock:
+            self._buffer.append(self._row(account_id, transaction))
+            full = len(self._buffer) >= self.batch_size
+            if not full and self.max_latency is not None and self._timer is None:
+                self._timer = threading.Timer(self.max_latency, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self.flush()
+
+    def _flush_on_timer(self):
+        """Timer callback bounding how long a trade stays unwritten"""
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception:
+            count("ledger.flush_errors")
+            logger.warning("Ledger flush failed (%d in a row)", self._timer_failures + 1, exc_info=True)
+            # The batch was re-queued; retry after another interval, a bounded number of times
+            with self._lock:
+                self._timer_failures += 1
+                if self._buffer and self._timer is None and self._timer_failures < MAX_TIMER_RETRIES:
+                    self._timer = threading.Timer(self.max_latency, self._flush_on_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+        else:
+            self._timer_failures = 0
+
+    def flush(self) -> int:
+        """
+        Write all queued transactions in one database transaction
+
+        Returns:
+            Number of transactions written
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not batch:
+            return 0
+
+        position_deltas = defaultdict(float)
+        cash_deltas = defaultdict(float)
+        for row in batch:
+            sign = 1 if row["type"] == "BUY" else -1
+            position_deltas[(row["account_id"], row["ticker"])] += sign * row["quantity"]
+            cash_deltas[row["account_id"]] -= sign * row["quantity"] * row["price"]
+
+        upsert = self._insert(positions)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["account_id", "ticker"],
+            set_={"quantity": positions.c.quantity + upsert.excluded.quantity}
+        )
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(transactions.insert(), batch)
+                conn.execute(upsert, [
+                    {"account_id": account_id, "ticker": ticker, "quantity": delta}
+                    for (account_id, ticker), delta in position_deltas.items()
+                ])
+                conn.execute(
+                    accounts.update()
+                    .where(accounts.c.account_id == bindparam("aid"))
+                    .values(cash=accounts.c.cash + bindparam("delta")),
+                    [{"aid": account_id, "delta": delta} for account_id, delta in cash_deltas.items()]
+                )
+                conn.execute(positions.delete().where(
+                    positions.c.account_id.in_(list(cash_deltas)),
+                    positions.c.quantity == 0
+                ))
+        except Exception:
+            # Keep the batch so a later flush can retry it
+            with self._lock:
+                self._buffer = batch + self._buffer
+            raise
+
+        return len(batch)
+
+    def attach(self, simulator: TradingSimulator, account_id: str):
+        """
+        Persist every future trade of a simulator under the given account
+
+        A new account is seeded with the simulator's current cash, positions,
+        and transaction history. An existing account must already match the
+        simulator (e.g. one returned by load_simulator).
+
+        Raises:
+            ValueError: If the stored account disagrees with the simulator
+        """
+        if not self._seed_account(account_id, simulator):
+            stored = self.load_simulator(account_id)
+            same_positions = (stored.portfolio.keys() == simulator.portfolio.keys() and all(
+                math.isclose(stored.portfolio[ticker], quantity) for ticker, quantity in simulator.portfolio.items()
+            ))
+            if not same_positions or not math.isclose(stored.cash, simulator.cash, abs_tol=1e-6):
+                raise ValueError(
+                    f"Account '{account_id}' already exists with different cash or positions; "
+                    "attach the simulator returned by load_simulator() instead"
+                )
+        simulator.add_listener(lambda transaction: self.record(account_id, transaction))
+
+    def _seed_account(self, account_id: str, simulator: TradingSimulator) -> bool:
+        """
+        Create an account from a simulator's current state
+
+        Returns:
+            True if the account was created, False if it already existed
+        """
+        statement = self._insert(accounts).values(
+            account_id=account_id,
+            initial_capital=simulator.initial_capital,
+            cash=simulator.cash
+        ).on_conflict_do_nothing(index_elements=["account_id"])
+
+        with self.engine.begin() as conn:
+            if conn.execute(statement).rowcount == 0:
+                return False
+            if simulator.transaction_history:
+                conn.execute(transactions.insert(), [
+                    self._row(account_id, transaction) for transaction in simulator.transaction_history
+                ])
+            if simulator.portfolio:
+                conn.execute(positions.insert(), [
+                    {"account_id": account_id, "ticker": ticker, "quantity": quantity}
+                    for ticker, quantity in simulator.portfolio.items()
+                ])
+        return True
+
+    def load_simulator(self, account_id: str) -> Optional[TradingSimulator]:
+        """
+        Rebuild a simulator from its materialized positions
+
+        Pending writes are flushed first. The transaction history is not
+        loaded; use transaction_history() to page through it.
+
+        Returns:
+            TradingSimulator, or None if the account does not exist
+        """
+        self.flush()
+
+        query = (
+            select(accounts.c.initial_capital, accounts.c.cash, positions.c.ticker, positions.c.quantity)
+            .select_from(accounts.outerjoin(positions, positions.c.account_id == accounts.c.account_id))
+            .where(accounts.c.account_id == account_id)
+        )
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).all()
+
+        if not rows:
+            return None
+
+        simulator = TradingSimulator(initial_capital=rows[0].initial_capital)
+        simulator.cash = rows[0].cash
+        for row in rows:
+            if row.ticker is not None:
+                quantity = row.quantity
+                simulator.portfolio[row.ticker] = int(quantity) if quantity.is_integer() else quantity
+
+        return simulator
+
+    def transaction_history(self, account_id: str, ticker: Optional[str] = None,
+                            limit: Optional[int] = None) -> List[Dict]:
+        """Most recent transactions for an account, newest first"""
+        self.flush()
+
+        query = select(transactions).where(transactions.c.account_id == account_id)
+        if ticker is not None:
+            query = query.where(transactions.c.ticker == ticker)
+        query = query.order_by(transactions.c.date.desc(), transactions.c.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+
+        with self.engine.connect() as conn:
+            return [dict(row._mapping) for row in conn.execute(query)]
+
+    def last_trade_prices(self, account_id: str, tickers: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Price of each ticker's most recent transaction for an account
+
+        Grouped on the (account_id, ticker) index, so it reads one row per
+        ticker however long the history is.
+
+        Args:
+            account_id: Account to look up
+            tickers: Restrict to these tickers (default: every traded ticker)
+
+        Returns:
+            Dictionary of ticker -> last trade price
+        """
+        self.flush()
+
+        latest = select(func.max(transactions.c.id)).where(transactions.c.account_id == account_id)
+        if tickers is not None:
+            latest = latest.where(transactions.c.ticker.in_(list(tickers)))
+        latest = latest.group_by(transactions.c.ticker)
+        query = select(transactions.c.ticker, transactions.c.price).where(transactions.c.id.in_(latest))
+
+        with self.engine.connect() as conn:
+            return {row.ticker: row.price for row in conn.execute(query)}
+
+    def close(self):
+        """Flush pending writes and release connections"""
+        self.flush()
+        self.engine.dispose()
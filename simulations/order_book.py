@@ -0,0 +1,225 @@
+"""Order Book Module
+
+Resting limit and stop orders for paper-trading accounts
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from simulations.trading_sim import TradingSimulator
+
+ORDER_TYPES = ("LIMIT", "STOP")
+SIDES = ("BUY", "SELL")
+
+# A heap is rebuilt once cancelled entries exceed this fraction of it
+COMPACT_FRACTION = 0.5
+
+
+class OrderBook:
+    """Resting orders for one ticker, indexed by trigger price
+
+    Each side/type pair has its own heap ordered so that the next order to
+    trigger is on top. A price bar pops only the orders whose trigger was
+    crossed, so processing costs O(k log n) for k triggered of n resting
+    orders. Cancelled orders are dropped lazily when they reach the top, or
+    all at once when they make up more than COMPACT_FRACTION of their heap.
+    """
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        # Heap entries are (key, sequence, order); key is negated for max-heaps
+        self._buy_limits = []   # highest limit first, triggers when low <= limit
+        self._sell_limits = []  # lowest limit first, triggers when high >= limit
+        self._buy_stops = []    # lowest stop first, triggers when high >= stop
+        self._sell_stops = []   # highest stop first, triggers when low <= stop
+        self._live = 0
+        self._dead = {}  # (side, order_type) -> cancelled entries still in that heap
+
+    def _heap(self, side: str, order_type: str):
+        """Heap and sign of the key for a side/type pair"""
+        if order_type == "LIMIT":
+            return (self._buy_limits, -1) if side == "BUY" else (self._sell_limits, 1)
+        return (self._buy_stops, 1) if side == "BUY" else (self._sell_stops, -1)
+
+    def add(self, order: dict):
+        """Rest an order in the book"""
+        heap, sign = self._heap(order["side"], order["order_type"])
+        heapq.heappush(heap, (sign * order["price"], order["id"], order))
+        self._live += 1
+
+    def discard(self, order: dict):
+        """Account for an order cancelled while resting, compacting its heap if needed"""
+        pair = (order["side"], order["order_type"])
+        heap, _ = self._heap(*pair)
+        self._live -= 1
+        self._dead[pair] = self._dead.get(pair, 0) + 1
+
+        if self._dead[pair] > COMPACT_FRACTION * len(heap):
+            heap[:] = [entry for entry in heap if entry[2]["status"] == "OPEN"]
+            heapq.heapify(heap)
+            self._dead[pair] = 0
+
+    def __len__(self):
+        """Number of open (not cancelled) resting orders"""
+        return self._live
+
+    def _pop_crossed(self, side: str, order_type: str, level: float, crossed) -> List[dict]:
+        """Pop orders from the top of a heap while their trigger is crossed"""
+        heap, sign = self._heap(side, order_type)
+        triggered = []
+        while heap:
+            key, _, order = heap[0]
+            if order["status"] != "OPEN":
+                heapq.heappop(heap)
+                self._dead[(side, order_type)] -= 1
+                continue
+            if not crossed(sign * key, level):
+                break
+            heapq.heappop(heap)
+            triggered.append(order)
+        self._live -= len(triggered)
+        return triggered
+
+    def triggered(self, high: float, low: float) -> List[dict]:
+        """
+        Remove and return all orders triggered by a price bar
+
+        Args:
+            high: Bar high
+            low: Bar low
+
+        Returns:
+            Triggered orders in submission order
+        """
+        triggered = (
+            self._pop_crossed("BUY", "LIMIT", low, lambda price, level: level <= price)
+            + self._pop_crossed("SELL", "LIMIT", high, lambda price, level: level >= price)
+            + self._pop_crossed("BUY", "STOP", high, lambda price, level: level >= price)
+            + self._pop_crossed("SELL", "STOP", low, lambda price, level: level <= price)
+        )
+        return sorted(triggered, key=lambda order: order["id"])
+
+
+class OrderMatcher:
+    """Routes resting orders for many accounts and fills them against price bars"""
+
+    def __init__(self):
+        self.books = {}
+        self.accounts = {}
+        self.orders = {}
+        self._ids = itertools.count(1)
+
+    def register(self, account_id: str, simulator: TradingSimulator):
+        """Attach a simulator that orders for this account fill into"""
+        self.accounts[account_id] = simulator
+
+    def submit(self, account_id: str, ticker: str, side: str, quantity: int,
+               order_type: str, price: float) -> dict:
+        """
+        Submit a resting limit or stop order
+
+        Args:
+            account_id: Registered account placing the order
+            ticker: Stock ticker
+            side: 'BUY' or 'SELL'
+            quantity: Number of shares
+            order_type: 'LIMIT' or 'STOP'
+            price: Limit or stop trigger price
+
+        Returns:
+            Result dict with success flag, message, and order id
+        """
+        side, order_type = side.upper(), order_type.upper()
+        if account_id not in self.accounts:
+            return {"success": False, "message": f"Unknown account {account_id}"}
+        if side not in SIDES or order_type not in ORDER_TYPES:
+            return {"success": False, "message": f"Unsupported order {side} {order_type}"}
+        if quantity <= 0 or price <= 0:
+            return {"success": False, "message": "Quantity and price must be positive"}
+
+        order = {
+            "id": next(self._ids),
+            "account_id": account_id,
+            "ticker": ticker,
+            "side": side,
+            "order_type": order_type,
+            "quantity": quantity,
+            "price": price,
+            "status": "OPEN",
+            "date": datetime.now(),
+        }
+        self.orders[order["id"]] = order
+
+        if ticker not in self.books:
+            self.books[ticker] = OrderBook(ticker)
+        self.books[ticker].add(order)
+
+        return {
+            "success": True,
+            "message": f"{side} {order_type} {quantity} {ticker} @ {price:.2f} placed",
+            "order_id": order["id"]
+        }
+
+    def cancel(self, order_id: int) -> dict:
+        """Cancel an open order"""
+        order = self.orders.get(order_id)
+        if order is None or order["status"] != "OPEN":
+            return {"success": False, "message": "Order is not open"}
+
+        order["status"] = "CANCELLED"
+        self.books[order["ticker"]].discard(order)
+        return {"success": True, "message": f"Cancelled order {order_id}"}
+
+    @staticmethod
+    def _fill_price(order: dict, open_price: float) -> float:
+        """Fill at the order price, or at the open if the bar gapped through it"""
+        if (order["side"] == "BUY") == (order["order_type"] == "LIMIT"):
+            return min(order["price"], open_price)
+        return max(order["price"], open_price)
+
+    def process_bar(self, ticker: str, open_price: float, high: float, low: float) -> List[dict]:
+        """
+        Fill every order whose trigger was crossed by a price bar
+
+        Args:
+            ticker: Stock ticker
+            open_price: Bar open
+            high: Bar high
+            low: Bar low
+
+        Returns:
+            Executed or rejected orders
+        """
+        book = self.books.get(ticker)
+        if book is None:
+            return []
+
+        processed = []
+        for order in book.triggered(high, low):
+            simulator = self.accounts[order["account_id"]]
+            fill_price = self._fill_price(order, open_price)
+
+            if order["side"] == "BUY":
+                result = simulator.buy(ticker, order["quantity"], fill_price)
+            else:
+                result = simulator.sell(ticker, order["quantity"], fill_price)
+
+            order["status"] = "FILLED" if result["success"] else "REJECTED"
+            order["fill_price"] = fill_price if result["success"] else None
+            order["message"] = result["message"]
+            processed.append(order)
+
+        return processed
+
+    def process_price(self, ticker: str, price: float) -> List[dict]:
+        """Process a single trade price as a flat bar"""
+        return self.process_bar(ticker, price, price, price)
+
+    def open_orders(self, account_id: Optional[str] = None) -> List[Dict]:
+        """Open orders, optionally for a single account"""
+        return [
+            order for order in self.orders.values()
+            if order["status"] == "OPEN" and (account_id is None or order["account_id"] == account_id)
+        ]
@@ -3,11 +3,15 @@
 Paper trading and stock picking simulator
 """
 
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from core.instrumentation import count, timed
+from core.lazy import lazy_import
+
+yf = lazy_import("yfinance")
+
 class TradingSimulator:
     """Paper trading simulator with virtual cash"""
     
@@ -17,6 +21,23 @@ class TradingSimulator:
         self.portfolio = {}
         self.transaction_history = []
         self.portfolio_value_history = []
+        self.listeners = []
+    
+    def add_listener(self, callback):
+        """
+        Register a callback invoked with each executed transaction
+        
+        Args:
+            callback: Callable taking the transaction dict
+        """
+        self.listeners.append(callback)
+    
+    def _record(self, transaction: dict):
+        """Append a transaction to the history and notify listeners"""
+        self.transaction_history.append(transaction)
+        count("simulations.trades")
+        for listener in self.listeners:
+            listener(transaction)
     
     def buy(self, ticker: str, quantity: int, price: float):
         """
@@ -39,7 +60,7 @@ class TradingSimulator:
         else:
             self.portfolio[ticker] = quantity
         
-        self.transaction_history.append({
+        self._record({
             "type": "BUY",
             "ticker": ticker,
             "quantity": quantity,
@@ -68,7 +89,7 @@ class TradingSimulator:
         if self.portfolio[ticker] == 0:
             del self.portfolio[ticker]
         
-        self.transaction_history.append({
+        self._record({
             "type": "SELL",
             "ticker": ticker,
             "quantity": quantity,
@@ -78,12 +99,23 @@ class TradingSimulator:
         
         return {"success": True, "message": f"Sold {quantity} shares of {ticker}"}
     
-    def get_portfolio_value(self) -> float:
-        """Calculate current portfolio value"""
+    @timed("simulations.get_portfolio_value")
+    def get_portfolio_value(self, prices=None) -> float:
+        """
+        Calculate current portfolio value
+        
+        Args:
+            prices: Optional mapping of ticker -> price (e.g. a PriceSnapshot);
+                tickers missing from it are fetched from yfinance
+        """
         total = self.cash
         
         for ticker, quantity in self.portfolio.items():
+            if prices is not None and prices.get(ticker) is not None:
+                total += quantity * prices.get(ticker)
+                continue
             try:
+                count("network.yf_history")
                 stock = yf.Ticker(ticker)
                 current_price = stock.history(period="1d")['Close'].iloc[-1]
                 total += quantity * current_price
@@ -92,9 +124,9 @@ class TradingSimulator:
         
         return total
     
-    def get_returns(self) -> dict:
-        """Calculate portfolio returns"""
-        current_value = self.get_portfolio_value()
+    def get_returns(self, prices=None) -> dict:
+        """Calculate portfolio returns (prices as in get_portfolio_value)"""
+        current_value = self.get_portfolio_value(prices)
         absolute_return = current_value - self.initial_capital
         percentage_return = (absolute_return / self.initial_capital) * 100
         
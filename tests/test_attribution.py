@@ -0,0 +1,98 @@
+"""Unit Tests for Trade Replay and Attribution
+
+Tests NAV reconstruction, average-cost P&L, ordering, and simulator integration
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from benchmarks.fixtures import synthetic_prices
+from simulations.attribution import TradeReplay
+from simulations.trading_sim import TradingSimulator
+
+DATES = pd.bdate_range('2024-01-01', periods=5)
+PRICES = pd.DataFrame({'AAPL': [10, 11, 12, 13, 14], 'MSFT': [20, 20, 22, 21, 25]}, index=DATES, dtype=float)
+TRADES = [
+    {'type': 'BUY', 'ticker': 'AAPL', 'quantity': 10, 'price': 10.0, 'date': DATES[0]},
+    {'type': 'BUY', 'ticker': 'AAPL', 'quantity': 10, 'price': 12.0, 'date': DATES[1]},
+    {'type': 'SELL', 'ticker': 'AAPL', 'quantity': 5, 'price': 12.0, 'date': DATES[2]},
+    {'type': 'BUY', 'ticker': 'MSFT', 'quantity': 10, 'price': 21.0, 'date': DATES[3]},
+]
+
+
+def test_nav_and_pnl_match_hand_calculation():
+    """Test NAV, average cost, and realized/unrealized P&L on a small account"""
+    result = TradeReplay(PRICES).replay(TRADES, initial_capital=1000)
+
+    assert list(result['nav']) == pytest.approx([1000, 1000, 1020, 1035, 1090])
+    assert list(result['cash']) == pytest.approx([900, 780, 840, 630, 630])
+    assert list(result['positions']['AAPL']) == [10, 20, 15, 15, 15]
+
+    summary = result['summary']
+    assert summary.loc['AAPL', 'average_cost'] == pytest.approx(11)
+    assert summary.loc['AAPL', 'realized_pnl'] == pytest.approx(5)
+    assert summary.loc['AAPL', 'unrealized_pnl'] == pytest.approx(45)
+    assert summary.loc['MSFT', 'total_pnl'] == pytest.approx(40)
+    assert summary['contribution_pct'].sum() == pytest.approx(9)
+
+
+def test_ledger_order_and_off_calendar_dates():
+    """Test newest-first ledger rows are replayed in order and weekend trades roll forward"""
+    rows = [dict(trade, id=i + 1) for i, trade in enumerate(TRADES)][::-1]
+    rows[-1] = dict(rows[-1], date=pd.Timestamp('2023-12-30'))  # Saturday -> Monday DATES[0]
+
+    result = TradeReplay(PRICES).replay(rows, initial_capital=1000)
+
+    assert list(result['nav']) == pytest.approx([1000, 1000, 1020, 1035, 1090])
+
+
+def test_contribution_reconciles_with_nav():
+    """Test per-ticker contributions sum to NAV minus capital for many random trades"""
+    prices = synthetic_prices(10, 2)
+    rng = np.random.default_rng(3)
+    held = {}
+    trades = []
+    for date in np.sort(rng.choice(prices.index, size=3000)):
+        ticker = prices.columns[rng.integers(10)]
+        if held.get(ticker, 0) > 1 and rng.random() < 0.4:
+            quantity, side = int(rng.integers(1, held[ticker])), 'SELL'
+            held[ticker] -= quantity
+        else:
+            quantity, side = int(rng.integers(1, 50)), 'BUY'
+            held[ticker] = held.get(ticker, 0) + quantity
+        trades.append({'type': side, 'ticker': ticker, 'quantity': quantity,
+                       'price': prices.loc[date, ticker], 'date': date})
+
+    result = TradeReplay(prices).replay(trades, initial_capital=1e7)
+
+    reconciled = result['contribution'].sum(axis=1) + 1e7
+    np.testing.assert_allclose(reconciled, result['nav'], rtol=1e-9)
+    assert result['summary']['position'].to_dict() == pytest.approx({k: float(v) for k, v in held.items()})
+
+
+def test_replay_simulator_fills_value_history():
+    """Test simulator histories are replayed and portfolio_value_history is filled"""
+    sim = TradingSimulator(initial_capital=1000)
+    sim.buy('AAPL', 10, 10.0)
+    for transaction in sim.transaction_history:
+        transaction['date'] = DATES[0]
+
+    result = TradeReplay(PRICES).replay_simulator(sim)
+
+    assert len(sim.portfolio_value_history) == len(DATES)
+    assert sim.portfolio_value_history[-1]['value'] == pytest.approx(1040)
+    assert result['returns'].iloc[-1] == pytest.approx(1040 / 1030 - 1)
+
+
+def test_ticker_missing_from_panel_marked_at_trade_price():
+    """Test a ticker without quotes is valued at its last trade price, not at zero"""
+    trades = TRADES + [
+        {'type': 'BUY', 'ticker': 'DELISTED', 'quantity': 10, 'price': 5.0, 'date': DATES[1]},
+        {'type': 'BUY', 'ticker': 'DELISTED', 'quantity': 10, 'price': 7.0, 'date': DATES[3]},
+    ]
+
+    result = TradeReplay(PRICES).replay(trades, initial_capital=1000)
+
+    assert list(result['market_value']['DELISTED']) == pytest.approx([0, 50, 50, 140, 140])
+    assert list(result['nav']) == pytest.approx([1000, 1000, 1020, 1055, 1110])
+    assert result['summary'].loc['DELISTED', 'unrealized_pnl'] == pytest.approx(20)
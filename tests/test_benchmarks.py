@@ -0,0 +1,51 @@
+"""Unit Tests for Benchmark Suite
+
+Tests synthetic fixtures, the runner, and regression detection
+"""
+
+from benchmarks.compare import compare
+from benchmarks.fixtures import synthetic_ohlcv, synthetic_prices
+from benchmarks.run import SUITES, BENCHMARKS, run_suite
+
+
+def test_fixtures_are_deterministic():
+    """Test the same seed produces identical prices"""
+    first = synthetic_prices(5, 2, seed=1)
+    second = synthetic_prices(5, 2, seed=1)
+
+    assert first.shape == (504, 5)
+    assert first.equals(second)
+    assert not first.equals(synthetic_prices(5, 2, seed=2))
+
+
+def test_ohlcv_is_consistent():
+    """Test bars satisfy low <= open, close <= high"""
+    bars = synthetic_ohlcv(1)
+
+    assert (bars['Low'] <= bars[['Open', 'Close']].min(axis=1)).all()
+    assert (bars['High'] >= bars[['Open', 'Close']].max(axis=1)).all()
+
+
+def test_every_suite_entry_is_registered():
+    """Test suites only reference known benchmarks"""
+    for grid in SUITES.values():
+        assert set(grid) <= set(BENCHMARKS)
+
+
+def test_run_suite_records_timings():
+    """Test the runner produces a results document"""
+    document = run_suite('quick', name_filter='trading', repeat=1, verbose=False)
+
+    assert document['meta']['suite'] == 'quick'
+    assert list(document['results']) == ['trading_throughput[trades=10000]']
+    assert document['results']['trading_throughput[trades=10000]']['best'] > 0
+
+
+def test_compare_flags_regressions():
+    """Test slowdowns beyond the threshold are flagged"""
+    baseline = {'results': {'a': {'best': 1.0}, 'b': {'best': 1.0}, 'c': {'best': 1.0}, 'gone': {'best': 1.0}}}
+    current = {'results': {'a': {'best': 1.5}, 'b': {'best': 1.1}, 'c': {'best': 0.5}, 'new': {'best': 1.0}}}
+
+    status = {row['benchmark']: row['status'] for row in compare(baseline, current, threshold=0.25)}
+
+    assert status == {'a': 'regression', 'b': 'ok', 'c': 'improved', 'gone': 'missing', 'new': 'new'}
@@ -0,0 +1,72 @@
+"""Unit Tests for Bond Pricing Module
+
+Tests curve bootstrapping, yield solving, duration, and batched repricing
+"""
+
+import numpy as np
+from simulations.bond_pricing import BondPricer, YieldCurve
+
+TENORS = [1, 2, 5, 10, 30]
+PAR_YIELDS = [0.045, 0.043, 0.041, 0.042, 0.044]
+
+
+class TestBondPricing:
+    """Test suite for vectorized bond analytics"""
+
+    def setup_method(self):
+        """Bootstrap a curve and a small bond ladder"""
+        self.curve = YieldCurve.bootstrap(TENORS, PAR_YIELDS)
+        self.bonds = BondPricer(
+            face=100,
+            coupon_rate=PAR_YIELDS,
+            maturity=TENORS
+        )
+
+    def test_par_bonds_price_at_par(self):
+        """Test bootstrapped curve reprices its par instruments"""
+        assert np.allclose(self.bonds.price(self.curve), 100.0, atol=1e-8)
+
+    def test_ytm_of_par_bond_is_coupon(self):
+        """Test Newton solver recovers coupon rate for par bonds"""
+        ytm = self.bonds.yield_to_maturity(np.full(5, 100.0))
+        assert np.allclose(ytm, PAR_YIELDS, atol=1e-9)
+
+    def test_ytm_round_trip(self):
+        """Test yields solved from curve prices reproduce those prices"""
+        bonds = BondPricer(100, [0.0, 0.03, 0.08], [7.25, 12.0, 3.5])
+        prices = bonds.price(self.curve)
+        ytm = bonds.yield_to_maturity(prices)
+
+        repriced = (bonds.cash_flows * bonds._discount_at_yield(ytm)).sum(axis=1)
+        assert np.allclose(repriced, prices, atol=1e-8)
+
+    def test_zero_coupon_duration_equals_maturity(self):
+        """Test Macaulay duration of a zero is its maturity"""
+        bonds = BondPricer(100, 0.0, [3.0, 10.0])
+        duration = bonds.duration(np.array([0.04, 0.05]))
+
+        assert np.allclose(duration['macaulay'], [3.0, 10.0])
+        assert (bonds.convexity(np.array([0.04, 0.05])) > 0).all()
+
+    def test_key_rate_durations_sum_to_parallel_duration(self):
+        """Test key-rate durations add up to the effective duration"""
+        krd = self.bonds.key_rate_durations(self.curve)
+        bump = 1e-4
+        up, down = self.bonds.reprice(self.curve, np.array([bump, -bump])).T
+        effective = -(up - down) / (2 * bump * self.bonds.price(self.curve))
+
+        assert krd.shape == (5, len(TENORS))
+        assert np.allclose(krd.sum(axis=1), effective, rtol=1e-6)
+
+    def test_batched_shock_repricing(self):
+        """Test repricing many bonds under many shocks is one matrix"""
+        rng = np.random.default_rng(1)
+        bonds = BondPricer(1000, rng.uniform(0, 0.08, 5000), rng.uniform(0.5, 30, 5000))
+        shocks = np.linspace(-0.02, 0.02, 101)
+
+        prices = bonds.reprice(self.curve, shocks)
+
+        assert prices.shape == (5000, 101)
+        assert np.allclose(prices[:, 50], bonds.price(self.curve))
+        # Prices fall as rates rise
+        assert (np.diff(prices, axis=1) < 0).all()
@@ -0,0 +1,73 @@
+"""Unit Tests for Education Content Catalog
+
+Tests indexes, search, and cache invalidation
+"""
+
+import os
+import shutil
+import pytest
+from education import catalog as catalog_module
+from education.catalog import ContentCatalog, MODULES_DIR
+
+
+@pytest.fixture
+def modules_dir(tmp_path):
+    """Copy the shipped modules into a scratch directory"""
+    target = tmp_path / 'modules'
+    shutil.copytree(MODULES_DIR, target)
+    return str(target)
+
+
+def test_lookup_indexes(modules_dir, tmp_path):
+    """Test id, difficulty, and topic lookups"""
+    catalog = ContentCatalog(modules_dir, str(tmp_path / 'catalog.pkl'))
+
+    assert catalog.get('intro_market')['title'] == 'Introduction to Markets'
+    assert catalog.get('intro_market')['level'] == 'beginner'
+    assert len(catalog.by_difficulty('beginner')) == 5
+    assert [m['id'] for m in catalog.by_topic('moving averages')] == ['basics_technical']
+    assert catalog.get('missing') is None
+
+
+def test_search(modules_dir, tmp_path):
+    """Test inverted index search requires every word"""
+    catalog = ContentCatalog(modules_dir, str(tmp_path / 'catalog.pkl'))
+
+    assert [m['id'] for m in catalog.search('ETFs')] == ['intro_market']
+    assert [m['id'] for m in catalog.search('Risk return')] == ['basic_portfolio', 'risk_return']
+    assert catalog.search('cryptocurrency') == []
+    assert catalog.search('the') == []
+
+
+def test_cache_skips_yaml_parsing(modules_dir, tmp_path, monkeypatch):
+    """Test a warm cache is loaded without parsing YAML"""
+    cache_path = str(tmp_path / 'catalog.pkl')
+    ContentCatalog(modules_dir, cache_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('YAML parsed with a warm cache')
+
+    monkeypatch.setattr(catalog_module.yaml, 'safe_load', fail)
+    catalog = ContentCatalog(modules_dir, cache_path)
+
+    assert catalog.get('risk_return') is not None
+
+
+def test_touched_file_reuses_cache(modules_dir, tmp_path):
+    """Test an mtime change with identical content is not a rebuild"""
+    catalog = ContentCatalog(modules_dir, str(tmp_path / 'catalog.pkl'))
+    path = os.path.join(modules_dir, 'beginner.yaml')
+    os.utime(path, ns=(0, 0))
+
+    assert catalog.refresh() is False
+
+
+def test_edited_file_rebuilds(modules_dir, tmp_path):
+    """Test new modules appear after the YAML changes"""
+    catalog = ContentCatalog(modules_dir, str(tmp_path / 'catalog.pkl'))
+    with open(os.path.join(modules_dir, 'advanced.yaml'), 'w') as f:
+        f.write('modules:\n  - id: options\n    title: Options Pricing\n    difficulty: advanced\n    topics: [Black-Scholes]\n')
+
+    assert catalog.refresh() is True
+    assert [m['id'] for m in catalog.search('black scholes')] == ['options']
+    assert catalog.get('options')['level'] == 'advanced'
@@ -0,0 +1,109 @@
+"""Unit Tests for Tutor Conversation Sessions
+
+Tests streaming, bounded context windows, and rolling summaries
+"""
+
+import asyncio
+from ai.conversation import ConversationWindow, TutorSession, estimate_tokens, iterate_sync
+from ai.tutor import LLMBackend, LocalStubBackend, TutorRuntime
+
+
+async def collect(async_iterable):
+    return [chunk async for chunk in async_iterable]
+
+
+class TestConversationWindow:
+    """Test suite for the token-budgeted window"""
+
+    def test_window_stays_within_budget(self):
+        """Test long sessions keep a flat token footprint"""
+        window = ConversationWindow(max_tokens=200, summary_tokens=50)
+
+        for i in range(500):
+            window.add('user', f"Question {i}. " + 'word ' * 20)
+
+        assert window.tokens <= 200
+        assert estimate_tokens(window.summary) <= 50
+        assert window.total_turns == 500
+        assert 'Question 499' in window.turns[-1]['content']
+
+    def test_summary_replaces_evicted_turns(self):
+        """Test evicted turns reappear as first-sentence summary lines"""
+        window = ConversationWindow(max_tokens=20, min_turns=1)
+        window.add('user', 'What is a bond? I keep hearing about them.')
+        window.add('assistant', 'A bond is a loan to an issuer. ' + 'detail ' * 20)
+
+        messages = window.messages()
+        assert messages[0]['role'] == 'system'
+        assert 'user: What is a bond?' in messages[0]['content']
+        assert len(window.turns) == 1
+
+    def test_min_turns_kept(self):
+        """Test the latest exchange is kept even if over budget"""
+        window = ConversationWindow(max_tokens=1, min_turns=2)
+        window.add('user', 'hello there')
+        window.add('assistant', 'hi, how can I help?')
+
+        assert len(window.turns) == 2
+
+
+class TestTutorSession:
+    """Test suite for streamed tutor sessions"""
+
+    def setup_method(self):
+        """Create a session over the streaming stub backend"""
+        self.backend = LocalStubBackend()
+        self.session = TutorSession(TutorRuntime(backend=self.backend))
+
+    def test_streams_multiple_chunks(self):
+        """Test answers arrive as several chunks that join to the reply"""
+        chunks = asyncio.run(collect(self.session.astream('What is a stock?')))
+
+        assert len(chunks) > 5
+        assert self.session.window.turns[-1]['content'] == ''.join(chunks)
+        assert self.session.last_agent == 'beginner_educator'
+
+    def test_history_sent_to_backend(self):
+        """Test the backend sees the windowed conversation"""
+        asyncio.run(collect(self.session.astream('What is a stock?')))
+        asyncio.run(collect(self.session.astream('And a bond?')))
+
+        roles = [m['role'] for m in self.backend.last_messages]
+        assert roles == ['user', 'assistant', 'user']
+
+    def test_repeat_question_served_from_cache(self):
+        """Test an opening question repeated by another session does not call the backend again"""
+        other = TutorSession(self.session.runtime)
+        first = ''.join(asyncio.run(collect(self.session.astream('What is a stock?'))))
+        second = ''.join(asyncio.run(collect(other.astream('what is a stock'))))
+
+        assert first == second
+        assert self.backend.calls == 1
+
+    def test_follow_ups_not_shared_across_sessions(self):
+        """Test identical follow-ups in different conversations each reach the backend"""
+        other = TutorSession(self.session.runtime)
+        asyncio.run(collect(self.session.astream('What is a bond?')))
+        asyncio.run(collect(self.session.astream('Can you give an example?')))
+        asyncio.run(collect(other.astream('What is an ETF?')))
+        etf = ''.join(asyncio.run(collect(other.astream('Can you give an example?'))))
+
+        assert self.backend.calls == 4
+        assert self.backend.last_messages[0]['content'] == 'What is an ETF?'
+        assert other.window.turns[-1]['content'] == etf
+
+    def test_iterate_sync(self):
+        """Test async streams can be consumed from synchronous code"""
+        chunks = list(iterate_sync(self.session.astream('Explain technical indicators for AAPL')))
+        assert ''.join(chunks).startswith('As an expert market analyst')
+
+    def test_default_astream_wraps_complete(self):
+        """Test backends that only implement complete() stream one chunk from a worker thread"""
+        class CompleteOnly(LLMBackend):
+            def complete(self, system_prompt, prompt):
+                return f"answer to {prompt}"
+
+        session = TutorSession(TutorRuntime(backend=CompleteOnly()))
+        chunks = asyncio.run(collect(session.astream('What is a stock?')))
+
+        assert chunks == ['answer to What is a stock?']
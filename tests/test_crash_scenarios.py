@@ -0,0 +1,82 @@
+"""Unit Tests for Crash Scenario Engine
+
+Tests historical windows, parametric shocks, and batched portfolio evaluation
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from simulations.crash_scenarios import CrashScenarioEngine, HISTORICAL_CRASHES
+from simulations.trading_sim import TradingSimulator
+
+
+class TestCrashScenarioEngine:
+    """Test suite for the crash scenario engine"""
+
+    def setup_method(self):
+        """Create an engine with three assets"""
+        self.engine = CrashScenarioEngine(['AAPL', 'MSFT', 'TLT'])
+
+    def test_parametric_shock_pnl(self):
+        """Test P&L of an instantaneous shock is shock x holdings"""
+        self.engine.add_parametric('crash', -0.20, betas={'TLT': -0.25})
+        result = self.engine.evaluate([1000, 2000, 4000])
+
+        assert result['pnl'].iloc[0, 0] == pytest.approx(-200 - 400 + 200)
+        assert result['max_drawdown'].iloc[0, 0] == pytest.approx(-400 / 7000 * 100)
+
+    def test_historical_without_prices_uses_market_shock(self):
+        """Test historical windows fall back to the benchmark loss"""
+        self.engine.add_historical('covid_2020')
+        shock = HISTORICAL_CRASHES['covid_2020']['market_shock']
+
+        assert np.allclose(self.engine.shock_matrix, shock)
+
+    def test_historical_with_prices(self):
+        """Test historical windows use observed prices and path drawdown"""
+        dates = pd.date_range('2020-02-19', '2020-03-23', freq='B')
+        prices = pd.DataFrame({
+            'AAPL': np.linspace(100, 70, len(dates)),
+            'MSFT': np.concatenate([np.linspace(100, 50, len(dates) - 1), [80]]),
+        }, index=dates)
+
+        self.engine.add_historical('covid_2020', prices=prices)
+        result = self.engine.evaluate([0, 1000, 0])
+
+        assert result['return'].iloc[0, 0] == pytest.approx(-20.0)
+        assert result['max_drawdown'].iloc[0, 0] == pytest.approx(-50.0)
+        # TLT has no history and follows the observed market path
+        assert self.engine.shock_matrix[0, 2] == pytest.approx((-0.30 - 0.20) / 2)
+
+    def test_many_scenarios_many_portfolios(self):
+        """Test output shape is scenarios x portfolios"""
+        self.engine.add_synthetic(200, [-0.01, -0.01, 0.001], np.eye(3) * 0.0004, days=10, seed=7)
+        holdings = np.random.default_rng(0).random((3, 50)) * 1000
+
+        result = self.engine.evaluate(holdings)
+
+        assert result['pnl'].shape == (200, 50)
+        assert np.allclose(result['pnl'].to_numpy(), self.engine.shock_matrix @ holdings)
+        assert (result['max_drawdown'].to_numpy() <= 0).all()
+
+    def test_stress_test_accounts(self):
+        """Test paper-trading accounts are stressed including cash"""
+        sim_a = TradingSimulator(initial_capital=10000)
+        sim_a.buy('AAPL', 10, 100.0)
+        sim_b = TradingSimulator(initial_capital=10000)
+
+        self.engine.add_parametric('crash', -0.50)
+        result = self.engine.stress_test_accounts({'a': sim_a, 'b': sim_b}, {'AAPL': 100.0})
+
+        assert result['pnl'].loc['crash', 'a'] == pytest.approx(-500)
+        assert result['return'].loc['crash', 'a'] == pytest.approx(-5.0)
+        assert result['pnl'].loc['crash', 'b'] == 0
+
+    def test_unknown_ticker_raises(self):
+        """Test accounts holding unknown tickers are rejected"""
+        sim = TradingSimulator(initial_capital=10000)
+        sim.buy('TSLA', 1, 100.0)
+        self.engine.add_parametric('crash', -0.50)
+
+        with pytest.raises(ValueError):
+            self.engine.stress_test_accounts({'a': sim}, {'TSLA': 100.0})
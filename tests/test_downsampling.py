@@ -0,0 +1,87 @@
+"""Unit Tests for Chart Downsampling
+
+Tests LTTB point selection, OHLCV aggregation, and percentile bands
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from benchmarks.fixtures import synthetic_ohlcv
+from core.downsampling import aggregate_ohlcv, downsample_series, lttb, percentile_bands
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    """Test LTTB returns sorted indices including endpoints and an isolated spike"""
+    y = np.sin(np.linspace(0, 20, 10000))
+    y[4321] = 50.0
+
+    idx = lttb(np.arange(len(y)), y, 200)
+
+    assert len(idx) == 200
+    assert idx[0] == 0 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 4321 in idx
+
+
+def test_lttb_small_input_unchanged():
+    """Test inputs at or below the threshold are returned whole"""
+    assert list(lttb([0, 1, 2], [1, 2, 3], 10)) == [0, 1, 2]
+
+
+def test_downsample_series_with_dates():
+    """Test datetime-indexed series downsample to the requested size"""
+    index = pd.date_range('2024-01-01', periods=5000, freq='min')
+    series = pd.Series(np.cumsum(np.random.default_rng(0).normal(size=5000)), index=index)
+
+    result = downsample_series(series, 300)
+
+    assert len(result) == 300
+    assert result.index.is_monotonic_increasing
+    assert result.iloc[-1] == series.iloc[-1]
+
+
+def test_aggregate_ohlcv_preserves_extremes():
+    """Test candles keep first open, last close, extremes, and total volume"""
+    bars = synthetic_ohlcv(10)
+
+    candles = aggregate_ohlcv(bars, 250)
+
+    assert len(candles) == 250
+    assert candles['Open'].iloc[0] == bars['Open'].iloc[0]
+    assert candles['Close'].iloc[-1] == bars['Close'].iloc[-1]
+    assert candles['High'].max() == bars['High'].max()
+    assert candles['Low'].min() == bars['Low'].min()
+    assert candles['Volume'].sum() == bars['Volume'].sum()
+    assert (candles['High'] >= candles[['Open', 'Close']].max(axis=1)).all()
+
+
+def test_aggregate_ohlcv_small_input_unchanged():
+    """Test short histories pass through untouched"""
+    bars = synthetic_ohlcv(1)
+    assert aggregate_ohlcv(bars, 500) is bars
+
+
+def test_percentile_bands():
+    """Test bands are ordered and thinned to max_points including the last step"""
+    paths = 100 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.01, size=(500, 1001)), axis=1))
+    index = pd.bdate_range('2025-01-01', periods=1001)
+
+    bands = percentile_bands(paths, index=index, max_points=200)
+
+    assert list(bands.columns) == ['p5', 'p25', 'p50', 'p75', 'p95']
+    assert len(bands) == 200
+    assert bands.index[-1] == index[-1]
+    assert (bands.diff(axis=1).iloc[:, 1:] >= 0).all().all()
+    assert bands['p50'].iloc[-1] == pytest.approx(np.median(paths[:, -1]))
+
+
+def test_downsample_series_with_tz_aware_dates():
+    """Test tz-aware indexes (as returned by yfinance intraday) downsample like naive ones"""
+    index = pd.date_range('2024-01-02 09:30', periods=2000, freq='min', tz='America/New_York')
+    series = pd.Series(np.cumsum(np.random.default_rng(2).normal(size=2000)), index=index)
+
+    result = downsample_series(series, 100)
+    naive = downsample_series(series.tz_convert(None), 100)
+
+    assert len(result) == 100
+    assert (result.to_numpy() == naive.to_numpy()).all()
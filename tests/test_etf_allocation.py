@@ -0,0 +1,68 @@
+"""Unit Tests for ETF Allocation Simulator
+
+Tests look-through exposures, overlap, concentration, and trade tracking
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from simulations.etf_allocation import ETFAllocationSimulator, ExposureTracker
+from simulations.trading_sim import TradingSimulator
+
+
+@pytest.fixture
+def holdings_dir(tmp_path):
+    """Write two small ETF holdings files"""
+    pd.DataFrame({'ticker': ['AAPL', 'MSFT', 'NVDA'], 'weight': [50, 30, 20]}).to_csv(tmp_path / 'qqq.csv', index=False)
+    pd.DataFrame({'ticker': ['AAPL', 'JPM'], 'weight': [0.4, 0.6]}).to_csv(tmp_path / 'spy.csv', index=False)
+    return tmp_path
+
+
+def test_load_and_normalize(holdings_dir):
+    """Test holdings files load into a row-normalized sparse matrix"""
+    sim = ETFAllocationSimulator.from_directory(str(holdings_dir))
+
+    assert sim.etfs == ['QQQ', 'SPY']
+    assert np.allclose(np.asarray(sim.matrix.sum(axis=1)).ravel(), 1.0)
+
+
+def test_look_through_exposures(holdings_dir):
+    """Test exposures combine ETFs and direct holdings"""
+    sim = ETFAllocationSimulator.from_directory(str(holdings_dir))
+    exposures = sim.exposures({'QQQ': 1000, 'SPY': 1000, 'AAPL': 100, 'TSLA': 50})
+
+    assert exposures['AAPL'] == pytest.approx(500 + 400 + 100)
+    assert exposures['JPM'] == pytest.approx(600)
+    assert exposures['TSLA'] == pytest.approx(50)
+    assert exposures.sum() == pytest.approx(2150)
+
+
+def test_overlap_and_concentration(holdings_dir):
+    """Test overlap matrix and effective number of holdings"""
+    sim = ETFAllocationSimulator.from_directory(str(holdings_dir))
+
+    overlap = sim.overlap_matrix()
+    assert overlap.loc['QQQ', 'QQQ'] == pytest.approx(1.0)
+    assert 0 < overlap.loc['QQQ', 'SPY'] < 1
+    assert sim.common_holdings().loc['QQQ', 'SPY'] == 1
+
+    stats = sim.concentration({'SPY': 1.0})
+    assert stats['hhi'] == pytest.approx(0.4 ** 2 + 0.6 ** 2)
+    assert stats['effective_holdings'] == pytest.approx(1 / 0.52)
+
+
+def test_tracker_follows_trades(holdings_dir):
+    """Test incremental exposures match a full recomputation"""
+    etf_sim = ETFAllocationSimulator.from_directory(str(holdings_dir))
+    trader = TradingSimulator(initial_capital=100000)
+    trader.buy('QQQ', 10, 400.0)
+
+    tracker = ExposureTracker(etf_sim, trader)
+    trader.buy('SPY', 5, 500.0)
+    trader.buy('AAPL', 3, 200.0)
+    trader.sell('QQQ', 4, 410.0)
+
+    expected = etf_sim.exposures({'QQQ': 6 * 410.0, 'SPY': 5 * 500.0, 'AAPL': 3 * 200.0})
+    actual = tracker.exposures()
+
+    assert np.allclose(actual.sort_index(), expected.sort_index())
@@ -0,0 +1,118 @@
+"""Unit Tests for Instrumentation
+
+Tests timers, counters, disabled no-op behaviour, and metric exports
+"""
+
+import json
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from core import instrumentation
+from core.data_ingestion import DataIngestion
+from core.instrumentation import count, registry, render_prometheus, timed, timer
+from models.monte_carlo import monte_carlo_simulation
+
+
+@pytest.fixture
+def metrics():
+    """Enabled, empty registry restored to its previous state afterwards"""
+    previous = instrumentation.is_enabled()
+    registry.reset()
+    instrumentation.enable(True)
+    yield registry
+    instrumentation.enable(previous)
+    registry.reset()
+
+
+def test_timer_and_counter(metrics):
+    """Test timed calls and counters accumulate"""
+    @timed("unit.work")
+    def work(x):
+        return x * 2
+
+    assert work(2) == 4
+    work(3)
+    with timer("unit.block"):
+        pass
+    count("unit.calls", 5)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["timers"]["unit.work"]["count"] == 2
+    assert snapshot["timers"]["unit.block"]["count"] == 1
+    assert snapshot["counters"]["unit.calls"] == 5
+    assert snapshot["gauges"]["process_max_rss_bytes"] > 0
+
+
+def test_disabled_records_nothing(metrics):
+    """Test hooks are no-ops while disabled"""
+    instrumentation.enable(False)
+
+    @timed("unit.work")
+    def work():
+        return 1
+
+    work()
+    with timer("unit.block"):
+        pass
+    count("unit.calls")
+
+    assert metrics.snapshot() == {"timers": {}, "counters": {}, "gauges": {}}
+
+
+def test_hot_paths_instrumented(metrics, tmp_path):
+    """Test model timings and cache hit/miss counters are recorded"""
+    prices = pd.Series(100 * np.exp(np.cumsum(np.full(100, 0.001))))
+    monte_carlo_simulation(prices, days=10, simulations=5)
+
+    ingestion = DataIngestion(cache_dir=str(tmp_path))
+    assert ingestion.load_cached_data("missing.csv") is None
+    ingestion.cache_data(prices.to_frame("SYN"), "prices.csv")
+    ingestion.load_cached_data("prices.csv")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["timers"]["models.monte_carlo_simulation"]["count"] == 1
+    assert snapshot["counters"]["cache.data.hit"] == 1
+    assert snapshot["counters"]["cache.data.miss"] == 1
+
+
+def test_prometheus_and_dump(metrics, tmp_path):
+    """Test Prometheus text rendering and file dumps"""
+    count("network.yf_download", 3)
+    with timer("portfolio.optimize_sharpe"):
+        pass
+
+    text = render_prometheus()
+    assert "finlearnx_network_yf_download_total 3" in text
+    assert "finlearnx_portfolio_optimize_sharpe_seconds_count 1" in text
+
+    instrumentation.dump(str(tmp_path / "metrics.json"))
+    with open(tmp_path / "metrics.json") as f:
+        assert json.load(f)["counters"]["network.yf_download"] == 3
+
+
+def test_profile_capture(metrics):
+    """Test cProfile captures are kept as text"""
+    profiler = instrumentation.start_profile()
+    sum(range(1000))
+    report = instrumentation.stop_profile(profiler)
+
+    assert "function calls" in report
+    assert registry.last_profile == report
+
+
+def test_allocation_tracing_is_separate_opt_in(metrics):
+    """Test enable() leaves tracemalloc alone and trace_allocations() feeds the traced peak gauge"""
+    assert not tracemalloc.is_tracing()
+
+    instrumentation.trace_allocations()
+    try:
+        with timer("unit.alloc"):
+            block = np.ones(100000)
+        del block
+    finally:
+        instrumentation.trace_allocations(False)
+
+    assert metrics.snapshot()["gauges"]["traced_peak_bytes"] >= 800000
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,67 @@
+"""Unit Tests for Lazy Imports
+
+Tests the lazy module proxy and the import-time budget of the app and library
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from core.lazy import LazyModule, is_loaded, lazy_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy dependencies that must only load when a numeric feature is used
+HEAVY_MODULES = ["yfinance", "scipy.optimize", "matplotlib", "plotly.graph_objects", "sqlalchemy", "openai"]
+
+# Extra import time allowed on top of streamlit itself
+IMPORT_BUDGET_SECONDS = 1.0
+
+PROBE = """
+import json, sys, time
+import streamlit
+preloaded = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules and m not in preloaded]}}))
+"""
+
+
+def probe_imports(modules):
+    """Import modules in a fresh interpreter; report time and heavy modules they added"""
+    code = PROBE.format(modules=modules, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                            text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_lazy_module_loads_on_first_access():
+    """Test the proxy imports on attribute access and reuses loaded modules"""
+    module = LazyModule("colorsys")
+
+    assert "not loaded" in repr(module)
+    assert module.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert "(loaded)" in repr(module)
+    assert lazy_import("json") is json
+    assert is_loaded("json")
+
+
+def test_pages_import_within_budget():
+    """Test app pages import without heavy dependencies inside the budget"""
+    pages = [f"app.sections.{name[:-3]}" for name in sorted(os.listdir(os.path.join(ROOT, "app", "sections")))
+             if name.endswith(".py")]
+    result = probe_imports(pages)
+
+    assert result["loaded"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_library_defers_heavy_imports():
+    """Test numeric modules defer yfinance, scipy.optimize, and matplotlib"""
+    result = probe_imports(["core.data_ingestion", "portfolio.optimize_mpt", "models.monte_carlo",
+                            "backtesting.engine", "simulations.trading_sim", "ai.market_facts"])
+
+    assert result["loaded"] == []
@@ -0,0 +1,168 @@
+"""Unit Tests for Paper Trading Ledger
+
+Tests batched persistence, materialized positions, and account reloads
+"""
+
+import time
+import weakref
+
+import pytest
+from sqlalchemy import inspect, text
+from simulations.ledger import MAX_TIMER_RETRIES, LedgerStore, _flush_on_exit
+from simulations.trading_sim import TradingSimulator
+
+
+class TestLedgerStore:
+    """Test suite for the SQLite-backed ledger"""
+
+    def setup_method(self):
+        """Create a fresh simulator for each test"""
+        self.sim = TradingSimulator(initial_capital=100000)
+
+    def make_store(self, tmp_path, batch_size=100, max_latency=None):
+        return LedgerStore(f"sqlite:///{tmp_path / 'ledger.db'}", batch_size=batch_size, max_latency=max_latency)
+
+    def test_wal_mode_and_indexes(self, tmp_path):
+        """Test the database runs in WAL mode with account/ticker indexes"""
+        store = self.make_store(tmp_path)
+
+        with store.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == 'wal'
+
+        index_names = {index['name'] for index in inspect(store.engine).get_indexes('transactions')}
+        assert 'ix_transactions_account_ticker' in index_names
+
+    def test_writes_are_batched(self, tmp_path):
+        """Test transactions stay buffered until the batch fills"""
+        store = self.make_store(tmp_path, batch_size=3)
+        store.attach(self.sim, 'alice')
+
+        self.sim.buy('AAPL', 10, 150.0)
+        self.sim.buy('MSFT', 5, 300.0)
+        with store.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM transactions")).scalar() == 0
+
+        self.sim.sell('AAPL', 4, 160.0)
+        with store.engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM transactions")).scalar() == 3
+
+    def test_reload_matches_simulator(self, tmp_path):
+        """Test a reloaded account has the same cash and positions"""
+        store = self.make_store(tmp_path)
+        store.attach(self.sim, 'alice')
+
+        self.sim.buy('AAPL', 10, 150.0)
+        self.sim.buy('GOOGL', 2, 2000.0)
+        self.sim.sell('AAPL', 10, 160.0)
+        self.sim.buy('MSFT', 3, 300.0)
+        store.close()
+
+        reloaded = LedgerStore(f"sqlite:///{tmp_path / 'ledger.db'}").load_simulator('alice')
+
+        assert reloaded.cash == pytest.approx(self.sim.cash)
+        assert reloaded.portfolio == self.sim.portfolio
+        assert 'AAPL' not in reloaded.portfolio
+
+    def test_accounts_are_isolated(self, tmp_path):
+        """Test multiple users share one database without mixing positions"""
+        store = self.make_store(tmp_path)
+        other = TradingSimulator(initial_capital=50000)
+        store.attach(self.sim, 'alice')
+        store.attach(other, 'bob')
+
+        self.sim.buy('AAPL', 10, 150.0)
+        other.buy('AAPL', 1, 150.0)
+
+        assert store.load_simulator('alice').portfolio == {'AAPL': 10}
+        assert store.load_simulator('bob').portfolio == {'AAPL': 1}
+        assert store.load_simulator('bob').cash == pytest.approx(50000 - 150.0)
+        assert store.load_simulator('carol') is None
+
+    def test_transaction_history(self, tmp_path):
+        """Test the append-only log is queryable per account and ticker"""
+        store = self.make_store(tmp_path)
+        store.attach(self.sim, 'alice')
+
+        self.sim.buy('AAPL', 10, 150.0)
+        self.sim.buy('MSFT', 5, 300.0)
+        self.sim.sell('AAPL', 5, 155.0)
+
+        history = store.transaction_history('alice', ticker='AAPL')
+        assert [row['type'] for row in history] == ['SELL', 'BUY']
+        assert len(store.transaction_history('alice', limit=1)) == 1
+
+    def test_max_latency_flush_visible_to_other_store(self, tmp_path):
+        """Test a partial batch reaches the database without waiting for it to fill"""
+        store = self.make_store(tmp_path, batch_size=100, max_latency=0.05)
+        reader = self.make_store(tmp_path)
+        store.attach(self.sim, 'alice')
+
+        self.sim.buy('AAPL', 10, 150.0)
+        deadline = time.time() + 5
+        while reader.load_simulator('alice').portfolio != {'AAPL': 10} and time.time() < deadline:
+            time.sleep(0.02)
+
+        assert reader.load_simulator('alice').cash == pytest.approx(98500.0)
+
+    def test_exit_hook_flushes_buffer(self, tmp_path):
+        """Test buffered trades are written by the atexit flush"""
+        store = self.make_store(tmp_path)
+        store.attach(self.sim, 'alice')
+        self.sim.buy('AAPL', 10, 150.0)
+        _flush_on_exit(weakref.ref(store))
+
+        assert self.make_store(tmp_path).load_simulator('alice').portfolio == {'AAPL': 10}
+
+    def test_attach_seeds_existing_state(self, tmp_path):
+        """Test attaching a simulator that already traded stores its real cash and positions"""
+        store = self.make_store(tmp_path)
+        self.sim.buy('AAPL', 10, 150.0)
+        store.attach(self.sim, 'alice')
+
+        reloaded = store.load_simulator('alice')
+        assert reloaded.cash == pytest.approx(98500.0)
+        assert reloaded.portfolio == {'AAPL': 10}
+        assert len(store.transaction_history('alice')) == 1
+
+        store.attach(reloaded, 'alice')
+        with pytest.raises(ValueError):
+            store.attach(TradingSimulator(initial_capital=100000), 'alice')
+
+    def test_last_trade_prices(self, tmp_path):
+        """Test the latest price per ticker is returned, optionally for a subset"""
+        store = self.make_store(tmp_path)
+        store.attach(self.sim, 'alice')
+        self.sim.buy('AAPL', 10, 150.0)
+        self.sim.buy('MSFT', 5, 300.0)
+        self.sim.sell('AAPL', 5, 155.0)
+
+        assert store.last_trade_prices('alice') == {'AAPL': 155.0, 'MSFT': 300.0}
+        assert store.last_trade_prices('alice', ['MSFT']) == {'MSFT': 300.0}
+        assert store.last_trade_prices('bob') == {}
+
+    def test_timer_flush_failures_logged_and_bounded(self, tmp_path, caplog):
+        """Test a failing timer flush is logged and stops retrying after MAX_TIMER_RETRIES"""
+        store = self.make_store(tmp_path, max_latency=0.01)
+        store.attach(self.sim, 'alice')
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ConnectionError('database unavailable')
+
+        store.flush = fail
+        self.sim.buy('AAPL', 10, 150.0)
+        time.sleep(0.5)
+
+        assert len(calls) == MAX_TIMER_RETRIES
+        assert 'Ledger flush failed' in caplog.text
+        del store.flush
+        assert store.load_simulator('alice').portfolio == {'AAPL': 10}
+
+    def test_in_memory_sqlite_requires_no_timer(self):
+        """Test in-memory SQLite is refused with a timer but works without one"""
+        with pytest.raises(ValueError):
+            LedgerStore('sqlite://')
+        store = LedgerStore('sqlite://', max_latency=None)
+        store.open_account('alice')
+        assert store.load_simulator('alice').cash == 100000
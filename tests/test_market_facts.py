@@ -0,0 +1,118 @@
+"""Unit Tests for Market Facts Index
+
+Tests fact sheet computation, incremental refresh, and tutor grounding
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from ai.market_facts import MarketFactsIndex, compute_fact_sheet
+from ai.tutor import LocalStubBackend, TutorRuntime, load_agents
+from core.data_ingestion import DataIngestion
+
+
+def make_prices(days=300, seed=0):
+    """Deterministic synthetic closing prices for two tickers"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2023-01-02', periods=days)
+    returns = rng.normal(0.0005, 0.01, size=(days, 2))
+    return pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=index, columns=['AAPL', 'MSFT'])
+
+
+def test_fact_sheet_values():
+    """Test returns, drawdown, and volatility match direct calculations"""
+    prices = make_prices()['AAPL']
+    sheet = compute_fact_sheet('AAPL', prices, mc_simulations=50)
+
+    assert sheet['last_price'] == pytest.approx(prices.iloc[-1])
+    assert sheet['return_1m'] == pytest.approx((prices.iloc[-1] / prices.iloc[-22] - 1) * 100)
+    assert sheet['max_drawdown'] <= 0
+    assert sheet['volatility'] == pytest.approx(prices.pct_change().std() * np.sqrt(252) * 100)
+    assert not np.isnan(sheet['ma_strategy_return'])
+    assert not np.isnan(sheet['mc_p5_return'])
+
+
+def test_incremental_refresh():
+    """Test only tickers with new bars are recomputed"""
+    prices = make_prices()
+    index = MarketFactsIndex(mc_simulations=10)
+
+    assert index.refresh(prices.iloc[:-1]) == ['AAPL', 'MSFT']
+    assert index.refresh(prices.iloc[:-1]) == []
+    version = index.snapshot_id
+
+    next_day = prices.copy()
+    next_day.iloc[-1, 1] = np.nan
+    assert index.refresh(next_day) == ['AAPL']
+    assert index.snapshot_id != version
+
+
+def test_fill_ticker_prompt():
+    """Test '{ticker}' prompts are filled from the precomputed summary"""
+    index = MarketFactsIndex(mc_simulations=10)
+    index.refresh(make_prices())
+    template = load_agents()['agents']['market_analyst'].instruction_prompts[1]
+
+    prompt = index.fill(template, 'AAPL')
+
+    assert prompt.startswith('Explain technical indicators for AAPL')
+    assert 'Market facts for AAPL' in prompt
+
+
+def test_tutor_grounds_data_agents():
+    """Test market analyst prompts carry facts while educators do not"""
+    index = MarketFactsIndex(mc_simulations=10)
+    index.refresh(make_prices())
+    runtime = TutorRuntime(backend=LocalStubBackend(), facts=index)
+
+    grounded = runtime.ask('Explain technical indicators for AAPL')
+    plain = runtime.ask('What is a stock like AAPL?', agent='beginner_educator')
+
+    assert grounded['agent'] == 'market_analyst'
+    assert 'Market facts for AAPL' in grounded['response']
+    assert 'Market facts' not in plain['response']
+
+
+def test_tickers_in_is_case_insensitive():
+    """Test lowercase mentions match indexed tickers once, unindexed words do not"""
+    index = MarketFactsIndex(mc_simulations=10)
+    index.refresh(make_prices())
+
+    assert index.tickers_in('Compare aapl with Msft, then AAPL again') == ['AAPL', 'MSFT']
+    assert index.tickers_in('what is a stock') == []
+
+
+def test_tickers_in_ignores_common_words():
+    """Test 'a'/'it'/'on'/'now' do not match A/IT/ON/NOW unless uppercase or '$'-prefixed"""
+    index = MarketFactsIndex(mc_simulations=10)
+    prices = make_prices()
+    index.refresh(pd.DataFrame({t: prices['AAPL'] for t in ['A', 'IT', 'ON', 'NOW']}))
+
+    assert index.tickers_in('What is a stock and is it on sale now?') == []
+    assert index.tickers_in('Compare IT with $on and $a') == ['IT', 'ON', 'A']
+
+
+class FakeIngestion(DataIngestion):
+    """DataIngestion whose download returns yfinance-style multi-ticker OHLCV"""
+
+    def load_data(self, tickers, start_date, end_date, interval='1d'):
+        closes = make_prices()[tickers]
+        return pd.concat({'Close': closes, 'High': closes * 1.01}, axis=1)
+
+
+def test_refresh_from_ingestion_builds_close_panel(tmp_path):
+    """Test OHLCV downloads are reduced to a cached closes panel that refresh_from_store can read"""
+    store = FakeIngestion(cache_dir=str(tmp_path))
+    index = MarketFactsIndex(mc_simulations=10)
+
+    assert index.refresh_from_ingestion(store, ['AAPL', 'MSFT'], 'closes.csv') == ['AAPL', 'MSFT']
+    assert list(store.load_cached_data('closes.csv').columns) == ['AAPL', 'MSFT']
+    assert MarketFactsIndex(mc_simulations=10).refresh_from_store(store, 'closes.csv') == ['AAPL', 'MSFT']
+
+
+def test_refresh_rejects_ohlcv_frames():
+    """Test an OHLCV frame fails loudly instead of indexing 'Close' as a ticker"""
+    ohlcv = make_prices()['AAPL'].to_frame('Close').assign(High=1.0)
+
+    with pytest.raises(ValueError):
+        MarketFactsIndex(mc_simulations=10).refresh(ohlcv)
@@ -0,0 +1,115 @@
+"""Unit Tests for Order Book Module
+
+Tests limit/stop triggering, gap fills, cancellation, and rejections
+"""
+
+from simulations.order_book import OrderBook, OrderMatcher
+from simulations.trading_sim import TradingSimulator
+
+
+class TestOrderMatcher:
+    """Test suite for resting order matching"""
+
+    def setup_method(self):
+        """Register one funded account holding some AAPL"""
+        self.sim = TradingSimulator(initial_capital=100000)
+        self.sim.buy('AAPL', 100, 150.0)
+        self.matcher = OrderMatcher()
+        self.matcher.register('alice', self.sim)
+
+    def test_buy_limit_rests_until_crossed(self):
+        """Test buy limit fills only once price trades at or below the limit"""
+        self.matcher.submit('alice', 'AAPL', 'BUY', 10, 'LIMIT', 140.0)
+
+        assert self.matcher.process_bar('AAPL', 150.0, 152.0, 141.0) == []
+        filled = self.matcher.process_bar('AAPL', 142.0, 143.0, 139.0)
+
+        assert len(filled) == 1
+        assert filled[0]['status'] == 'FILLED'
+        assert filled[0]['fill_price'] == 140.0
+        assert self.sim.portfolio['AAPL'] == 110
+
+    def test_gap_fills_at_open(self):
+        """Test a bar gapping through a limit fills at the better open"""
+        self.matcher.submit('alice', 'AAPL', 'SELL', 10, 'LIMIT', 160.0)
+        filled = self.matcher.process_bar('AAPL', 165.0, 170.0, 164.0)
+
+        assert filled[0]['fill_price'] == 165.0
+
+    def test_stop_orders(self):
+        """Test sell stop triggers on a drop and buy stop on a breakout"""
+        self.matcher.submit('alice', 'AAPL', 'SELL', 50, 'STOP', 145.0)
+        self.matcher.submit('alice', 'MSFT', 'BUY', 5, 'STOP', 310.0)
+
+        sold = self.matcher.process_bar('AAPL', 144.0, 146.0, 140.0)
+        bought = self.matcher.process_price('MSFT', 312.0)
+
+        assert sold[0]['fill_price'] == 144.0
+        assert self.sim.portfolio['AAPL'] == 50
+        assert bought[0]['fill_price'] == 312.0
+        assert self.sim.portfolio['MSFT'] == 5
+
+    def test_only_crossed_orders_are_processed(self):
+        """Test untouched levels remain resting"""
+        for limit in range(100, 150):
+            self.matcher.submit('alice', 'AAPL', 'BUY', 1, 'LIMIT', float(limit))
+
+        filled = self.matcher.process_bar('AAPL', 146.0, 147.0, 145.0)
+
+        assert sorted(order['price'] for order in filled) == [145.0, 146.0, 147.0, 148.0, 149.0]
+        assert len(self.matcher.open_orders('alice')) == 45
+
+    def test_cancelled_orders_never_fill(self):
+        """Test cancellation is honoured when the level is crossed"""
+        order_id = self.matcher.submit('alice', 'AAPL', 'BUY', 10, 'LIMIT', 140.0)['order_id']
+        assert self.matcher.cancel(order_id)['success']
+
+        assert self.matcher.process_price('AAPL', 130.0) == []
+        assert not self.matcher.cancel(order_id)['success']
+
+    def test_rejected_when_insufficient_funds(self):
+        """Test triggered orders the account cannot afford are rejected"""
+        self.matcher.submit('alice', 'TSLA', 'BUY', 10000, 'LIMIT', 200.0)
+        result = self.matcher.process_price('TSLA', 190.0)
+
+        assert result[0]['status'] == 'REJECTED'
+        assert 'Insufficient funds' in result[0]['message']
+
+    def test_invalid_submissions(self):
+        """Test unsupported orders are refused"""
+        assert not self.matcher.submit('bob', 'AAPL', 'BUY', 1, 'LIMIT', 100.0)['success']
+        assert not self.matcher.submit('alice', 'AAPL', 'HOLD', 1, 'LIMIT', 100.0)['success']
+        assert not self.matcher.submit('alice', 'AAPL', 'BUY', 0, 'LIMIT', 100.0)['success']
+
+
+def test_book_pops_in_trigger_order():
+    """Test the heap only yields orders whose trigger was crossed"""
+    book = OrderBook('AAPL')
+    for i, price in enumerate([101.0, 99.0, 105.0]):
+        book.add({'id': i, 'side': 'SELL', 'order_type': 'LIMIT', 'price': price, 'status': 'OPEN'})
+
+    triggered = book.triggered(high=102.0, low=98.0)
+
+    assert [order['price'] for order in triggered] == [101.0, 99.0]
+    assert len(book) == 1
+
+
+def test_cancelled_orders_not_counted_and_compacted():
+    """Test cancellations drop out of len() and mostly-dead heaps are rebuilt"""
+    matcher = OrderMatcher()
+    matcher.register('alice', TradingSimulator(initial_capital=100000))
+    ids = [matcher.submit('alice', 'AAPL', 'BUY', 1, 'LIMIT', float(100 + i))['order_id'] for i in range(10)]
+    book = matcher.books['AAPL']
+
+    for order_id in ids[:5]:
+        matcher.cancel(order_id)
+    assert len(book) == 5
+    assert len(book._buy_limits) == 10
+
+    matcher.cancel(ids[5])
+    assert len(book) == 4
+    assert len(book._buy_limits) == 4
+
+    filled = matcher.process_price('AAPL', 100.0)
+    assert [order['id'] for order in filled] == ids[6:]
+    assert len(book) == 0
@@ -7,6 +7,7 @@ import pytest
 import numpy as np
 import pandas as pd
 from portfolio.optimize_mpt import MPTOptimizer
+from benchmarks.fixtures import synthetic_prices
 
 def test_portfolio_weights_sum_to_one():
     """Test that portfolio weights sum to 1"""
@@ -24,6 +25,22 @@ def test_weights_are_positive():
     
     assert all(w >= 0 for w in weights), "All weights should be non-negative"
 
+def test_optimize_sharpe_offline():
+    """Test optimization on synthetic prices without network access"""
+    optimizer = MPTOptimizer.from_prices(synthetic_prices(5, 3))
+    weights = optimizer.optimize_sharpe()
+    
+    assert np.isclose(np.sum(weights), 1.0)
+    assert all(w >= -1e-9 for w in weights)
+
+def test_efficient_frontier_shape_offline():
+    """Test frontier returns return, volatility, and Sharpe rows"""
+    optimizer = MPTOptimizer.from_prices(synthetic_prices(5, 3))
+    results = optimizer.efficient_frontier(num_portfolios=50)
+    
+    assert results.shape == (3, 50)
+    assert (results[1] > 0).all()
+
 # Placeholder for more tests
 # TODO: Add tests for backtesting
 # TODO: Add tests for simulations
@@ -0,0 +1,138 @@
+"""Unit Tests for Price Scheduler
+
+Tests batching, watcher union and expiry, stale fallback, and the refresh thread
+"""
+
+import pytest
+from core.price_scheduler import PriceScheduler, PriceSnapshot, StaticPriceSource
+from simulations.trading_sim import TradingSimulator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_refresh_batches_union_of_watchers():
+    """Test every watched ticker is fetched once, in bounded batches"""
+    source = StaticPriceSource({'AAPL': 150.0, 'MSFT': 300.0, 'NVDA': 500.0, 'V': 250.0, 'JPM': 140.0})
+    scheduler = PriceScheduler(source, batch_size=2)
+
+    scheduler.watch('a', ['AAPL', 'MSFT', 'NVDA'])
+    scheduler.watch('b', ['MSFT', 'V', 'JPM'])
+    snapshot = scheduler.refresh_now()
+
+    assert source.batches == [['AAPL', 'JPM'], ['MSFT', 'NVDA'], ['V']]
+    assert snapshot.get('V') == 250.0
+    assert snapshot.version == 1
+
+
+def test_expired_and_unwatched_sessions_dropped():
+    """Test inactive sessions stop contributing tickers"""
+    clock = FakeClock()
+    scheduler = PriceScheduler(StaticPriceSource(), session_ttl=60, clock=clock)
+
+    scheduler.watch('a', ['AAPL'])
+    scheduler.watch('b', ['MSFT'])
+    scheduler.watch('c', ['TSLA'])
+    scheduler.unwatch('c')
+    clock.now += 30
+    scheduler.watch('b', ['MSFT'])
+    clock.now += 45
+
+    assert scheduler.watched() == ['MSFT']
+
+
+def test_failed_batch_keeps_stale_prices():
+    """Test a failing source leaves the previous prices in place"""
+    source = StaticPriceSource({'AAPL': 150.0})
+    scheduler = PriceScheduler(source)
+    scheduler.watch('a', ['AAPL'])
+    first = scheduler.refresh_now()
+
+    def fail(tickers):
+        raise ConnectionError('offline')
+
+    source.fetch = fail
+    second = scheduler.refresh_now()
+
+    assert second.get('AAPL') == 150.0
+    assert second.updated['AAPL'] == first.updated['AAPL']
+    assert second.version == 2
+
+
+def test_snapshot_is_immutable():
+    """Test published snapshots cannot be modified by readers"""
+    snapshot = PriceSnapshot({'AAPL': 150.0}, {'AAPL': 0.0}, 1, 0.0)
+
+    with pytest.raises(TypeError):
+        snapshot.prices['AAPL'] = 1.0
+    with pytest.raises(AttributeError):
+        snapshot.version = 2
+
+
+def test_jitter_bounds():
+    """Test refresh delays stay within the configured jitter"""
+    scheduler = PriceScheduler(StaticPriceSource(), interval=10, jitter=0.2, seed=1)
+    delays = [scheduler.next_delay() for _ in range(200)]
+
+    assert min(delays) >= 8 and max(delays) <= 12
+    assert len(set(delays)) > 1
+
+
+def test_background_thread_serves_new_watchers():
+    """Test a new watcher wakes the thread and receives prices"""
+    source = StaticPriceSource({'AAPL': 150.0, 'MSFT': 300.0})
+    scheduler = PriceScheduler(source, interval=60).start()
+    try:
+        scheduler.watch('a', ['AAPL', 'MSFT'])
+        snapshot = scheduler.wait_for(['AAPL', 'MSFT'], timeout=5)
+    finally:
+        scheduler.stop()
+
+    assert snapshot.get('MSFT') == 300.0
+
+
+def test_portfolio_value_from_snapshot():
+    """Test the simulator values holdings from supplied prices"""
+    sim = TradingSimulator(initial_capital=10000)
+    sim.buy('AAPL', 10, 100.0)
+    snapshot = PriceSnapshot({'AAPL': 120.0}, {}, 1, 0.0)
+
+    assert sim.get_portfolio_value(snapshot) == pytest.approx(10200.0)
+    assert sim.get_returns(snapshot)['percentage_return'] == pytest.approx(2.0)
+
+
+def test_wake_only_for_never_requested_tickers():
+    """Test unpriceable tickers do not wake the refresher on every rerun"""
+    scheduler = PriceScheduler(StaticPriceSource({'AAPL': 150.0}))
+    scheduler.watch('a', ['AAPL', 'DELISTED'])
+    assert scheduler._wake.is_set()
+
+    scheduler.refresh_now()
+    scheduler._wake.clear()
+    scheduler.watch('a', ['AAPL', 'DELISTED'])
+    assert 'DELISTED' not in scheduler.snapshot.prices
+    assert not scheduler._wake.is_set()
+
+    scheduler.watch('b', ['MSFT'])
+    assert scheduler._wake.is_set()
+
+
+def test_periodic_tasks_run_when_due():
+    """Test tasks run on the first wake-up and then once per period"""
+    clock = FakeClock()
+    scheduler = PriceScheduler(StaticPriceSource(), clock=clock)
+    runs = []
+    scheduler.every(3600, lambda: runs.append(clock.now))
+
+    assert scheduler._wake.is_set()
+    assert scheduler.run_due_tasks() == 1
+    clock.now += 1800
+    assert scheduler.run_due_tasks() == 0
+    clock.now += 1800
+    assert scheduler.run_due_tasks() == 1
+    assert runs == [1000.0, 4600.0]
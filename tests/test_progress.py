@@ -0,0 +1,77 @@
+"""Unit Tests for Quiz Grading and Learner Progress
+
+Tests cohort grading and incremental mastery statistics
+"""
+
+import numpy as np
+import pytest
+from education.catalog import ContentCatalog
+from education.progress import ProgressTracker, QuizGrader
+
+
+@pytest.fixture
+def grader(tmp_path):
+    """Grader built from the shipped beginner modules"""
+    return QuizGrader(ContentCatalog(cache_path=str(tmp_path / 'catalog.pkl')))
+
+
+def test_answer_key(grader):
+    """Test quiz answers compile into a compact integer key"""
+    assert grader.question_ids == ['intro_market:0', 'basic_portfolio:0']
+    assert grader.answer_key.tolist() == [0, 1]
+    assert grader.answer_key.dtype == np.int8
+
+
+def test_grade_cohort_vectorized(grader):
+    """Test a learners x questions matrix grades in one comparison"""
+    responses = np.array([[0, 1], [0, 2], [-1, 1]], dtype=np.int8)
+    assert grader.grade(responses).tolist() == [[True, True], [True, False], [False, True]]
+
+
+def test_incremental_statistics(grader):
+    """Test aggregates match a full recomputation as answers arrive"""
+    tracker = ProgressTracker(grader, capacity=2)
+    rng = np.random.default_rng(3)
+
+    for _ in range(200):
+        learner = f"learner_{rng.integers(10)}"
+        question = grader.question_ids[rng.integers(2)]
+        tracker.record(learner, question, int(rng.integers(4)))
+
+    responses = tracker.responses[:len(tracker.learner_index)]
+    graded = tracker.grade_cohort()
+    answered = responses != -1
+
+    assert np.array_equal(tracker.attempts, answered.sum(axis=0))
+    assert np.array_equal(tracker.correct, graded.sum(axis=0))
+    assert np.array_equal(tracker.module_correct[:len(tracker.learner_index)], graded.astype(int))
+
+
+def test_reanswer_replaces_previous(grader):
+    """Test answering again updates rather than double counts"""
+    tracker = ProgressTracker(grader)
+
+    assert tracker.record('alice', 'intro_market:0', 2) is False
+    assert tracker.record('alice', 'intro_market:0', 0) is True
+    assert tracker.item_difficulty()['intro_market:0'] == 1.0
+    assert tracker.attempts.tolist() == [1, 0]
+
+
+def test_batch_with_duplicates(grader):
+    """Test only the last duplicate answer in a batch counts"""
+    tracker = ProgressTracker(grader)
+    correct = tracker.record_batch(['a', 'a', 'b'], ['intro_market:0'] * 3, [0, 3, 0])
+
+    assert correct.tolist() == [True, False, True]
+    assert tracker.attempts[0] == 2
+    assert tracker.correct[0] == 1
+
+
+def test_dashboard_metrics(grader):
+    """Test completed modules drive the progress percentage"""
+    tracker = ProgressTracker(grader)
+    tracker.record('alice', 'intro_market:0', 0)
+
+    metrics = tracker.dashboard_metrics('alice')
+    assert metrics == {'modules_completed': 1, 'modules_total': 2, 'progress_pct': 50.0}
+    assert tracker.dashboard_metrics('nobody')['progress_pct'] == 0.0
@@ -0,0 +1,92 @@
+"""Unit Tests for AI Tutor Runtime
+
+Tests template compilation, routing, and response caching
+"""
+
+import pytest
+from ai.tutor import (
+    LocalStubBackend, PromptTemplate, ResponseCache, TutorRuntime, load_agents, normalize_prompt
+)
+
+
+class TestTutorRuntime:
+    """Test suite for the tutor agent runtime"""
+
+    def setup_method(self):
+        """Create a runtime with the local stub backend"""
+        self.backend = LocalStubBackend()
+        self.runtime = TutorRuntime(backend=self.backend)
+
+    def test_all_agents_compiled(self):
+        """Test the six agents load with precompiled templates"""
+        agents = load_agents()['agents']
+
+        assert len(agents) == 6
+        assert agents['market_analyst'].instruction_prompts[1].fields == ('ticker',)
+        assert 'Never guarantee future returns' in agents['market_analyst'].system_prompt
+
+    @pytest.mark.parametrize('question, agent', [
+        ('How do I calculate VaR on my portfolio?', 'risk_manager'),
+        ('Show me a moving average crossover strategy', 'trading_coach'),
+        ('Explain technical indicators for AAPL', 'market_analyst'),
+        ('Teach me DCF valuation', 'financial_modeling_tutor'),
+        ('How should I rebalance my asset allocation?', 'portfolio_advisor'),
+        ('What is a stock?', 'beginner_educator'),
+        ('Explain RSI and MACD for AAPL', 'market_analyst'),
+        ('How do I diversify with ETFs?', 'portfolio_advisor'),
+        ('Explain beta and hedging', 'risk_manager'),
+    ])
+    def test_routing(self, question, agent):
+        """Test questions reach the matching agent"""
+        assert self.runtime.router.route(question) == agent
+
+    def test_repeated_question_hits_cache(self):
+        """Test the backend is called once for equivalent questions"""
+        first = self.runtime.ask('What is a stock?')
+        second = self.runtime.ask('  what is a STOCK ')
+
+        assert first['cached'] is False
+        assert second['cached'] is True
+        assert second['response'] == first['response']
+        assert self.backend.calls == 1
+
+    def test_snapshot_changes_cache_key(self):
+        """Test answers are recomputed when the data snapshot changes"""
+        self.runtime.ask('Explain technical indicators for AAPL', snapshot_id='2024-01-02')
+        self.runtime.ask('Explain technical indicators for AAPL', snapshot_id='2024-01-03')
+
+        assert self.backend.calls == 2
+
+    def test_context_templates(self):
+        """Test context templates are rendered into the prompt"""
+        prompt = self.runtime.build_prompt('Help me', {'portfolio_holdings': {'holdings': 'AAPL x10'}})
+        assert prompt == 'Current Holdings: AAPL x10\nHelp me'
+
+
+def test_template_keeps_missing_fields():
+    """Test unfilled placeholders survive rendering"""
+    template = PromptTemplate('Run stress test for {scenario} on {ticker}')
+    assert template.render(ticker='SPY') == 'Run stress test for {scenario} on SPY'
+
+
+def test_cache_lru_and_ttl():
+    """Test least recently used and expired entries are evicted"""
+    now = [0.0]
+    cache = ResponseCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+
+    now[0] = 11
+    assert cache.get('a') is None
+    assert cache.get('c') is None
+
+
+def test_normalize_prompt():
+    """Test prompts differing in case and punctuation share a key"""
+    assert normalize_prompt('What is a Stock??') == normalize_prompt('what is a stock')
+    assert normalize_prompt('Yield of 2.5%') == 'yield of 2.5 %'